@@ -0,0 +1,219 @@
+"""
+Benchmark profile extraction against the local fixture corpus.
+
+Times every `Match._extract_*` method, `_extract_last_messages` and
+the full `Match.from_element` in headless Chrome and reports the
+number of WebDriver round trips and latency percentiles per operation.
+
+With --offline, only the local parser is timed on the saved snapshots
+(`Match.from_html`), which needs neither Chrome nor a server.
+
+Usage:
+    python -m benchmarks.bench_extraction --runs 20
+    python -m benchmarks.bench_extraction --offline --runs 1000
+    python -m benchmarks.bench_extraction --json results.json
+"""
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from tinder_ai.services.match import Match
+from tinder_ai.testing import FixtureCorpus, FixtureServer
+from lxml import html
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+import argparse
+import json
+import statistics
+import time
+
+
+PROFILE_XPATH = "//div[contains(@class, 'profileContent')]"
+CHAT_XPATH = "//div[contains(@aria-label, 'Conversation history')]"
+
+FIELD_EXTRACTORS = [
+    '_extract_basic_info',
+    '_extract_bio',
+    '_extract_looking_for',
+    '_extract_location_and_distance',
+    '_extract_essentials',
+    '_extract_interests',
+    '_extract_lifestyle',
+]
+
+
+class RoundTripCounter:
+    """Counts WebDriver commands sent through a browser's executor."""
+
+    def __init__(self, browser) -> None:
+        self.count = 0
+        executor = browser.command_executor
+        original = executor.execute
+
+        def execute(command, params):
+            self.count += 1
+            return original(command, params)
+
+        executor.execute = execute
+
+    @contextmanager
+    def measure(self):
+        start = self.count
+        result = {}
+        yield result
+        result['round_trips'] = self.count - start
+
+
+@dataclass
+class Stats:
+    name: str
+    latencies: List[float] = field(default_factory=list)
+    round_trips: List[int] = field(default_factory=list)
+
+    def percentile(self, q: int) -> float:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[q - 1]
+
+    def as_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'runs': len(self.latencies),
+            'round_trips': statistics.mean(self.round_trips),
+            'p50_ms': self.percentile(50),
+            'p90_ms': self.percentile(90),
+            'p99_ms': self.percentile(99),
+        }
+
+
+def create_browser(headless: bool = True):
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--window-size=1250,750")
+    return webdriver.Chrome(options=options)
+
+
+def timed(stats: Stats, counter: RoundTripCounter, func: Callable) -> None:
+    with counter.measure() as result:
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+    stats.latencies.append(elapsed)
+    stats.round_trips.append(result['round_trips'])
+
+
+def run(runs: int, headless: bool) -> List[Stats]:
+    results: Dict[str, Stats] = {}
+
+    def stats_for(name: str) -> Stats:
+        return results.setdefault(name, Stats(name))
+
+    with FixtureServer() as server:
+        browser = create_browser(headless)
+        counter = RoundTripCounter(browser)
+        corpus = server.corpus
+        try:
+            for _ in range(runs):
+                for match_id in corpus.match_ids + corpus.message_ids:
+                    browser.get(server.url(f"/app/messages/{match_id}"))
+                    profile = browser.find_element(By.XPATH, PROFILE_XPATH)
+                    chat = browser.find_element(By.XPATH, CHAT_XPATH)
+
+                    for name in FIELD_EXTRACTORS:
+                        extractor = getattr(Match, name)
+                        timed(
+                            stats_for(f"Match.{name}"), counter,
+                            lambda: extractor(profile)
+                        )
+                    timed(
+                        stats_for("Match._extract_last_messages"), counter,
+                        lambda: Match._extract_last_messages(chat)
+                    )
+
+                    for extraction in ('webdriver', 'script', 'local'):
+                        for messages in (False, True):
+                            browser.get(server.url("/app/matches"))
+                            element = browser.find_element(
+                                By.CSS_SELECTOR, f"a[href*='{match_id}']"
+                            )
+                            timed(
+                                stats_for(
+                                    f"Match.from_element[{extraction}"
+                                    f"{', messages' if messages else ''}]"
+                                ),
+                                counter,
+                                lambda: Match.from_element(
+                                    element, browser,
+                                    messages=messages,
+                                    extraction=extraction
+                                )
+                            )
+        finally:
+            browser.quit()
+
+    return list(results.values())
+
+
+def run_offline(runs: int) -> List[Stats]:
+    corpus = FixtureCorpus()
+    snapshots = []
+    for match_id in corpus.match_ids + corpus.message_ids:
+        page = html.fromstring(corpus.render_chat(match_id))
+        snapshots.append((
+            match_id,
+            html.tostring(page.xpath(PROFILE_XPATH)[0], encoding='unicode'),
+            html.tostring(page.xpath(CHAT_XPATH)[0], encoding='unicode'),
+        ))
+
+    stats = Stats("Match.from_html[local, messages]")
+    for _ in range(runs):
+        for match_id, profile_html, chat_html in snapshots:
+            start = time.perf_counter()
+            Match.from_html(profile_html, chat_html, match_id=match_id)
+            stats.latencies.append((time.perf_counter() - start) * 1000)
+            stats.round_trips.append(0)
+    return [stats]
+
+
+def report(results: List[Stats]) -> None:
+    header = (
+        f"{'operation':<46} {'runs':>5} {'trips':>7} "
+        f"{'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for stats in results:
+        row = stats.as_dict()
+        print(
+            f"{row['name']:<46} {row['runs']:>5} {row['round_trips']:>7.1f} "
+            f"{row['p50_ms']:>9.2f} {row['p90_ms']:>9.2f} "
+            f"{row['p99_ms']:>9.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--headed', action='store_true')
+    parser.add_argument(
+        '--offline', action='store_true',
+        help='Only time the local parser on saved snapshots'
+    )
+    parser.add_argument('--json', help='Write raw results to this file')
+    args = parser.parse_args()
+
+    if args.offline:
+        results = run_offline(args.runs)
+    else:
+        results = run(args.runs, headless=not args.headed)
+    report(results)
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump([stats.as_dict() for stats in results], file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
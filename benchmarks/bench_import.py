@@ -0,0 +1,175 @@
+"""
+Benchmark the import and CLI startup time of tinder_ai.
+
+Runs every target in a fresh interpreter with `-X importtime`, reports
+the median wall time and the slowest modules, and checks that the
+heavy dependencies stay unloaded where they are not needed.
+Exits with status 1 if a check fails or a target exceeds its budget,
+so it can guard against startup regressions in CI.
+
+Usage:
+    python -m benchmarks.bench_import --runs 10
+    python -m benchmarks.bench_import --budget-ms 150
+    python -m benchmarks.bench_import --json results.json
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+
+# Modules that must not be loaded by `import tinder_ai`
+# or by `python -m tinder_ai --help`.
+HEAVY_MODULES = [
+    'selenium',
+    'undetected_chromedriver',
+    'pydantic_settings',
+    'requests',
+]
+
+CHECK_SCRIPT = (
+    "import sys, tinder_ai; "
+    f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+)
+
+TARGETS = {
+    'import': ['-c', 'import tinder_ai'],
+    'cli_help': ['-m', 'tinder_ai', '--help'],
+    'import_session': ['-c', 'from tinder_ai import Session'],
+}
+
+# Only these targets are held to --budget-ms.
+BUDGETED = ('import', 'cli_help')
+
+
+@dataclass
+class Stats:
+    name: str
+    seconds: List[float] = field(default_factory=list)
+    # module -> cumulative import time in microseconds, of the last run
+    modules: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.seconds) * 1000
+
+    def slowest(self, n: int) -> List[Tuple[str, int]]:
+        return sorted(
+            self.modules.items(), key=lambda item: item[1], reverse=True
+        )[:n]
+
+    def as_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'runs': len(self.seconds),
+            'median_ms': self.median_ms,
+            'min_ms': min(self.seconds) * 1000,
+            'slowest_modules_us': dict(self.slowest(10)),
+        }
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Cumulative microseconds per module from `-X importtime` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        try:
+            modules[name.strip()] = int(cumulative)
+        except ValueError:
+            # the header line
+            continue
+    return modules
+
+
+def run_target(name: str, args: List[str], runs: int) -> Stats:
+    stats = Stats(name)
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', *args],
+            capture_output=True,
+            text=True
+        )
+        stats.seconds.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"{name} failed ({result.returncode}): {result.stderr}"
+            )
+        stats.modules = parse_importtime(result.stderr)
+    return stats
+
+
+def loaded_heavy_modules() -> List[str]:
+    output = subprocess.run(
+        [sys.executable, '-c', CHECK_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout.strip()
+    return output.split(',') if output else []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument(
+        '--budget-ms',
+        type=float,
+        help='Fail if the median import or --help time exceeds this'
+    )
+    parser.add_argument('--json', help='Write the results to this file')
+    args = parser.parse_args()
+
+    results = [
+        run_target(name, target, args.runs)
+        for name, target in TARGETS.items()
+    ]
+    failures = []
+
+    for stats in results:
+        print(f"{stats.name:<16} median {stats.median_ms:8.1f} ms")
+        for module, micros in stats.slowest(5):
+            print(f"    {module:<40} {micros / 1000:8.1f} ms")
+        if (
+            args.budget_ms is not None
+            and stats.name in BUDGETED
+            and stats.median_ms > args.budget_ms
+        ):
+            failures.append(
+                f"{stats.name} took {stats.median_ms:.1f} ms, "
+                f"budget is {args.budget_ms:.1f} ms"
+            )
+
+    heavy = loaded_heavy_modules()
+    if heavy:
+        failures.append(f"'import tinder_ai' loaded {', '.join(heavy)}")
+    for name in ('import', 'cli_help'):
+        stats = next(s for s in results if s.name == name)
+        eager = [m for m in HEAVY_MODULES if m in stats.modules]
+        if eager:
+            failures.append(f"{name} imported {', '.join(eager)}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(
+                {
+                    'results': [stats.as_dict() for stats in results],
+                    'failures': failures,
+                },
+                f,
+                indent=2
+            )
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
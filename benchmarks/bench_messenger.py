@@ -0,0 +1,117 @@
+"""
+Compare the payload of v1 and v2 (delta) reply requests.
+
+Plays conversations that grow by one message per reply request against
+the local `testing.MessengerServer` in both request formats, and reports
+the request bodies sent and the latency per request. With --evict-every,
+the server forgets its state periodically, so v2 falls back to full
+requests after a cache miss.
+
+Usage:
+    python -m benchmarks.bench_messenger --turns 40
+    python -m benchmarks.bench_messenger --evict-every 10 --json out.json
+"""
+from benchmarks.bench_extraction import Stats
+from tinder_ai.services.messenger_api import MessengerService
+from tinder_ai.shared import MatchProfile, Message
+from tinder_ai.testing import MessengerServer
+
+from dataclasses import dataclass, field
+from typing import List
+import argparse
+import json
+import time
+
+
+@dataclass
+class PayloadStats(Stats):
+    bytes: List[int] = field(default_factory=list)
+
+
+def synthetic_profile(index: int) -> MatchProfile:
+    return MatchProfile(
+        match_id=f"bench{index:04d}",
+        name=f"Match {index}",
+        age=27,
+        bio="Coffee, climbing and long walks. " * 12,
+        interests=["Climbing", "Coffee", "Travel", "Photography", "Yoga"],
+        looking_for="Long-term partner",
+        location="Amsterdam",
+        distance="3 kilometers away",
+        essentials=["170 cm", "Non-smoker", "Dog lover"],
+        lifestyle={"Pets": "Dog", "Drinking": "Socially", "Workout": "Often"},
+    )
+
+
+def run(matches: int, turns: int, evict_every: int) -> List[PayloadStats]:
+    results = []
+    for delta in (False, True):
+        stats = PayloadStats("v2 delta" if delta else "v1 full")
+        with MessengerServer() as server:
+            service = MessengerService(server.base_url, delta_replies=delta)
+            for index in range(matches):
+                profile = synthetic_profile(index)
+                messages: List[Message] = []
+                for turn in range(turns):
+                    if evict_every and turn and turn % evict_every == 0:
+                        server.forget(profile.match_id)
+                    messages.append(Message(
+                        message=f"Message {turn}, about the weekend plans.",
+                        is_received=turn % 2 == 0
+                    ))
+                    state = profile.model_copy(
+                        update={'last_messages': list(messages)}
+                    )
+                    sent = len(server.requests)
+                    start = time.perf_counter()
+                    service.generate_reply(state, state.last_messages)
+                    stats.latencies.append(
+                        (time.perf_counter() - start) * 1000
+                    )
+                    requests = server.requests[sent:]
+                    stats.round_trips.append(len(requests))
+                    stats.bytes.append(sum(size for _, size in requests))
+            service.close()
+        results.append(stats)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--matches', type=int, default=5)
+    parser.add_argument('--turns', type=int, default=30)
+    parser.add_argument(
+        '--evict-every', type=int, default=0,
+        help='Drop the server state of a match every N turns'
+    )
+    parser.add_argument('--json', help='Write the results to this file')
+    args = parser.parse_args()
+
+    results = run(args.matches, args.turns, args.evict_every)
+    print(
+        f"{'format':<12} {'requests':>9} {'total KB':>9} "
+        f"{'B/reply':>8} {'p50 ms':>8} {'p99 ms':>8}"
+    )
+    rows = []
+    for stats in results:
+        row = {
+            **stats.as_dict(),
+            'requests': sum(stats.round_trips),
+            'total_bytes': sum(stats.bytes),
+            'bytes_per_reply': sum(stats.bytes) / len(stats.bytes),
+        }
+        rows.append(row)
+        print(
+            f"{stats.name:<12} {row['requests']:>9} "
+            f"{row['total_bytes'] / 1024:>9.1f} "
+            f"{row['bytes_per_reply']:>8.0f} "
+            f"{row['p50_ms']:>8.2f} {row['p99_ms']:>8.2f}"
+        )
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
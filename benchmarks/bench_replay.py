@@ -0,0 +1,95 @@
+"""
+Profile the Python side of core operations on a recorded session.
+
+With --record, runs every operation of `check_budgets` once against the
+local fixture server in headless Chrome and records all WebDriver
+commands and responses. Without it, replays that recording through a
+`ReplayDriver` and times the operations with no browser at all, so
+changes to extraction, `_handle_items` or preferences can be compared
+on identical inputs, e.g. on a CI box. Pauses run on a virtual clock
+and are excluded from the timings.
+
+Usage:
+    python -m benchmarks.bench_replay --record replay.jsonl.gz
+    python -m benchmarks.bench_replay replay.jsonl.gz --runs 50
+    python -m benchmarks.bench_replay replay.jsonl.gz --json after.json
+"""
+from benchmarks.bench_extraction import Stats, create_browser
+from benchmarks.check_budgets import operations
+from tinder_ai.testing import FixtureServer, ReplayDriver
+from tinder_ai.utils.clock import VirtualClock, use_clock
+from tinder_ai.utils.recording import Recorder
+
+from typing import Dict, List
+import argparse
+import json
+import time
+
+
+def record(path: str, headless: bool) -> None:
+    with FixtureServer() as server:
+        browser = create_browser(headless)
+        try:
+            with Recorder(browser) as recorder:
+                for setup in operations(browser, server).values():
+                    setup()()
+            recorder.save(path)
+        finally:
+            browser.quit()
+
+
+def replay(path: str, runs: int) -> List[Stats]:
+    results: Dict[str, Stats] = {}
+    # Only serves the corpus and URLs, pages come from the recording.
+    with FixtureServer() as server, use_clock(VirtualClock()):
+        for _ in range(runs):
+            browser = ReplayDriver(path)
+            for name, setup in operations(browser, server).items():
+                stats = results.setdefault(name, Stats(name))
+                call = setup()
+                served = browser.command_executor.served
+                start = time.perf_counter()
+                call()
+                stats.latencies.append((time.perf_counter() - start) * 1000)
+                stats.round_trips.append(
+                    browser.command_executor.served - served
+                )
+    return list(results.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('recording', help='Recording to write or replay')
+    parser.add_argument(
+        '--record', action='store_true',
+        help='Record the operations in Chrome instead of replaying'
+    )
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--headed', action='store_true')
+    parser.add_argument('--json', help='Write the results to this file')
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.recording, not args.headed)
+        return
+
+    results = replay(args.recording, args.runs)
+    print(
+        f"{'operation':<48} {'trips':>6} {'p50 ms':>8} "
+        f"{'p90 ms':>8} {'p99 ms':>8}"
+    )
+    for stats in results:
+        row = stats.as_dict()
+        print(
+            f"{stats.name:<48} {row['round_trips']:>6.0f} "
+            f"{row['p50_ms']:>8.2f} {row['p90_ms']:>8.2f} "
+            f"{row['p99_ms']:>8.2f}"
+        )
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump([stats.as_dict() for stats in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
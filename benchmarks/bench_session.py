@@ -0,0 +1,122 @@
+"""
+Micro-benchmark session logic on the in-memory fake driver.
+
+Runs core operations against `FakeWebDriver`, which serves the fixture
+corpus from an lxml tree without a browser, with all pauses on a virtual
+clock. The timings are the Python side only (locators, extraction,
+bookkeeping), the round trips are the WebDriver calls the operation
+would have sent to Chrome.
+
+Usage:
+    python -m benchmarks.bench_session --runs 1000
+    python -m benchmarks.bench_session --json results.json
+"""
+from benchmarks.bench_extraction import Stats
+from tinder_ai.constants.selectors import SELECTORS
+from tinder_ai.services.match import Match
+from tinder_ai.services.messenger_api import MockMessengerService
+from tinder_ai.session import Session
+from tinder_ai.settings import Settings
+from tinder_ai.testing import FakeWebDriver
+from tinder_ai.utils.clock import VirtualClock, use_clock
+
+from typing import Callable, Dict, List
+import argparse
+import json
+import logging
+import time
+
+
+def fake_session(browser: FakeWebDriver) -> Session:
+    settings = Settings(
+        _env_file=None, location_lat=52.37, location_lon=4.9, swipe_limit=10
+    )
+    return Session(settings, MockMessengerService(), browser=browser)
+
+
+def operations(
+    browser: FakeWebDriver, session: Session
+) -> Dict[str, Callable[[], Callable]]:
+    """Operation name -> setup returning the call to measure."""
+    corpus = browser.corpus
+
+    def from_element(item_id, messages):
+        def setup():
+            browser.get(browser.base_url + "/app/matches")
+            element = SELECTORS.find(
+                browser, 'session.item_link', item_id=item_id
+            )
+            return lambda: Match.from_element(
+                element, browser, messages=messages
+            )
+        return setup
+
+    def on(path, call):
+        def setup():
+            browser.get(browser.base_url + path)
+            return call
+        return setup
+
+    return {
+        'Match.from_element': from_element(corpus.match_ids[0], False),
+        'Match.from_element[messages]': from_element(
+            corpus.unread_message_ids[0], True
+        ),
+        'Session._get_matches_data': on(
+            "/app/matches", session._get_matches_data
+        ),
+        'Session._handle_potential_popups[maybe_later]': on(
+            "/app/recs?popup=maybe_later", session._handle_potential_popups
+        ),
+        'Session.handle_matches': on("/app/recs", session.handle_matches),
+        'Session.start_swiping': on("/app/recs", session.start_swiping),
+    }
+
+
+def run(runs: int) -> List[Stats]:
+    results: Dict[str, Stats] = {}
+    browser = FakeWebDriver()
+    with use_clock(VirtualClock()):
+        session = fake_session(browser)
+        for name, setup in operations(browser, session).items():
+            stats = results.setdefault(name, Stats(name))
+            for _ in range(runs):
+                session.session_data.likes = 0
+                call = setup()
+                trips = browser.round_trips
+                start = time.perf_counter()
+                call()
+                stats.latencies.append((time.perf_counter() - start) * 1000)
+                stats.round_trips.append(browser.round_trips - trips)
+    return list(results.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=200)
+    parser.add_argument('--json', help='Write the results to this file')
+    args = parser.parse_args()
+
+    # Operations log every item, which would dominate the timings.
+    logging.disable(logging.CRITICAL)
+    results = run(args.runs)
+
+    print(
+        f"{'operation':<48} {'trips':>6} {'p50 ms':>8} "
+        f"{'p99 ms':>8} {'ops/s':>8}"
+    )
+    for stats in results:
+        row = stats.as_dict()
+        print(
+            f"{stats.name:<48} {row['round_trips']:>6.0f} "
+            f"{row['p50_ms']:>8.3f} {row['p99_ms']:>8.3f} "
+            f"{1000 / row['p50_ms'] if row['p50_ms'] else 0:>8.0f}"
+        )
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump([stats.as_dict() for stats in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark browser startup: cold, cached driver and warm attach.
+
+cold     - a new `uc.Chrome`, downloading and patching chromedriver
+cached   - a new `uc.Chrome` using the cached patched chromedriver
+warm     - attaching to a Chrome already listening on --debugger-address
+
+Each run measures the time until the browser has loaded a blank page,
+which is what `Session.__init__` waits for before doing any work.
+The warm Chrome is started once up front and stopped afterwards.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 5
+    python -m benchmarks.bench_startup --modes cached warm --headed
+    python -m benchmarks.bench_startup --json results.json
+"""
+from tinder_ai.utils.browser import (
+    build_chrome_options,
+    debugger_available,
+    launch_browser
+)
+
+from typing import Dict, List
+import argparse
+import json
+import statistics
+import tempfile
+import time
+
+
+MODES = ['cold', 'cached', 'warm']
+
+
+def start(mode: str, headless: bool, debugger_address: str, data_dir: str):
+    options = build_chrome_options(headless=headless)
+    if mode == 'cold':
+        return launch_browser(options)
+    if mode == 'cached':
+        return launch_browser(options, cache_driver=True)
+    return launch_browser(
+        options,
+        debugger_address=debugger_address,
+        user_data_dir=data_dir
+    )
+
+
+def run(
+    modes: List[str], runs: int, headless: bool, debugger_address: str
+) -> Dict[str, List[float]]:
+    results = {mode: [] for mode in modes}
+    with tempfile.TemporaryDirectory() as data_dir:
+        warm = None
+        if 'warm' in modes:
+            if debugger_available(debugger_address):
+                raise RuntimeError(
+                    f"{debugger_address} is already in use, "
+                    "pick a free --debugger-address"
+                )
+            # Not timed, this is the one-off cost the warm mode amortizes.
+            warm = start('warm', headless, debugger_address, data_dir)
+
+        try:
+            for mode in modes:
+                for _ in range(runs):
+                    begin = time.perf_counter()
+                    browser = start(
+                        mode, headless, debugger_address, data_dir
+                    )
+                    browser.get("about:blank")
+                    results[mode].append(time.perf_counter() - begin)
+                    if mode == 'warm':
+                        browser.service.stop()
+                    else:
+                        browser.quit()
+        finally:
+            if warm is not None:
+                warm.execute_cdp_cmd("Browser.close", {})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=MODES)
+    parser.add_argument('--headed', action='store_true')
+    parser.add_argument('--debugger-address', default='127.0.0.1:9333')
+    parser.add_argument('--json', help='Write the results to this file')
+    args = parser.parse_args()
+
+    results = run(
+        args.modes, args.runs, not args.headed, args.debugger_address
+    )
+
+    for mode, seconds in results.items():
+        print(
+            f"{mode:<8} median {statistics.median(seconds):6.2f}s  "
+            f"min {min(seconds):6.2f}s  max {max(seconds):6.2f}s"
+        )
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
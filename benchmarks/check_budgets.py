@@ -0,0 +1,245 @@
+"""
+Check WebDriver round-trip and wall time budgets of core operations.
+
+Runs each operation against the local fixture server in headless Chrome
+with a `Tracer` installed and fails (exit status 1) if an operation
+sends more WebDriver commands or takes longer than its budget. A
+refactor that adds a round trip per element shows up here as a failed
+budget instead of as a slowdown against the live site.
+
+Round-trip budgets are exact counts plus a little headroom; wall time
+budgets are loose and only catch pathological waits. After an
+intentional change, run with --report and update BUDGETS. The test
+suite checks the same round-trip budgets on `testing.FakeWebDriver`
+(tests/test_budgets.py), so they are enforced without Chrome too.
+
+Usage:
+    python -m benchmarks.check_budgets
+    python -m benchmarks.check_budgets --runs 5 --report
+    python -m benchmarks.check_budgets --only Match.from_element
+"""
+from benchmarks.bench_extraction import create_browser
+from tinder_ai.constants.models import Sexuality
+from tinder_ai.constants.selectors import SELECTORS
+from tinder_ai.services.match import Match
+from tinder_ai.services.messenger_api import MockMessengerService
+from tinder_ai.services.preferences import PreferencesService
+from tinder_ai.session import Session
+from tinder_ai.settings import Settings
+from tinder_ai.testing import FixtureServer
+from tinder_ai.utils.tracing import Tracer, operation
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, NamedTuple, Optional
+import argparse
+import json
+import sys
+
+
+class Budget(NamedTuple):
+    round_trips: int
+    seconds: float
+
+
+BUDGETS: Dict[str, Budget] = {
+    # href, click, wait, current_url, extraction script (the first
+    # wait on a browser also reads its script timeout)
+    'Match.from_element': Budget(6, 2.0),
+    # + wait for the conversation
+    'Match.from_element[messages]': Budget(7, 2.0),
+    # list lookup + one href per match (3 in the corpus)
+    'Session._get_matches_data': Budget(5, 1.0),
+    # list lookup + preview and icon per chat + href per unread chat
+    'Session._get_unread_messages_data': Budget(10, 1.0),
+    # a single probe
+    'Session._handle_potential_popups': Budget(1, 1.0),
+    # probe + dismiss click + probe confirming it is gone
+    'Session._handle_potential_popups[maybe_later]': Budget(4, 1.0),
+    # one state read, drag and check per slider, plus the
+    # service's own randomized pauses
+    'PreferencesService.set_preferences': Budget(55, 15.0),
+}
+
+
+@dataclass
+class Result:
+    name: str
+    round_trips: List[int]
+    seconds: List[float]
+
+    @property
+    def budget(self) -> Budget:
+        return BUDGETS[self.name]
+
+    def violations(self) -> List[str]:
+        found = []
+        if max(self.round_trips) > self.budget.round_trips:
+            found.append(
+                f"{self.name}: {max(self.round_trips)} round trips, "
+                f"budget is {self.budget.round_trips}"
+            )
+        if max(self.seconds) > self.budget.seconds:
+            found.append(
+                f"{self.name}: {max(self.seconds):.2f}s, "
+                f"budget is {self.budget.seconds:.2f}s"
+            )
+        return found
+
+
+def budget_session(browser) -> Session:
+    """A Session around an existing browser, with a fixed location."""
+    settings = Settings(_env_file=None, location_lat=52.37, location_lon=4.9)
+    return Session(settings, MockMessengerService(), browser=browser)
+
+
+def operations(
+    browser, server: Optional[FixtureServer] = None
+) -> Dict[str, Callable[[], Callable]]:
+    """
+    Operation name -> setup, which prepares the page and returns
+    the call to measure.
+
+    :param server: The server the browser loads the corpus from,
+        None for a `FakeWebDriver`, which serves the corpus itself.
+    """
+    if server is None:
+        corpus = browser.corpus
+
+        def url(path: str) -> str:
+            return browser.base_url + path
+    else:
+        corpus, url = server.corpus, server.url
+    session = budget_session(browser)
+
+    def item_link(item_id):
+        return SELECTORS.find(
+            browser, 'session.item_link',
+            timeout=10, condition='clickable', item_id=item_id
+        )
+
+    def from_element():
+        browser.get(url("/app/matches"))
+        element = item_link(corpus.match_ids[0])
+        return lambda: Match.from_element(element, browser)
+
+    def from_element_messages():
+        browser.get(url("/app/messages"))
+        element = item_link(corpus.unread_message_ids[0])
+        return lambda: Match.from_element(element, browser, messages=True)
+
+    def matches_data():
+        browser.get(url("/app/matches"))
+        return session._get_matches_data
+
+    def unread_messages_data():
+        browser.get(url("/app/messages"))
+        return session._get_unread_messages_data
+
+    def popups():
+        browser.get(url("/app/recs"))
+        return session._handle_potential_popups
+
+    def popups_maybe_later():
+        browser.get(url("/app/recs?popup=maybe_later"))
+        return session._handle_potential_popups
+
+    def set_preferences():
+        browser.get(url("/app/recs"))
+        service = PreferencesService(browser)
+        settings = Settings(
+            _env_file=None,
+            distance_range=40,
+            age_range_min=21,
+            age_range_max=35,
+            gender_preference=Sexuality.WOMEN,
+            set_global=False
+        )
+        return lambda: service.set_preferences(settings)
+
+    return {
+        'Match.from_element': from_element,
+        'Match.from_element[messages]': from_element_messages,
+        'Session._get_matches_data': matches_data,
+        'Session._get_unread_messages_data': unread_messages_data,
+        'Session._handle_potential_popups': popups,
+        'Session._handle_potential_popups[maybe_later]': popups_maybe_later,
+        'PreferencesService.set_preferences': set_preferences,
+    }
+
+
+def run(runs: int, headless: bool, only: List[str]) -> List[Result]:
+    results = []
+    with FixtureServer() as server:
+        browser = create_browser(headless)
+        try:
+            with Tracer(browser):
+                for name, setup in operations(browser, server).items():
+                    if only and name not in only:
+                        continue
+                    result = Result(name, [], [])
+                    for _ in range(runs):
+                        call = setup()
+                        with operation(name) as span:
+                            call()
+                        result.round_trips.append(span.round_trips)
+                        result.seconds.append(span.duration)
+                    results.append(result)
+        finally:
+            browser.quit()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--headed', action='store_true')
+    parser.add_argument(
+        '--only', nargs='+', default=[], choices=list(BUDGETS),
+        metavar='NAME',
+        help='Only check these operations'
+    )
+    parser.add_argument(
+        '--report', action='store_true',
+        help='Print the measurements without failing'
+    )
+    parser.add_argument('--json', help='Write the results to this file')
+    args = parser.parse_args()
+
+    results = run(args.runs, not args.headed, args.only)
+
+    print(
+        f"{'operation':<48} {'trips':>6} {'budget':>6} "
+        f"{'max s':>7} {'budget':>7}"
+    )
+    failures = []
+    for result in results:
+        print(
+            f"{result.name:<48} {max(result.round_trips):>6} "
+            f"{result.budget.round_trips:>6} "
+            f"{max(result.seconds):>7.2f} {result.budget.seconds:>7.2f}"
+        )
+        failures += result.violations()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(
+                {
+                    result.name: {
+                        'round_trips': result.round_trips,
+                        'seconds': result.seconds,
+                        'budget': result.budget._asdict(),
+                    }
+                    for result in results
+                },
+                f,
+                indent=2
+            )
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures and not args.report:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
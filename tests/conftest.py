@@ -0,0 +1,51 @@
+from tinder_ai.services.messenger_api import MockMessengerService
+from tinder_ai.session import Session
+from tinder_ai.settings import Settings
+from tinder_ai.testing import FakeWebDriver, MessengerServer
+from tinder_ai.utils.clock import VirtualClock, use_clock
+
+import pytest
+
+
+@pytest.fixture
+def clock():
+    with use_clock(VirtualClock()) as clock:
+        yield clock
+
+
+@pytest.fixture
+def browser(clock):
+    browser = FakeWebDriver()
+    browser.get(browser.base_url + "/app/recs")
+    return browser
+
+
+@pytest.fixture
+def settings():
+    return Settings(
+        _env_file=None, location_lat=52.37, location_lon=4.9, swipe_limit=10
+    )
+
+
+@pytest.fixture
+def make_session(browser, settings, tmp_path, monkeypatch):
+    """A factory of sessions on the fake driver, see `Session`."""
+    monkeypatch.setattr(Session, 'USER_DATA_DIR', tmp_path)
+
+    def make(
+        messenger_service=None, profile_store=None, **overrides
+    ) -> Session:
+        """`overrides` replace fields of the settings."""
+        return Session(
+            settings.with_overrides(**overrides),
+            messenger_service or MockMessengerService(),
+            profile_store=profile_store,
+            browser=browser
+        )
+    return make
+
+
+@pytest.fixture
+def messenger():
+    with MessengerServer() as server:
+        yield server
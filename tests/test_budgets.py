@@ -0,0 +1,14 @@
+from benchmarks.check_budgets import BUDGETS, operations
+
+import pytest
+
+
+@pytest.mark.parametrize('name', list(BUDGETS))
+def test_round_trips_within_budget(browser, name):
+    # Wall time is not checked, the fake runs on a virtual clock.
+    call = operations(browser)[name]()
+    before = browser.round_trips
+
+    call()
+
+    assert browser.round_trips - before <= BUDGETS[name].round_trips
@@ -0,0 +1,125 @@
+from tinder_ai.constants.selectors import SELECTORS
+from tinder_ai.services.extraction import capture_snapshot
+from tinder_ai.services.match import Match
+from tinder_ai.shared import MatchProfile
+from tinder_ai.testing.server import FixtureCorpus
+from tinder_ai.utils.dom import parse_html
+
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    NoSuchElementException
+)
+from selenium.webdriver.common.by import By
+
+import pytest
+
+CORPUS = FixtureCorpus()
+
+SNIPPET = """
+<div id="root" class="card  Bgc(x)">
+  <h1 class="title">Alex <span>27</span></h1>
+  <script>ignored()</script>
+  <p name="bio">Line one<br>line   two</p>
+  <ul><li class="tag first">Hiking</li><li class="tag">Board
+      games</li></ul>
+</div>
+"""
+
+
+def open_profile(browser, match_id):
+    browser.get(f"{browser.base_url}/app/messages/{match_id}")
+    profile_content = browser.find_element(
+        By.XPATH, SELECTORS.xpath('match.profile_content')
+    )
+    chat_content = None
+    if match_id in CORPUS.message_ids:
+        chat_content = browser.find_element(
+            By.XPATH, SELECTORS.xpath('match.conversation')
+        )
+    return profile_content, chat_content
+
+
+@pytest.mark.parametrize(
+    'match_id', CORPUS.match_ids + CORPUS.message_ids
+)
+def test_snapshot_extraction_matches_live_extraction(browser, match_id):
+    profile_content, chat_content = open_profile(browser, match_id)
+    live = Match._extract_all(profile_content, chat_content)
+
+    local_profile, local_chat = capture_snapshot(
+        browser, profile_content, chat_content
+    )
+    snapshot = Match.from_html(
+        local_profile.get_attribute('outerHTML'),
+        local_chat.get_attribute('outerHTML') if local_chat else None,
+        match_id=match_id
+    ).profile
+
+    assert snapshot == MatchProfile(match_id=match_id, **live)
+    assert local_profile.text == profile_content.text
+
+
+@pytest.mark.parametrize('match_id', CORPUS.message_ids)
+def test_local_extraction_matches_webdriver_extraction(browser, match_id):
+    def extract(extraction: str):
+        browser.get(browser.base_url + "/app/messages")
+        element = SELECTORS.find(
+            browser, 'session.item_link', item_id=match_id
+        )
+        return Match.from_element(
+            element, browser, messages=True, extraction=extraction
+        ).profile
+
+    assert extract('local') == extract('webdriver')
+
+
+def test_text_approximates_inner_text():
+    root = parse_html(SNIPPET)
+
+    assert root.text == (
+        "Alex 27\n"
+        "Line one\n"
+        "line two\n"
+        "Hiking\n"
+        "Board games"
+    )
+    assert root.find_element(By.TAG_NAME, 'h1').text == "Alex 27"
+
+
+@pytest.mark.parametrize('by, value, texts', [
+    (By.CSS_SELECTOR, "li.tag", ["Hiking", "Board games"]),
+    (By.CSS_SELECTOR, "ul > .first", ["Hiking"]),
+    (By.CLASS_NAME, "tag", ["Hiking", "Board games"]),
+    (By.CLASS_NAME, "Bgc(x)", []),
+    (By.ID, "root", []),
+    (By.NAME, "bio", ["Line one\nline two"]),
+    (By.TAG_NAME, "span", ["27"]),
+    (By.XPATH, ".//li[2]", ["Board games"]),
+])
+def test_find_elements(by, value, texts):
+    wrapper = parse_html(f"<section>{SNIPPET}</section>")
+
+    assert [
+        element.text for element in wrapper.find_elements(by, value)
+        if element.tag_name != 'div'
+    ] == texts
+
+
+def test_find_element_by_id_and_class_on_the_container():
+    wrapper = parse_html(f"<section>{SNIPPET}</section>")
+
+    assert wrapper.find_element(By.ID, "root").get_attribute('id') == "root"
+    assert wrapper.find_element(By.CLASS_NAME, "Bgc(x)") == (
+        wrapper.find_element(By.ID, "root")
+    )
+
+
+def test_missing_and_invalid_selectors_raise_like_webdriver():
+    root = parse_html(SNIPPET)
+
+    with pytest.raises(NoSuchElementException):
+        root.find_element(By.CSS_SELECTOR, ".missing")
+    with pytest.raises(InvalidSelectorException):
+        root.find_elements(By.CSS_SELECTOR, "li[")
+    with pytest.raises(InvalidSelectorException):
+        root.find_elements(By.XPATH, "//li[")
@@ -0,0 +1,99 @@
+from tinder_ai.constants.selectors import SELECTORS
+from tinder_ai.services.extraction import ScriptExtractor
+from tinder_ai.services.match import Match
+from tinder_ai.testing import FakeWebDriver
+from tinder_ai.testing.server import FixtureCorpus
+
+from selenium.webdriver.common.by import By
+
+from typing import Callable
+import logging
+import re
+import pytest
+
+
+class EditedCorpus(FixtureCorpus):
+    """The fixture corpus with every profile passed through `edit`."""
+
+    def __init__(self, edit: Callable[[str], str]) -> None:
+        super().__init__()
+        self.edit = edit
+
+    def profile_html(self, match_id: str) -> str:
+        return self.edit(super().profile_html(match_id))
+
+    def name_of(self, match_id: str) -> str:
+        return match_id
+
+
+EDITS = {
+    'complete': lambda html: html,
+    'missing age': lambda html: re.sub(
+        r'<span class="As\(b\)">\d+</span>', '', html
+    ),
+    'missing name': lambda html: re.sub(
+        r'<span class="Pend\(8px\)">\w+</span>', '', html
+    ),
+    'age not a number': lambda html: re.sub(
+        r'(<span class="As\(b\)">)\d+', r'\1?', html
+    ),
+}
+
+CORPUS = FixtureCorpus()
+
+
+@pytest.fixture(params=list(EDITS))
+def edited_browser(request, clock):
+    return FakeWebDriver(corpus=EditedCorpus(EDITS[request.param]))
+
+
+@pytest.mark.parametrize(
+    'match_id', CORPUS.match_ids + CORPUS.message_ids
+)
+def test_script_extraction_matches_webdriver_lookups(
+    edited_browser, match_id
+):
+    browser = edited_browser
+    browser.get(f"{browser.base_url}/app/messages/{match_id}")
+    profile_content = browser.find_element(
+        By.XPATH, SELECTORS.xpath('match.profile_content')
+    )
+    chat_content = None
+    if match_id in CORPUS.message_ids:
+        chat_content = browser.find_element(
+            By.XPATH, SELECTORS.xpath('match.conversation')
+        )
+
+    assert ScriptExtractor(browser).extract(
+        profile_content, chat_content
+    ) == Match._extract_all(profile_content, chat_content)
+
+
+@pytest.mark.parametrize('messages', [False, True])
+def test_script_and_webdriver_extraction_give_the_same_profiles(
+    edited_browser, messages, caplog
+):
+    caplog.set_level(logging.DEBUG, logger='tinder_ai.services.match')
+    browser = edited_browser
+    page, ids = (
+        ("/app/messages", CORPUS.message_ids) if messages
+        else ("/app/matches", CORPUS.match_ids)
+    )
+
+    def extract(extraction: str):
+        profiles = []
+        for match_id in ids:
+            browser.get(browser.base_url + page)
+            element = SELECTORS.find(
+                browser, 'session.item_link', item_id=match_id
+            )
+            profiles.append(Match.from_element(
+                element, browser, messages=messages, extraction=extraction
+            ).profile)
+        return profiles
+
+    script = extract('script')
+
+    assert [profile.match_id for profile in script] == ids
+    assert "falling back" not in caplog.text
+    assert script == extract('webdriver')
@@ -0,0 +1,17 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ['selenium', 'undetected_chromedriver', 'pydantic_settings']
+
+
+def test_import_does_not_load_heavy_modules():
+    # A fresh interpreter, the test session has imported them already.
+    loaded = subprocess.run(
+        [
+            sys.executable, "-c",
+            "import tinder_ai, sys; print(' '.join(sys.modules))"
+        ],
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+
+    assert [name for name in HEAVY_MODULES if name in loaded] == []
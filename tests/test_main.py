@@ -0,0 +1,42 @@
+from tinder_ai.__main__ import cli_settings
+from tinder_ai.settings import Settings
+
+from argparse import Namespace
+
+
+def args(**flags) -> Namespace:
+    defaults = {
+        'mock': False, 'pipeline': False, 'batch': False,
+        'cache_driver': False,
+        'attach': None, 'metrics_dir': None, 'trace': None,
+        'record': None,
+    }
+    return Namespace(**{**defaults, **flags})
+
+
+def test_cli_flags_override_the_env(monkeypatch):
+    monkeypatch.setenv('PIPELINE', 'true')
+    monkeypatch.setenv('PIPELINE_WORKERS', '4')
+
+    settings = Settings(_env_file=None, **cli_settings(args(mock=True)))
+
+    assert settings.mock
+    assert settings.pipeline
+    assert settings.pipeline_workers == 4
+    assert settings.persist_user_data
+    assert settings.debugger_address is None
+
+
+def test_attach_sets_the_debugger_address():
+    settings = Settings(
+        _env_file=None, **cli_settings(args(attach="127.0.0.1:9222"))
+    )
+
+    assert settings.debugger_address == "127.0.0.1:9222"
+
+
+def test_unset_flags_keep_the_defaults():
+    settings = Settings(_env_file=None, **cli_settings(args()))
+
+    assert not settings.mock
+    assert not settings.pipeline
@@ -0,0 +1,327 @@
+from tinder_ai.services.messenger_api import MessengerService
+from tinder_ai.shared import (
+    BatchResult,
+    MatchProfile,
+    MatchReadyException,
+    Message
+)
+from tinder_ai.testing.messenger import BATCH_ROUTES
+from tinder_ai.utils.clock import VirtualClock, use_clock
+
+from pydantic import ValidationError
+import pytest
+import requests
+import socket
+
+
+def profile(match_id: str = "anna", **kwargs) -> MatchProfile:
+    return MatchProfile(match_id=match_id, name=match_id.title(), **kwargs)
+
+
+def conversation(count: int):
+    return [
+        Message(message=f"Message {index}", is_received=index % 2 == 0)
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def bodies(messenger, monkeypatch):
+    """The (path, JSON body) of every request the server renders."""
+    sent = []
+    render = messenger.render
+
+    def recording(path, data):
+        sent.append((path, data))
+        return render(path, data)
+    monkeypatch.setattr(messenger, 'render', recording)
+    return sent
+
+
+@pytest.fixture
+def service(messenger):
+    with MessengerService(messenger.base_url, delta_replies=True) as service:
+        yield service
+
+
+def test_delta_sends_only_new_messages(service, messenger, bodies):
+    for count in (2, 3, 5):
+        response = service.generate_reply(profile(), conversation(count))
+        assert response.message == (
+            f"Reply to {count} messages, last: Message {count - 1}"
+        )
+
+    full, *deltas = [body for _, body in bodies]
+    assert full['profile']['name'] == "Anna"
+    assert len(full['new_messages']) == 2
+    assert [delta['profile'] for delta in deltas] == [None, None]
+    assert [delta['base_messages'] for delta in deltas] == [2, 3]
+    assert [len(delta['new_messages']) for delta in deltas] == [1, 2]
+    assert messenger.misses == 0
+
+
+def test_cache_miss_is_retried_in_full(service, messenger, bodies):
+    service.generate_reply(profile(), conversation(2))
+    messenger.forget("anna")
+
+    response = service.generate_reply(profile(), conversation(3))
+
+    assert response.message == "Reply to 3 messages, last: Message 2"
+    assert messenger.misses == 1
+    delta, full = [body for _, body in bodies[1:]]
+    assert delta['profile'] is None
+    assert full['profile'] is not None
+    assert len(full['new_messages']) == 3
+
+    service.generate_reply(profile(), conversation(4))
+    assert bodies[-1][1]['base_messages'] == 3
+
+
+@pytest.mark.parametrize('changed', [
+    {'profile': profile(bio="Climbing"), 'messages': conversation(3)},
+    {'profile': profile(), 'messages': conversation(1)},
+    {'profile': profile(), 'messages': list(reversed(conversation(3)))},
+])
+def test_changed_base_is_sent_in_full(service, messenger, bodies, changed):
+    service.generate_reply(profile(), conversation(2))
+
+    service.generate_reply(changed['profile'], changed['messages'])
+
+    assert bodies[-1][1]['profile'] is not None
+    assert messenger.misses == 0
+
+
+def test_v1_and_v2_replies_match(messenger):
+    states = [
+        profile(last_messages=conversation(count)) for count in (1, 2, 4)
+    ]
+    with MessengerService(messenger.base_url) as v1:
+        expected = [
+            v1.generate_reply(state, state.last_messages) for state in states
+        ]
+    with MessengerService(messenger.base_url, delta_replies=True) as v2:
+        assert [
+            v2.generate_reply(state, state.last_messages) for state in states
+        ] == expected
+
+
+def reject_batches(messenger, monkeypatch, status: int, after: int = 0):
+    """Answer batch requests with `status` after the first `after` ones."""
+    render = messenger.render
+    batches = []
+
+    def rejecting(path, data):
+        if path in BATCH_ROUTES and not data.get('match_id'):
+            batches.append(path)
+            if len(batches) > after:
+                return status, {"detail": "Not Found"}
+        return render(path, data)
+    monkeypatch.setattr(messenger, 'render', rejecting)
+
+
+def paths(messenger):
+    return [path for path, _ in messenger.requests]
+
+
+def test_batch_cache_misses_are_retried_in_full(service, messenger):
+    items = [(profile(name), conversation(2)) for name in ("anna", "bob")]
+    service.generate_replies(items)
+    messenger.forget("bob")
+
+    results = service.generate_replies(
+        [(state, conversation(3)) for state, _ in items]
+    )
+
+    assert [result.message for result in results] == [
+        "Reply to 3 messages, last: Message 2"
+    ] * 2
+    assert paths(messenger) == ["/v2/generate/replies"] * 3
+    assert messenger.misses == 1
+
+
+@pytest.mark.parametrize('status', sorted(
+    MessengerService.UNSUPPORTED_STATUS_CODES
+))
+def test_unsupported_batches_fall_back_to_single_requests(
+    messenger, monkeypatch, status
+):
+    reject_batches(messenger, monkeypatch, status)
+    with MessengerService(messenger.base_url) as service:
+        results = service.generate_openers([profile("anna"), profile("bob")])
+        again = service.generate_openers([profile("carol")])
+
+    assert [result.message for result in results + again] == [
+        "Hi Anna!", "Hi Bob!", "Hi Carol!"
+    ]
+    assert not service.batch_supported
+    assert paths(messenger) == ["/v1/generate/openers"] + [
+        "/v1/generate/opener"
+    ] * 3
+
+
+@pytest.mark.parametrize('status', sorted(
+    MessengerService.UNSUPPORTED_STATUS_CODES
+))
+def test_unsupported_retry_falls_back_to_single_requests(
+    service, messenger, monkeypatch, status
+):
+    items = [(profile(name), conversation(2)) for name in ("anna", "bob")]
+    service.generate_replies(items)
+    messenger.forget()
+    reject_batches(messenger, monkeypatch, status, after=1)
+
+    results = service.generate_replies(
+        [(state, conversation(3)) for state, _ in items]
+    )
+
+    assert [result.message for result in results] == [
+        "Reply to 3 messages, last: Message 2"
+    ] * 2
+    assert paths(messenger) == ["/v2/generate/replies"] * 3 + [
+        "/v2/generate/reply"
+    ] * 2
+    assert messenger.misses == 2
+
+
+def test_batch_failures_are_returned_per_item(service, messenger):
+    messenger.ready.add("bob")
+
+    anna, bob = service.generate_openers([profile("anna"), profile("bob")])
+
+    assert anna.message == "Hi Anna!"
+    assert isinstance(bob, MatchReadyException)
+
+
+def test_successful_batch_result_requires_a_message(
+    service, messenger, monkeypatch
+):
+    with pytest.raises(ValidationError):
+        BatchResult(status=200)
+    monkeypatch.setattr(
+        messenger, 'render', lambda path, data: (200, {"results": [{}]})
+    )
+
+    with pytest.raises(ValidationError):
+        service.generate_openers([profile()])
+
+
+class RecordingClock(VirtualClock):
+    """A virtual clock that keeps every sleep."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.slept = []
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        super().sleep(seconds)
+
+
+@pytest.fixture
+def sleeps():
+    with use_clock(RecordingClock()) as clock:
+        yield clock.slept
+
+
+def fail_first(messenger, monkeypatch, status: int, count: int):
+    """Answer the first `count` requests with `status`."""
+    render = messenger.render
+    failed = []
+
+    def failing(path, data):
+        if len(failed) < count:
+            failed.append(path)
+            return status, {"detail": "Unavailable"}
+        return render(path, data)
+    monkeypatch.setattr(messenger, 'render', failing)
+
+
+def within_backoff(service, sleeps) -> bool:
+    return all(
+        0 <= seconds <= min(
+            service.backoff_max, service.backoff_factor * 2 ** attempt
+        )
+        for attempt, seconds in enumerate(sleeps)
+    )
+
+
+def test_server_errors_are_retried_with_backoff(
+    messenger, monkeypatch, sleeps
+):
+    fail_first(messenger, monkeypatch, 503, 2)
+    service = MessengerService(messenger.base_url, backoff_factor=4)
+
+    response = service.generate_opener(profile())
+
+    assert response.message == "Hi Anna!"
+    assert len(messenger.requests) == 3
+    assert len(sleeps) == 2
+    assert within_backoff(service, sleeps)
+
+
+def test_retries_are_exhausted(messenger, monkeypatch, sleeps):
+    fail_first(messenger, monkeypatch, 503, 10)
+    service = MessengerService(
+        messenger.base_url, max_retries=3, backoff_max=1
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        service.generate_opener(profile())
+
+    assert len(messenger.requests) == 4
+    assert len(sleeps) == 3
+    assert within_backoff(service, sleeps)
+    assert max(sleeps) <= 1
+
+
+def test_match_ready_is_not_retried(messenger, sleeps):
+    messenger.ready.add("anna")
+    service = MessengerService(messenger.base_url)
+
+    with pytest.raises(MatchReadyException):
+        service.generate_opener(profile())
+
+    assert len(messenger.requests) == 1
+    assert sleeps == []
+
+
+def test_client_errors_are_not_retried(messenger, monkeypatch, sleeps):
+    fail_first(messenger, monkeypatch, 422, 1)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        MessengerService(messenger.base_url).generate_opener(profile())
+
+    assert len(messenger.requests) == 1
+    assert sleeps == []
+
+
+def test_connection_errors_are_retried(sleeps):
+    # A bound socket that does not listen refuses connections.
+    with socket.socket() as closed:
+        closed.bind(("127.0.0.1", 0))
+        host, port = closed.getsockname()
+        service = MessengerService(f"http://{host}:{port}", max_retries=2)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            service.generate_opener(profile())
+
+    assert len(sleeps) == 2
+    assert within_backoff(service, sleeps)
+
+
+def test_timeouts_per_endpoint(messenger, monkeypatch):
+    service = MessengerService(
+        messenger.base_url, timeout=5, timeouts={"/v1/generate/reply": 30}
+    )
+    post = service.session.post
+    timeouts = {}
+
+    def recording(url, **kwargs):
+        timeouts[url.rsplit("/", 1)[-1]] = kwargs['timeout']
+        return post(url, **kwargs)
+    monkeypatch.setattr(service.session, 'post', recording)
+
+    service.generate_opener(profile())
+    service.generate_reply(profile(), conversation(1))
+
+    assert timeouts == {"opener": 5, "reply": 30}
@@ -0,0 +1,116 @@
+from tinder_ai.services.messenger_api import MessengerService
+from tinder_ai.services.messenger_cache import CachedMessengerService
+from tinder_ai.shared import MatchProfile, MatchReadyException, Message
+
+import pytest
+
+
+def profile(match_id: str = "anna", **kwargs) -> MatchProfile:
+    return MatchProfile(match_id=match_id, name=match_id.title(), **kwargs)
+
+
+def conversation(*texts: str):
+    return [
+        Message(message=text, is_received=index % 2 == 0)
+        for index, text in enumerate(texts)
+    ]
+
+
+@pytest.fixture
+def cache(messenger):
+    with CachedMessengerService(MessengerService(messenger.base_url)) as cache:
+        yield cache
+
+
+def test_same_state_is_generated_once(cache, messenger):
+    messages = conversation("Hi!", "Hey, how are you?")
+
+    first = cache.generate_reply(profile(), messages)
+    second = cache.generate_reply(profile(), list(messages))
+
+    assert first == second
+    assert len(messenger.requests) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_state_is_generated_again(cache, messenger):
+    cache.generate_opener(profile())
+    cache.generate_reply(profile(), conversation("Hi!"))
+    cache.generate_reply(profile(), conversation("Hi!", "Hello"))
+    cache.generate_opener(profile(bio="Climbing"))
+
+    assert len(messenger.requests) == 4
+    assert (cache.hits, cache.misses) == (0, 4)
+
+
+def test_cache_key_is_an_idempotency_key():
+    key = CachedMessengerService.cache_key
+    messages = conversation("Hi!")
+    reordered = MatchProfile(name="Anna", match_id="anna")
+
+    assert key('reply', profile(), messages) == key(
+        'reply', reordered, conversation("Hi!")
+    )
+    assert key('reply', profile(), messages).startswith("anna:")
+    assert key('reply', profile(), messages) != key('opener', profile())
+    assert key('reply', profile(), messages) != key('reply', profile())
+    assert key('reply', profile(), messages) != key(
+        'reply', profile(), conversation("Hi!", "Hello")
+    )
+
+
+def test_failures_are_not_cached(cache, messenger):
+    messenger.ready.add("anna")
+    with pytest.raises(MatchReadyException):
+        cache.generate_opener(profile())
+
+    messenger.ready.clear()
+    cache.generate_opener(profile())
+
+    assert len(messenger.requests) == 2
+    assert len(cache) == 1
+
+
+def test_batch_only_generates_missing_items(cache, messenger):
+    cache.generate_opener(profile("anna"))
+    messenger.ready.add("carol")
+
+    results = cache.generate_openers(
+        [profile("anna"), profile("bob"), profile("carol")]
+    )
+
+    assert [result.message for result in results[:2]] == [
+        "Hi Anna!", "Hi Bob!"
+    ]
+    assert isinstance(results[2], MatchReadyException)
+    assert [path for path, _ in messenger.requests] == [
+        "/v1/generate/opener", "/v1/generate/openers"
+    ]
+    assert cache.generate_openers([profile("bob")])[0].message == "Hi Bob!"
+    assert len(messenger.requests) == 2
+
+
+def test_invalidate_drops_the_responses_of_a_match(cache, messenger):
+    cache.generate_opener(profile("anna"))
+    cache.generate_opener(profile("bob"))
+
+    cache.invalidate("anna")
+    cache.generate_opener(profile("anna"))
+
+    assert len(messenger.requests) == 3
+    assert len(cache) == 2
+
+
+def test_responses_expire_in_clock_time(messenger, clock):
+    messages = conversation("Hi!")
+    with CachedMessengerService(
+        MessengerService(messenger.base_url), ttl=60
+    ) as cache:
+        cache.generate_reply(profile(), messages)
+        clock.advance(60)
+        cache.generate_reply(profile(), messages)
+        clock.advance(1)
+        cache.generate_reply(profile(), messages)
+
+    assert len(messenger.requests) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
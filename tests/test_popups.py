@@ -0,0 +1,121 @@
+from tinder_ai.services.popups import (
+    DEFAULT_POPUP_RULES,
+    MAX_DISMISS_PROBES,
+    PopupDetector,
+    PopupRule
+)
+from tinder_ai.testing.fake import FakeElement
+from tinder_ai.utils.metrics import METRICS
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException
+)
+
+import pytest
+
+RULES = {rule.name: rule for rule in DEFAULT_POPUP_RULES}
+
+
+def show(browser, *popups: str) -> None:
+    browser.get(f"{browser.base_url}/app/recs?popup={','.join(popups)}")
+
+
+def names(rules):
+    return [rule.name for rule in rules]
+
+
+def test_no_popup_costs_one_probe(browser):
+    popups = PopupDetector(browser)
+    round_trips = browser.round_trips
+
+    assert popups.dismiss() == []
+    assert browser.round_trips == round_trips + 1
+    assert popups.probes == 1
+
+
+def test_detect_returns_hits_in_rule_order(browser):
+    show(browser, 'match', 'maybe_later')
+
+    assert names(
+        rule for rule, _ in PopupDetector(browser).detect()
+    ) == ['maybe_later', 'match']
+
+
+def test_exclusive_hit_ends_the_probe_and_the_rest_is_probed_again(
+    browser
+):
+    show(browser, 'maybe_later', 'match')
+    popups = PopupDetector(browser)
+
+    assert names(popups.dismiss()) == ['maybe_later', 'match']
+    # maybe_later, then match on a fresh probe, then nothing left
+    assert popups.probes == 3
+    assert popups.hit_counts == {'maybe_later': 1, 'match': 1}
+    assert popups.detect() == []
+
+
+def test_non_exclusive_hits_are_handled_in_one_probe(browser):
+    show(browser, 'maybe_later', 'match')
+    popups = PopupDetector(
+        browser, rules=[RULES['match'], RULES['maybe_later']]
+    )
+
+    assert names(popups.dismiss()) == ['match', 'maybe_later']
+    assert popups.probes == 2
+
+
+def test_stale_button_refreshes_and_probes_again(browser, monkeypatch):
+    show(browser, 'maybe_later')
+    click = FakeElement.click
+    clicks = []
+
+    def stale_once(element):
+        clicks.append(element)
+        if len(clicks) == 1:
+            raise StaleElementReferenceException("stale")
+        click(element)
+    monkeypatch.setattr(FakeElement, 'click', stale_once)
+    refreshes = METRICS.counter('refreshes')
+    popups = PopupDetector(browser)
+
+    assert names(popups.dismiss()) == ['maybe_later']
+    assert METRICS.counter('refreshes') == refreshes + 1
+    assert popups.detect() == []
+
+
+def test_popup_that_keeps_coming_back_is_bounded(browser, monkeypatch):
+    show(browser, 'maybe_later')
+
+    def stale(element):
+        raise StaleElementReferenceException("stale")
+    monkeypatch.setattr(FakeElement, 'click', stale)
+    popups = PopupDetector(browser)
+
+    assert popups.dismiss() == []
+    assert popups.probes == MAX_DISMISS_PROBES
+    assert popups.hit_counts == {}
+
+
+def test_missing_container_raises(browser):
+    browser.get(f"{browser.base_url}/unknown")
+
+    with pytest.raises(NoSuchElementException):
+        PopupDetector(browser).dismiss()
+
+
+def test_register_inserts_before_a_rule(browser):
+    popups = PopupDetector(browser)
+    rule = PopupRule(name='banner', xpath='.//button[@id="banner"]')
+
+    popups.register(rule, before='match')
+
+    assert names(popups.rules).index('banner') == (
+        names(popups.rules).index('match') - 1
+    )
+    with pytest.raises(ValueError):
+        popups.register(rule)
+    with pytest.raises(ValueError):
+        popups.register(
+            PopupRule(name='other', xpath='.//button'), before='missing'
+        )
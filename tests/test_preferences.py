@@ -0,0 +1,126 @@
+from tinder_ai.constants.models import Sexuality
+from tinder_ai.constants.selectors import SELECTORS
+from tinder_ai.services.preferences import (
+    MAX_SLIDER_CORRECTIONS,
+    AppliedPreferences,
+    PreferencesService
+)
+
+import pytest
+
+
+@pytest.fixture
+def preferences(browser):
+    browser.get(browser.base_url + "/app/profile")
+    return PreferencesService(browser)
+
+
+def test_collapsed_looking_for_list_is_unknown(preferences):
+    assert preferences.read_preferences() == {
+        'distance': 80,
+        'age_min': 25,
+        'age_max': 40,
+        'looking_for': None,
+        'global': False,
+    }
+
+
+def test_expanded_looking_for_list_is_read(preferences, browser):
+    SELECTORS.find(browser, 'preferences.looking_for_button').click()
+
+    assert preferences.read_preferences()['looking_for'] == ["Everyone"]
+
+
+def test_unknown_looking_for_is_applied(preferences, settings, monkeypatch):
+    calls = []
+    for name in (
+        'set_distance_range', 'set_age_range', 'set_sexuality', 'set_global'
+    ):
+        setter = getattr(preferences, name)
+        monkeypatch.setattr(
+            preferences, name,
+            lambda *args, name=name, setter=setter: (
+                calls.append((name, *args)) or setter(*args)
+            )
+        )
+    settings = settings.model_copy(update={
+        'distance_range': 80,
+        'age_range_min': 25,
+        'age_range_max': 40,
+        'gender_preference': Sexuality.WOMEN,
+        'set_global': False,
+    })
+
+    assert preferences.set_preferences(settings)
+    assert calls == [('set_sexuality', Sexuality.WOMEN)]
+
+
+@pytest.fixture
+def drags(preferences, monkeypatch):
+    """The offsets of every slider drag."""
+    offsets = []
+    drag = preferences._drag
+    monkeypatch.setattr(
+        preferences, '_drag',
+        lambda handle, offset: offsets.append(offset) or drag(handle, offset)
+    )
+    return offsets
+
+
+def test_distance_without_aria_bounds_uses_the_distance_scale(
+    preferences, browser, drags
+):
+    handle = SELECTORS.find(browser, 'preferences.distance_handle')
+    for name in ('aria-valuemin', 'aria-valuemax'):
+        del handle.node.attrib[name]
+
+    assert preferences.set_distance_range(120)
+    assert handle.get_attribute('aria-valuenow') == "120"
+    assert len(drags) == 1
+
+
+def test_slider_that_lands_off_by_one_is_corrected(
+    preferences, browser, drags, monkeypatch
+):
+    drag_to = browser._drag_to
+
+    def off_by_one(x):
+        # Moves of the first drag overshoot by one kilometer.
+        if len(drags) == 1:
+            rail = browser.layout(browser._dragged.getparent())
+            x += rail['width'] / 161
+        drag_to(x)
+
+    monkeypatch.setattr(browser, '_drag_to', off_by_one)
+    handle = SELECTORS.find(browser, 'preferences.distance_handle')
+    # Bounds of the rail, so only the overshoot needs a correction.
+    handle.node.set('aria-valuemin', "0")
+
+    assert preferences.set_distance_range(120)
+    assert handle.get_attribute('aria-valuenow') == "120"
+    assert len(drags) == 2 <= 1 + MAX_SLIDER_CORRECTIONS
+    # One kilometer back on the 320px rail.
+    assert drags[1] == pytest.approx(-320 / 161)
+
+
+def test_applied_preferences_key(settings, tmp_path):
+    applied = AppliedPreferences(path=tmp_path / "preferences.json")
+    applied.record(settings)
+
+    assert AppliedPreferences(path=tmp_path / "preferences.json").matches(
+        settings
+    )
+    assert not applied.matches(
+        settings.model_copy(update={'distance_range': 10})
+    )
+
+
+def test_applied_preferences_expire_in_clock_time(settings, clock):
+    applied = AppliedPreferences(ttl=60)
+    applied.record(settings)
+
+    clock.advance(60)
+    assert applied.matches(settings)
+
+    clock.advance(1)
+    assert not applied.matches(settings)
@@ -0,0 +1,74 @@
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from tinder_ai.constants.selectors import SELECTORS
+from tinder_ai.utils import readiness
+from tinder_ai.utils.readiness import (
+    DEFAULT_SCRIPT_TIMEOUT,
+    wait_for_any,
+    wait_for_element
+)
+
+import pytest
+
+MISSING = "//*[@id='missing']"
+
+
+def test_long_wait_restores_the_script_timeout(browser):
+    browser.set_script_timeout(12)
+    xpath = SELECTORS.xpath('session.matches_tab')
+
+    assert wait_for_element(browser, xpath, DEFAULT_SCRIPT_TIMEOUT + 10)
+    assert browser.script_timeout == 12
+
+    with pytest.raises(TimeoutException):
+        wait_for_any(browser, [MISSING], DEFAULT_SCRIPT_TIMEOUT + 10)
+    assert browser.script_timeout == 12
+
+
+def test_short_wait_leaves_the_script_timeout(browser):
+    xpath = SELECTORS.xpath('session.matches_tab')
+    # The first wait reads the script timeout.
+    wait_for_element(browser, xpath, 5)
+    round_trips = browser.round_trips
+
+    wait_for_element(browser, xpath, 5)
+
+    assert browser.round_trips == round_trips + 1
+    assert browser.script_timeout == DEFAULT_SCRIPT_TIMEOUT
+
+
+def test_wait_outlasts_a_shorter_script_timeout(browser, monkeypatch):
+    browser.set_script_timeout(5)
+    timeouts = []
+    set_script_timeout = browser.set_script_timeout
+
+    def spy(seconds):
+        timeouts.append(seconds)
+        set_script_timeout(seconds)
+    monkeypatch.setattr(browser, 'set_script_timeout', spy)
+
+    xpath = SELECTORS.xpath('session.matches_tab')
+    assert wait_for_element(browser, xpath, 10)
+    assert timeouts == [11, 5]
+    assert browser.script_timeout == 5
+
+
+def test_script_error_polls_for_the_remaining_time(
+    browser, clock, monkeypatch
+):
+    def fail(*args):
+        clock.advance(4)
+        raise WebDriverException("javascript error: navigated")
+
+    polled = []
+    monkeypatch.setattr(browser, 'execute_async_script', fail)
+    monkeypatch.setattr(
+        readiness, '_poll_for_any',
+        lambda browser, xpaths, timeout: polled.append(timeout)
+    )
+
+    with pytest.raises(TimeoutException):
+        wait_for_any(browser, [MISSING], DEFAULT_SCRIPT_TIMEOUT + 10)
+
+    assert polled == [DEFAULT_SCRIPT_TIMEOUT + 6]
+    assert browser.script_timeout == DEFAULT_SCRIPT_TIMEOUT
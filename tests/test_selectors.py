@@ -0,0 +1,76 @@
+from tinder_ai.constants.selectors import SELECTORS
+from tinder_ai.utils.selectors import SelectorRegistry
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    TimeoutException
+)
+from selenium.webdriver.common.by import By
+
+import pytest
+
+STALE = (By.XPATH, "//button[contains(text(), 'Matches (old)')]")
+
+
+@pytest.fixture
+def registry():
+    registry = SelectorRegistry()
+    current = SELECTORS.get('session.matches_tab').primary
+    registry.register('session.matches_tab', STALE, current)
+    registry.register(
+        'session.item_link',
+        (By.CSS_SELECTOR, "a.gone[href*='{item_id}']"),
+        (By.CSS_SELECTOR, "a[href*='{item_id}']")
+    )
+    return registry
+
+
+def test_fallback_candidate_is_used_and_counted(registry, browser):
+    element = registry.find(browser, 'session.matches_tab')
+
+    assert element.text == "Matches"
+    stats = registry.stats()['session.matches_tab']
+    assert (stats.lookups, stats.misses) == (1, 0)
+    assert stats.matched == {1: 1}
+
+
+def test_fallback_within_a_wait(registry, browser):
+    match_id = browser.corpus.match_ids[0]
+
+    element = registry.find(
+        browser, 'session.item_link',
+        timeout=1, condition='clickable', item_id=match_id
+    )
+
+    assert match_id in element.get_attribute('href')
+    assert registry.stats()['session.item_link'].matched == {1: 1}
+
+
+def test_find_all_falls_back(registry, browser):
+    browser.get(browser.base_url + "/app/matches")
+
+    assert registry.find_all(
+        browser, 'session.item_link', item_id="synthetic"
+    )
+    assert registry.stats()['session.item_link'].matched == {1: 1}
+
+
+def test_miss_is_counted(registry, browser):
+    with pytest.raises(NoSuchElementException):
+        registry.find(browser, 'session.item_link', item_id="missing")
+    with pytest.raises(TimeoutException):
+        registry.find(
+            browser, 'session.item_link', timeout=0.1, item_id="missing"
+        )
+
+    stats = registry.stats()['session.item_link']
+    assert (stats.lookups, stats.misses) == (2, 2)
+    assert stats.matched == {}
+    assert "session.item_link" in registry.report()
+
+
+def test_register_needs_a_unique_name_and_a_candidate(registry):
+    with pytest.raises(ValueError):
+        registry.register('session.matches_tab', STALE)
+    with pytest.raises(ValueError):
+        registry.register('session.other')
@@ -0,0 +1,203 @@
+from tinder_ai.constants.models import LoginMethods
+from tinder_ai.services.login import LoginService
+from tinder_ai.services.messenger_api import MockMessengerService
+from tinder_ai.session import Session
+from tinder_ai.testing import FakeWebDriver
+
+import pytest
+
+
+def openers(browser):
+    return sorted(text for _, text in browser.sent_messages)
+
+
+@pytest.mark.parametrize('mode', [
+    {},
+    {'pipeline': True},
+    {'pipeline': True, 'pipeline_workers': 1},
+    {'batch': True},
+    {'batch': True, 'pipeline': True},
+])
+def test_run_modes_send_the_same_openers(make_session, browser, mode):
+    corpus = browser.corpus
+    session = make_session(**mode)
+
+    session.handle_matches()
+
+    assert openers(browser) == sorted(
+        f"Hi {corpus.name_of(match_id)} 😊!" for match_id in corpus.match_ids
+    )
+    assert session.session_data.sent_openings == len(corpus.match_ids)
+
+
+def test_batch_argument_overrides_the_settings(
+    browser, settings, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(Session, 'USER_DATA_DIR', tmp_path)
+    session = Session(
+        settings, MockMessengerService(), batch=True, browser=browser
+    )
+
+    session.handle_matches()
+
+    assert session.batch
+    assert session.session_data.sent_openings == len(
+        browser.corpus.match_ids
+    )
+
+
+def test_mock_mode_sends_nothing(make_session, browser):
+    session = make_session(mock=True)
+
+    session.handle_matches()
+
+    assert browser.sent_messages == []
+
+
+def test_mock_argument_overrides_the_settings(
+    browser, settings, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(Session, 'USER_DATA_DIR', tmp_path)
+    session = Session(
+        settings, MockMessengerService(), mock=True, browser=browser
+    )
+
+    session.handle_matches()
+
+    assert session.mock
+    assert browser.sent_messages == []
+    assert not Session(
+        settings.with_overrides(mock=True), MockMessengerService(),
+        mock=False, browser=browser
+    ).mock
+
+
+def test_metrics_are_exported_to_metrics_dir(make_session, tmp_path):
+    session = make_session(metrics_dir=tmp_path / "metrics")
+
+    session.handle_matches()
+    session.export_metrics()
+
+    assert (tmp_path / "metrics" / "metrics.jsonl").exists()
+    assert "extraction" in (tmp_path / "metrics" / "metrics.prom").read_text()
+
+
+def test_metrics_dir_argument_overrides_the_settings(
+    browser, settings, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(Session, 'USER_DATA_DIR', tmp_path)
+    session = Session(
+        settings.with_overrides(metrics_dir=tmp_path / "settings"),
+        MockMessengerService(),
+        metrics_dir=str(tmp_path / "metrics"),
+        browser=browser
+    )
+
+    session.export_metrics()
+
+    assert (tmp_path / "metrics" / "metrics.jsonl").exists()
+    assert not (tmp_path / "settings").exists()
+
+
+def test_browser_arguments_override_the_settings(
+    browser, settings, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(Session, 'USER_DATA_DIR', tmp_path)
+    session = Session(
+        settings.with_overrides(debugger_address="127.0.0.1:9000"),
+        MockMessengerService(),
+        cache_driver=True,
+        debugger_address="127.0.0.1:9222",
+        browser=browser
+    )
+
+    assert session.settings.cache_driver
+    assert session.debugger_address == "127.0.0.1:9222"
+
+
+class StubHook:
+    """Stands in for Tracer and Recorder, the fake has no executor."""
+
+    installed: list = []
+
+    def __init__(self, browser) -> None:
+        self.browser = browser
+
+    def install(self) -> 'StubHook':
+        self.installed.append(self)
+        return self
+
+
+def test_trace_path_argument_overrides_the_settings(
+    browser, settings, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(Session, 'USER_DATA_DIR', tmp_path)
+    monkeypatch.setattr('tinder_ai.session.Tracer', StubHook)
+    monkeypatch.setattr(StubHook, 'installed', [])
+    session = Session(
+        settings, MockMessengerService(),
+        trace_path=str(tmp_path / "trace.json"),
+        browser=browser
+    )
+
+    assert session.trace_path == tmp_path / "trace.json"
+    assert StubHook.installed == [session.tracer]
+
+
+def test_record_path_argument_overrides_the_settings(
+    browser, settings, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(Session, 'USER_DATA_DIR', tmp_path)
+    monkeypatch.setattr('tinder_ai.session.Recorder', StubHook)
+    monkeypatch.setattr(StubHook, 'installed', [])
+    session = Session(
+        settings, MockMessengerService(),
+        record_path=str(tmp_path / "session.jsonl.gz"),
+        browser=browser
+    )
+
+    assert session.record_path == tmp_path / "session.jsonl.gz"
+    assert StubHook.installed == [session.recorder]
+
+
+@pytest.mark.parametrize('cookies, round_trips', [
+    # current_url, Network.getCookies and opening Tinder
+    ([], 3),
+    # Stale cookies: reading the script timeout, one wait_for_any
+    # and the current URL for the log
+    ([{'name': 'session', 'domain': '.tinder.com'}], 6),
+])
+def test_logged_out_browser_runs_the_login(
+    clock, settings, tmp_path, monkeypatch, cookies, round_trips
+):
+    monkeypatch.setattr(Session, 'USER_DATA_DIR', tmp_path)
+    browser = FakeWebDriver(logged_in=False)
+    browser.cookies = cookies
+    logins = []
+
+    def login_by_google(service, email, password):
+        logins.append((email, password))
+        browser.logged_in = True
+        browser.get(browser.base_url)
+        return True
+
+    monkeypatch.setattr(LoginService, 'login_by_google', login_by_google)
+    session = Session(
+        settings.with_overrides(
+            google_email="alex@example.com", google_password="secret"
+        ),
+        MockMessengerService(),
+        browser=browser
+    )
+
+    before, commands = browser.round_trips, len(browser.cdp_commands)
+    assert not session._is_logged_in()
+    assert browser.round_trips - before == round_trips
+    assert [cmd for cmd, _ in browser.cdp_commands[commands:]] == [
+        "Network.getCookies"
+    ]
+
+    session.login(LoginMethods.GOOGLE)
+
+    assert logins == [("alex@example.com", "secret")]
+    assert session._is_logged_in()
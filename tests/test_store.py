@@ -0,0 +1,99 @@
+from tinder_ai.services.store import ProfileStore
+from tinder_ai.shared import MatchProfile, Message
+
+import pytest
+
+TTL = 60
+
+
+def profile(match_id: str, **kwargs) -> MatchProfile:
+    return MatchProfile(match_id=match_id, name=match_id.title(), **kwargs)
+
+
+@pytest.fixture
+def store(clock):
+    with ProfileStore(ttl=TTL, max_entries=2) as store:
+        yield store
+
+
+def test_get_returns_fresh_profiles(store):
+    store.put(profile("anna"))
+
+    assert store.get("anna").name == "Anna"
+    assert store.get("bob") is None
+    assert (store.hits, store.misses) == (1, 1)
+
+
+def test_entry_expires_after_ttl_when_read_regularly(store, clock):
+    store.put(profile("anna"))
+
+    for _ in range(5):
+        clock.advance(TTL / 5 - 1)
+        cached = store.get("anna")
+        assert cached is not None
+        store.update(cached)
+
+    clock.advance(10)
+    assert store.get("anna") is None
+
+
+def test_update_replaces_the_profile_but_not_its_age(store, clock):
+    store.put(profile("anna"))
+    clock.advance(TTL - 1)
+    messages = [Message(message="Hi!", is_received=True)]
+
+    store.update(profile("anna", last_messages=messages))
+
+    assert store.get("anna").last_messages == messages
+    clock.advance(2)
+    assert store.get("anna") is None
+
+
+def test_update_ignores_missing_profiles(store):
+    store.update(profile("anna"))
+
+    assert len(store) == 0
+
+
+def test_evict_drops_expired_entries(store, clock):
+    store.put(profile("anna"))
+    clock.advance(TTL + 1)
+
+    assert store.evict() == 1
+    assert len(store) == 0
+
+
+def test_put_evicts_least_recently_used(store, clock):
+    store.put(profile("anna"))
+    clock.advance(1)
+    store.put(profile("bob"))
+    clock.advance(1)
+    store.get("anna")
+    clock.advance(1)
+
+    store.put(profile("carol"))
+
+    assert store.get("bob") is None
+    assert store.get("anna") is not None
+    assert store.get("carol") is not None
+
+
+def test_session_reads_do_not_extend_the_ttl(make_session, browser, clock):
+    store = ProfileStore(ttl=TTL)
+    session = make_session(profile_store=store)
+    match_id = browser.corpus.unread_message_ids[0]
+
+    def open_match():
+        browser.get(browser.base_url + "/app/matches")
+        return session._open_item('unread_messages', match_id)
+
+    extracted = open_match()
+    assert extracted.profile.last_messages
+    clock.advance(TTL - 1)
+
+    reopened = open_match()
+    assert reopened.profile == extracted.profile
+    assert store.hits == 1
+
+    clock.advance(2)
+    assert store.get(match_id) is None
@@ -1,8 +1,34 @@
-from tinder_ai.session import Session
-from tinder_ai.settings import Settings
+from typing import TYPE_CHECKING
+import importlib
 
+if TYPE_CHECKING:
+    from tinder_ai.session import Session
+    from tinder_ai.settings import Settings
+
+
+# Public names and the modules defining them. Importing them pulls in
+# Selenium, undetected_chromedriver and pydantic-settings, so they are
+# only loaded on first access.
+_LAZY_IMPORTS = {
+    'Session': 'tinder_ai.session',
+    'Settings': 'tinder_ai.settings',
+}
 
 __all__ = [
     'Session',
     'Settings'
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,10 +1,4 @@
-from tinder_ai.session import Session
-from tinder_ai.services.messenger_api import (
-    MockMessengerService,
-    MessengerService
-)
-from tinder_ai.settings import Settings
-from tinder_ai.utils import configure_logger, BANNER
+from tinder_ai.utils import configure_logger, clock, BANNER
 
 import argparse
 import logging
@@ -37,6 +31,84 @@ def parse_args():
         )
     )
 
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help=(
+            "Generate messages in the background while the "
+            "next matches are extracted"
+        )
+    )
+
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help=(
+            "Extract all matches of a cycle first and generate "
+            "their messages in one batched request"
+        )
+    )
+
+    parser.add_argument(
+        '--cache-profiles',
+        action='store_true',
+        help=(
+            "Cache extracted profiles locally and skip "
+            "extracting them again while fresh"
+        )
+    )
+
+    parser.add_argument(
+        '--cache-replies',
+        action='store_true',
+        help=(
+            "Reuse generated messages for conversations "
+            "that did not change since the last request"
+        )
+    )
+
+    parser.add_argument(
+        '--cache-driver',
+        action='store_true',
+        help='Reuse the patched chromedriver across runs'
+    )
+
+    parser.add_argument(
+        '--attach',
+        metavar='HOST:PORT',
+        help=(
+            "Attach to (or start) a Chrome with remote debugging "
+            "on this address and leave it running on exit"
+        )
+    )
+
+    parser.add_argument(
+        '--metrics-dir',
+        metavar='DIR',
+        help=(
+            "Export phase latencies and counters to DIR/metrics.jsonl "
+            "and DIR/metrics.prom"
+        )
+    )
+
+    parser.add_argument(
+        '--trace',
+        metavar='FILE',
+        help=(
+            "Trace every WebDriver command per operation and write a "
+            "Chrome trace JSON file to FILE"
+        )
+    )
+
+    parser.add_argument(
+        '--record',
+        metavar='FILE',
+        help=(
+            "Record every WebDriver command and response to FILE, "
+            "replayable without Chrome by testing.ReplayDriver"
+        )
+    )
+
     group = parser.add_mutually_exclusive_group()
     group.add_argument(
         '--messages',
@@ -67,13 +139,34 @@ def parse_args():
     return args
 
 
+def cli_settings(args) -> dict:
+    """
+    Settings given on the command line, they take precedence over the
+    .env. Flags that are not set leave the .env value in place.
+    """
+    overrides = {
+        'persist_user_data': True,
+        'mock': args.mock,
+        'pipeline': args.pipeline,
+        'batch': args.batch,
+        'cache_driver': args.cache_driver,
+        'debugger_address': args.attach,
+        'metrics_dir': args.metrics_dir,
+        'trace_path': args.trace,
+        'record_path': args.record,
+    }
+    return {key: value for key, value in overrides.items() if value}
+
+
 def run_all_tasks(session, duration=30 * 60):
-    import time
-    """Run all tasks for the specified duration (default: 30 minutes)."""
-    start_time = time.time()  # Record the start time
+    """
+    Run all tasks for the specified duration (default: 30 minutes)
+    of the current clock, see `tinder_ai.utils.clock.use_clock`.
+    """
+    start_time = clock.now()  # Record the start time
     logger.info("Starting all tasks for 30 minutes...")
 
-    while time.time() - start_time < duration:
+    while clock.now() - start_time < duration:
         # Step 1: Swipe (finite amount)
         logger.info("Starting swiping...")
         session.start_swiping()
@@ -86,20 +179,35 @@ def run_all_tasks(session, duration=30 * 60):
             logger.info("Handling unread messages...")
             session.handle_unread_messages()
 
+            # Export progress, a long run can be followed live
+            session.export_metrics()
+
             # Check if 30 minutes have passed after each cycle
-            if time.time() - start_time >= duration:
+            if clock.now() - start_time >= duration:
                 logger.info("Time's up! Ending all tasks.")
                 return  # Exit the function
 
             # Optional: Add a small delay between cycles (e.g., 5 seconds)
-            time.sleep(5)
+            clock.sleep(5)
 
 
 def main():
     """Main entry point"""
 
     args = parse_args()
-    settings = Settings()
+
+    # Imported after parsing, so --help and usage errors
+    # do not pay for loading Selenium and the services.
+    from tinder_ai.session import Session
+    from tinder_ai.services.messenger_api import (
+        MockMessengerService,
+        MessengerService
+    )
+    from tinder_ai.services.messenger_cache import CachedMessengerService
+    from tinder_ai.services.store import ProfileStore
+    from tinder_ai.settings import Settings
+
+    settings = Settings(**cli_settings(args))
 
     configure_logger(level=logging.DEBUG if args.debug else logging.INFO)
     logger.info(
@@ -108,15 +216,27 @@ def main():
 
     if api := settings.get_messenger_api():
         messenger_service = MessengerService(
-            base_url=api
+            base_url=api,
+            delta_replies=settings.messenger_api_delta
         )
     else:
         messenger_service = MockMessengerService()
 
+    if args.cache_replies:
+        messenger_service = CachedMessengerService(
+            messenger_service,
+            path=Session.USER_DATA_DIR / "responses.sqlite3"
+        )
+
+    profile_store = None
+    if args.cache_profiles:
+        profile_store = ProfileStore(
+            path=Session.USER_DATA_DIR / "profiles.sqlite3"
+        )
+
     with Session(
         settings=settings,
-        persist_user_data=True,
-        mock=args.mock,
+        profile_store=profile_store,
         messenger_service=messenger_service
     ) as session:
         try:
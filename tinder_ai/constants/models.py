@@ -1,5 +1,7 @@
 import enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict
+from tinder_ai.utils.metrics import METRICS, MetricsRegistry
 
 
 @dataclass
@@ -13,7 +15,35 @@ class SessionData:
     sent_openings: int = 0
     sent_replies: int = 0
 
+    # Startup phase -> seconds, phases may overlap
+    startup_timings: Dict[str, float] = field(default_factory=dict)
+    # Phase latencies and timeout/refresh/retry counters
+    metrics: MetricsRegistry = field(
+        default_factory=lambda: METRICS, repr=False
+    )
+
+    def counters(self) -> Dict[str, int]:
+        """The plain counters, e.g. for exporting as gauges."""
+        return {
+            'duration': self.duration,
+            'likes': self.likes,
+            'dislikes': self.dislikes,
+            'superlikes': self.superlikes,
+            'matches': self.matches,
+            'sent_openings': self.sent_openings,
+            'sent_replies': self.sent_replies,
+        }
+
     def __str__(self) -> str:
+        startup = "".join(
+            f"   {phase:<11}: {seconds:.2f} seconds\n"
+            for phase, seconds in self.startup_timings.items()
+        )
+        if startup:
+            startup = f"  Startup\n{startup}\n"
+        latency = self.metrics.summary()
+        if latency:
+            startup += f"  Latency\n{latency}\n\n"
         return (
             f"  Session:\n"
             f"   Duration   : {self.duration} seconds\n"
@@ -24,6 +54,7 @@ class SessionData:
             f"  Messages\n"
             f"   Openings   : {self.sent_openings}\n"
             f"   Replies    : {self.sent_replies}\n\n"
+            f"{startup}"
         )
 
 
@@ -0,0 +1,211 @@
+from selenium.webdriver.common.by import By
+from tinder_ai.utils.selectors import SelectorRegistry
+
+
+SELECTORS = SelectorRegistry()
+register = SELECTORS.register
+
+
+# Session
+register(
+    'session.matches_tab',
+    (By.XPATH, '//button[contains(text(), "Matches")]')
+)
+register(
+    'session.messages_tab',
+    (By.XPATH, '//button[contains(text(), "Messages")]')
+)
+register(
+    'session.like_button',
+    (By.XPATH,
+     "//button[contains(@class, 'gamepad-button')]"
+     "[.//span[contains(@class, 'Hidden') and text()='Like']]")
+)
+register(
+    'session.dislike_button',
+    (By.XPATH,
+     "//button[contains(@class, 'gamepad-button')]"
+     "[.//span[contains(@class, 'Hidden') and "
+     "(text()='Nope' or text()='No')]]")
+)
+register('session.item_link', (By.CSS_SELECTOR, "a[href*='{item_id}']"))
+register('session.match_list_item', (By.CSS_SELECTOR, "a.matchListItem"))
+register('session.message_list_item', (By.CSS_SELECTOR, "a.messageListItem"))
+register(
+    'session.message_preview',
+    (By.CSS_SELECTOR, "div.messageListItem__message")
+)
+register('session.sent_icon', (By.TAG_NAME, "svg"))
+
+
+# Match
+register(
+    'match.profile_content',
+    (By.XPATH, "//div[contains(@class, 'profileContent')]")
+)
+register(
+    'match.conversation',
+    (By.XPATH, "//div[contains(@aria-label, 'Conversation history')]")
+)
+register(
+    'match.close_button',
+    (By.CSS_SELECTOR, "a[href='/app/matches'] div.close")
+)
+register(
+    'match.message_input',
+    (By.XPATH, "//textarea[@placeholder='Type a message']")
+)
+register('match.msg_helper', (By.CLASS_NAME, "msgHelper"))
+register('match.msg', (By.CLASS_NAME, "msg"))
+register('match.msg_text', (By.CLASS_NAME, "text"))
+register('match.msg_parent', (By.XPATH, "./parent::div"))
+
+
+# Profile fields, relative to 'match.profile_content'
+register(
+    'profile.name',
+    (By.XPATH, ".//h1[contains(@class, 'Typs(display-2-strong)')]/span[1]")
+)
+register(
+    'profile.age',
+    (By.XPATH, ".//h1[contains(@class, 'Typs(display-2-strong)')]/span[2]")
+)
+register(
+    'profile.bio',
+    (By.XPATH,
+     ".//div[contains(@class, "
+     "'C($c-ds-text-primary) Typs(body-1-regular)')]")
+)
+register(
+    'profile.looking_for_section',
+    (By.XPATH,
+     ".//div[contains(@class, 'P(24px)') and "
+     ".//div[text()='Looking for']]")
+)
+register(
+    'profile.looking_for_value',
+    (By.XPATH, ".//span[contains(@class, 'Typs(display-3-strong)')]")
+)
+register(
+    'profile.location',
+    (By.XPATH,
+     ".//div[contains(@class, 'Typs(body-1-regular)') "
+     "and contains(text(), 'Lives in')]/following-sibling::div")
+)
+register(
+    'profile.distance',
+    (By.XPATH,
+     ".//div[contains(@class, 'D(b) W(100%)')]"
+     "//div[contains(@class, 'Typs(body-1-regular)') and "
+     "contains(text(), 'kilometers away')]")
+)
+register(
+    'profile.essentials',
+    (By.XPATH,
+     "//div[contains(text(), 'Essentials')]"
+     "/ancestor::div[contains(@class, 'P(24px)')]")
+)
+register(
+    'profile.interests',
+    (By.XPATH,
+     ".//div[contains(@class, 'passions')]"
+     "//span[contains(@class, 'passions-shared')]")
+)
+register(
+    'profile.lifestyle_section',
+    (By.XPATH,
+     ".//div[contains(@class, 'P(24px)') "
+     "and .//div[text()='Lifestyle']]")
+)
+register(
+    'profile.lifestyle_items',
+    (By.XPATH, ".//div[contains(@class, 'D(b) W(100%)')]")
+)
+register(
+    'profile.lifestyle_category',
+    (By.XPATH, ".//h3[contains(@class, 'Typs(subheading-2)')]")
+)
+register(
+    'profile.lifestyle_value',
+    (By.XPATH, ".//div[contains(@class, 'Typs(body-1-regular)')]")
+)
+
+
+# Login
+register('login.login_button', (By.XPATH, "//a[contains(., 'Log in')]"))
+register(
+    'login.google_button',
+    (By.XPATH, '//*[@aria-label="Log in with Google"]')
+)
+register(
+    'login.facebook_button',
+    (By.XPATH, '//*[@aria-label="Log in with Facebook"]')
+)
+register('login.google_email', (By.XPATH, "//input[@type='email']"))
+register('login.google_password', (By.XPATH, "//input[@type='password']"))
+register('login.facebook_email', (By.XPATH, '//*[@id="email"]'))
+register('login.facebook_password', (By.XPATH, '//*[@id="pass"]'))
+register('login.facebook_submit', (By.XPATH, '//*[@id="loginbutton"]'))
+register(
+    'login.continue_as',
+    (By.XPATH, '//div[starts-with(@aria-label, "Continue as")]')
+)
+register('login.cookie_buttons', (By.XPATH, '//*[@type="button"]'))
+register(
+    'login.accept_cookies',
+    (By.XPATH,
+     '//*[@type="button"]'
+     '[contains(translate(., "ACEPT", "acept"), "accept")]')
+)
+register('login.button_label', (By.XPATH, './/span'))
+
+
+# Preferences
+register('preferences.profile_link', (By.XPATH, '//*[@href="/app/profile"]'))
+register(
+    'preferences.distance_handle',
+    (By.XPATH,
+     '//div[@role="slider" and '
+     '@aria-label="Maximum distance in kilometers"]')
+)
+register(
+    'preferences.slider_rail',
+    (By.XPATH, '//*[@data-testid="slider-rail"]')
+)
+register(
+    'preferences.min_age_handle',
+    (By.XPATH, '//*[@data-testid="min-age-handle"]')
+)
+register(
+    'preferences.max_age_handle',
+    (By.XPATH, '//*[@data-testid="max-age-handle"]')
+)
+register(
+    'preferences.looking_for_button',
+    (By.XPATH,
+     "//button[@aria-label='Looking for' and "
+     "not(@data-id) and not(@data-route)]")
+)
+register(
+    'preferences.looking_for_list',
+    (By.XPATH, "//ul[contains(@class, 'List')]")
+)
+register('preferences.checkboxes', (By.XPATH, "//input[@type='checkbox']"))
+register('preferences.checkbox_label', (By.XPATH, "//label[@for='{id}']"))
+register(
+    'preferences.gender_option',
+    (By.XPATH, "//label[contains(., '{value}')]")
+)
+register(
+    'preferences.global_toggle',
+    (By.XPATH, '//input[@name="global" and @type="checkbox"]')
+)
+register(
+    'preferences.my_profile_link',
+    (By.XPATH,
+     "//a[@title='My Profile' and contains(@href, '/app/profile')]")
+)
+register(
+    'preferences.back_link',
+    (By.XPATH, "//a[@title='Back' and contains(@href, '/app/recs')]")
+)
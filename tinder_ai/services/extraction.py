@@ -0,0 +1,236 @@
+from tinder_ai.constants.selectors import SELECTORS
+from tinder_ai.shared import Message
+from tinder_ai.utils.dom import LocalElement, parse_html
+
+from logging import getLogger
+from typing import Optional, List, Tuple
+
+
+logger = getLogger(__name__)
+
+
+# XPaths evaluated relative to the 'profileContent' container,
+# taken from the selector registry so the in-page scripts and the
+# per-field WebDriver lookups in `Match` stay in sync.
+PROFILE_XPATHS = {
+    key: SELECTORS.xpath(f'profile.{key}')
+    for key in (
+        'name', 'age', 'bio', 'looking_for_section', 'looking_for_value',
+        'location', 'distance', 'essentials', 'interests',
+        'lifestyle_section', 'lifestyle_items', 'lifestyle_category',
+        'lifestyle_value',
+    )
+}
+
+
+# Collects every profile field (and optionally the conversation)
+# in a single `execute_script` call instead of one WebDriver
+# round trip per element lookup.
+#
+# arguments[0]: profileContent element, or null to only read messages
+# arguments[1]: conversation history element or null
+# arguments[2]: PROFILE_XPATHS
+PROFILE_EXTRACTION_SCRIPT = """
+const root = arguments[0];
+const chat = arguments[1];
+const xp = arguments[2];
+
+const first = (ctx, path) => document.evaluate(
+    path, ctx, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+const all = (ctx, path) => {
+    const res = document.evaluate(
+        path, ctx, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    const nodes = [];
+    for (let i = 0; i < res.snapshotLength; i++) {
+        nodes.push(res.snapshotItem(i));
+    }
+    return nodes;
+};
+const text = (node) => node ? (node.innerText || '') : null;
+
+const lookingFor = root ? first(root, xp.looking_for_section) : null;
+const lifestyleSection = root ? first(root, xp.lifestyle_section) : null;
+const lifestyle = [];
+if (lifestyleSection) {
+    for (const item of all(lifestyleSection, xp.lifestyle_items)) {
+        const category = first(item, xp.lifestyle_category);
+        const value = first(item, xp.lifestyle_value);
+        if (category && value) {
+            lifestyle.push([text(category), text(value)]);
+        }
+    }
+}
+
+let messages = null;
+if (chat) {
+    messages = [];
+    for (const helper of chat.getElementsByClassName('msgHelper')) {
+        const msg = helper.getElementsByClassName('msg')[0];
+        const body = msg ? msg.getElementsByClassName('text')[0] : null;
+        if (!body) {
+            continue;
+        }
+        const parent = helper.parentElement;
+        messages.push([
+            text(body),
+            parent ? (parent.getAttribute('class') || '') : ''
+        ]);
+    }
+}
+
+if (!root) {
+    return {messages: messages};
+}
+
+return {
+    name: text(first(root, xp.name)),
+    age: text(first(root, xp.age)),
+    bio: text(first(root, xp.bio)),
+    looking_for: lookingFor
+        ? text(first(lookingFor, xp.looking_for_value))
+        : null,
+    location: text(first(root, xp.location)),
+    distance: text(first(root, xp.distance)),
+    essentials: text(first(root, xp.essentials)),
+    interests: all(root, xp.interests).map(text),
+    lifestyle: lifestyle,
+    messages: messages
+};
+"""
+
+
+# Serializes the profile and conversation subtrees in one round trip,
+# so the per-field lookups can run in-process on a local copy.
+SNAPSHOT_SCRIPT = """
+return [
+    arguments[0] ? arguments[0].outerHTML : null,
+    arguments[1] ? arguments[1].outerHTML : null
+];
+"""
+
+
+def capture_snapshot(
+    browser, profile_content, chat_content=None
+) -> Tuple[Optional[LocalElement], Optional[LocalElement]]:
+    """
+    Fetch the 'outerHTML' of the profile and conversation containers
+    in a single `execute_script` call and parse them locally.
+
+    :param browser: Chrome instance.
+    :param profile_content: The 'profileContent' WebElement, may be None.
+    :param chat_content: The conversation history WebElement.
+    :return: Local copies of both containers, None where not given.
+    :raises ImportError: If lxml is not installed.
+    """
+    profile_html, chat_html = browser.execute_script(
+        SNAPSHOT_SCRIPT, profile_content, chat_content
+    )
+    return (
+        parse_html(profile_html) if profile_html else None,
+        parse_html(chat_html) if chat_html else None
+    )
+
+
+class ScriptExtractor:
+    """
+    Extracts a match profile in one WebDriver round trip.
+
+    The profile subtree is walked in-page by `PROFILE_EXTRACTION_SCRIPT`
+    and the raw strings it returns are normalized into the same
+    dictionary shape the per-field `Match._extract_*` methods produce,
+    so the result can be fed straight into `MatchProfile`.
+    """
+
+    def __init__(self, browser) -> None:
+        self.browser = browser
+
+    def extract(self, profile_content, chat_content=None) -> dict:
+        """
+        Extract all profile fields and, if `chat_content` is given,
+        the last messages.
+
+        :param profile_content: The 'profileContent' WebElement.
+        :param chat_content: The conversation history WebElement.
+        :return: Profile data without the 'match_id' key.
+        :raises ValueError: If the script returned an unexpected payload.
+        """
+        raw = self.browser.execute_script(
+            PROFILE_EXTRACTION_SCRIPT,
+            profile_content,
+            chat_content,
+            PROFILE_XPATHS
+        )
+        if not isinstance(raw, dict):
+            raise ValueError(
+                f"Unexpected extraction script result: {raw!r}"
+            )
+
+        data = self._normalize(raw)
+        if chat_content is not None:
+            data['last_messages'] = self._normalize_messages(
+                raw.get('messages')
+            )
+        return data
+
+    def extract_messages(self, chat_content) -> Optional[List[Message]]:
+        """
+        Extract only the last messages of a conversation.
+
+        :param chat_content: The conversation history WebElement.
+        """
+        raw = self.browser.execute_script(
+            PROFILE_EXTRACTION_SCRIPT, None, chat_content, PROFILE_XPATHS
+        )
+        if not isinstance(raw, dict):
+            raise ValueError(
+                f"Unexpected extraction script result: {raw!r}"
+            )
+        return self._normalize_messages(raw.get('messages'))
+
+    @staticmethod
+    def _normalize(raw: dict) -> dict:
+        """Map the raw script payload onto `MatchProfile` fields."""
+        def clean(value: Optional[str]) -> Optional[str]:
+            return value.strip() if value is not None else None
+
+        name, age = clean(raw.get('name')), clean(raw.get('age'))
+        if name is None or age is None:
+            # Like `Match._extract_basic_info`, which needs both
+            name = age = None
+        essentials = (raw.get('essentials') or '').strip().splitlines()
+
+        return {
+            'name': name,
+            'age': int(age) if age and age.isdigit() else None,
+            'bio': clean(raw.get('bio')),
+            'looking_for': clean(raw.get('looking_for')),
+            'location': clean(raw.get('location')),
+            'distance': clean(raw.get('distance')),
+            'essentials': essentials[1:] if len(essentials) > 1 else [],
+            'interests': [
+                interest.strip() for interest in raw.get('interests') or []
+            ],
+            'lifestyle': {
+                category.strip(): value.strip()
+                for category, value in raw.get('lifestyle') or []
+            },
+        }
+
+    @staticmethod
+    def _normalize_messages(raw_messages) -> Optional[List[Message]]:
+        """Convert raw [text, parent_class] pairs into messages."""
+        messages = []
+        for text, parent_classes in raw_messages or []:
+            text = (text or '').strip()
+            if not text:
+                continue
+            messages.append(
+                Message(
+                    message=text,
+                    # Ta(start) indicates received message
+                    is_received='Ta(start)' in (parent_classes or '')
+                )
+            )
+        return messages if messages else None
@@ -1,42 +1,145 @@
 import requests
+from tinder_ai.utils import clock
 from logging import getLogger
-from typing import Tuple, Optional
+from pathlib import Path
+from typing import Dict, Tuple, Optional, Union
+import hashlib
+import json
+import os
 
 logger = getLogger(__name__)
 
+DEFAULT_RESOLVER_URL = "https://ipinfo.io"
+# Short connect timeout: an unreachable resolver should fail fast
+# and fall back to the cache instead of holding up startup.
+REQUEST_TIMEOUT = (3.05, 10)
+
+
+class GeoCache:
+    """
+    An on-disk cache of resolved proxy locations.
+
+    Entries are keyed by a hash of the proxy URL, so proxy credentials
+    never end up on disk. Entries older than `ttl` seconds count as
+    stale: they are not used while the resolver is reachable, but
+    still serve as an offline fallback.
+    """
+
+    DEFAULT_TTL = 6 * 60 * 60
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl: float = DEFAULT_TTL
+    ) -> None:
+        """
+        :param path: JSON file to persist to, in memory only if None.
+        :param ttl: Seconds an entry stays fresh.
+        """
+        self.path = Path(path) if path is not None else None
+        self.ttl = ttl
+        self._entries: Dict[str, dict] = self._load()
+
+    @staticmethod
+    def key(proxy_url: str) -> str:
+        return hashlib.sha256(proxy_url.encode("utf-8")).hexdigest()
+
+    def get(
+        self, proxy_url: str, allow_stale: bool = False
+    ) -> Optional[dict]:
+        """
+        The cached entry of a proxy ({"ip", "lat", "lon", "resolved_at"}),
+        None if missing or stale and `allow_stale` is not set.
+        """
+        entry = self._entries.get(self.key(proxy_url))
+        if entry is None:
+            return None
+        if not allow_stale and clock.now() - entry["resolved_at"] > self.ttl:
+            return None
+        return entry
+
+    def put(
+        self, proxy_url: str, ip: Optional[str], lat: float, lon: float
+    ) -> None:
+        self._entries[self.key(proxy_url)] = {
+            "ip": ip,
+            "lat": lat,
+            "lon": lon,
+            "resolved_at": clock.now(),
+        }
+        self._save()
+
+    def _load(self) -> Dict[str, dict]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.info(f"Ignoring unreadable geo cache {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            partial = self.path.with_suffix(".partial")
+            partial.write_text(json.dumps(self._entries), encoding="utf-8")
+            os.replace(partial, self.path)
+        except OSError as e:
+            logger.info(f"Unable to write geo cache {self.path}: {e}")
+
 
 class LocationService:
-    def __init__(self, browser, settings) -> None:
+    def __init__(
+        self,
+        browser,
+        settings,
+        resolver_url: str = DEFAULT_RESOLVER_URL,
+        cache: Optional[GeoCache] = None
+    ) -> None:
         """
         Initialize the LocationService with a browser instance and settings.
 
-        :param browser: Selenium WebDriver instance (e.g., Chrome).
+        :param browser: Selenium WebDriver instance (e.g., Chrome),
+            only needed once the location is applied.
         :param settings: Settings instance containing coordinates, proxy, etc.
+        :param resolver_url: Base URL of an ipinfo.io compatible service.
+        :param cache: Cache of resolved proxy locations,
+            in memory only if None.
         """
         self.browser = browser
         self.settings = settings
         self.proxy_url = settings.proxy_url
+        self.resolver_url = resolver_url.rstrip("/")
+        self.cache = cache if cache is not None else GeoCache()
 
-    def get_public_ip(self) -> str:
+    @property
+    def proxies(self) -> Optional[Dict[str, str]]:
+        return {
+            "http": self.proxy_url,
+            "https": self.proxy_url
+        } if self.proxy_url else None
+
+    def get_public_ip(self) -> Optional[str]:
         """
         Fetch the public IP address using ipinfo.io.
 
         :return: Public IP address as a string, or None if unable to fetch.
         """
-        proxies = {
-            "http": self.proxy_url,
-            "https": self.proxy_url
-        } if self.proxy_url else None
+        data = self._lookup_self()
+        return data.get("ip") if data else None
 
+    def _lookup_self(self) -> Optional[dict]:
+        """The resolver's view of this client, i.e. the proxy egress."""
         try:
             response = requests.get(
-                "https://ipinfo.io/json",
-                proxies=proxies,
-                timeout=10
+                f"{self.resolver_url}/json",
+                proxies=self.proxies,
+                timeout=REQUEST_TIMEOUT
             )
             if response.status_code == 200:
-                data = response.json()
-                return data.get("ip")
+                return response.json()
             else:
                 logger.info(
                     f"Unable to fetch IP. Status Code: {response.status_code}"
@@ -55,20 +158,16 @@ class LocationService:
         :param ip_address: IP address to fetch coordinates for.
         :return: Tuple of (latitude, longitude) or None if unable to fetch.
         """
-        proxies = {
-            "http": self.proxy_url,
-            "https": self.proxy_url
-        } if self.proxy_url else None
-
         try:
-            url = f"https://ipinfo.io/{ip_address}/geo"
-            response = requests.get(url, proxies=proxies, timeout=10)
+            url = f"{self.resolver_url}/{ip_address}/geo"
+            response = requests.get(
+                url, proxies=self.proxies, timeout=REQUEST_TIMEOUT
+            )
             if response.status_code == 200:
                 data = response.json()
-                loc = data.get("loc")
-                if loc:
-                    lat_str, lon_str = loc.split(",")
-                    return float(lat_str), float(lon_str)
+                coords = self._parse_loc(data)
+                if coords:
+                    return coords
                 else:
                     logger.info(
                         "'loc' field not found in ipinfo response. "
@@ -84,6 +183,53 @@ class LocationService:
 
         return None
 
+    @staticmethod
+    def _parse_loc(data: dict) -> Optional[Tuple[float, float]]:
+        loc = data.get("loc")
+        if not loc:
+            return None
+        lat_str, lon_str = loc.split(",")
+        return float(lat_str), float(lon_str)
+
+    def resolve_proxy_location(self) -> Optional[Tuple[float, float]]:
+        """
+        Coordinates of the proxy's egress IP.
+
+        1. A fresh cache entry is used without any request.
+        2. Otherwise the resolver is asked, usually a single request
+           since its /json response already contains the location.
+        3. If the resolver is unreachable, the last known location is
+           used regardless of its age.
+
+        :return: Tuple of (latitude, longitude) or None.
+        """
+        cached = self.cache.get(self.proxy_url)
+        if cached:
+            logger.info(f"Using cached proxy location of {cached['ip']}")
+            return cached["lat"], cached["lon"]
+
+        data = self._lookup_self()
+        if data:
+            ip_address = data.get("ip")
+            coords = self._parse_loc(data)
+            if coords is None and ip_address:
+                coords = self.get_coordinates_from_ip(ip_address)
+            if coords:
+                self.cache.put(self.proxy_url, ip_address, *coords)
+                return coords
+            logger.info("Could not retrieve coordinates from ipinfo.io.")
+        else:
+            logger.info("Could not retrieve IP via ipinfo.io/json.")
+
+        stale = self.cache.get(self.proxy_url, allow_stale=True)
+        if stale:
+            logger.info(
+                f"Resolver unavailable, using last known location "
+                f"of {stale['ip']}"
+            )
+            return stale["lat"], stale["lon"]
+        return None
+
     def set_custom_location(
         self, latitude, longitude, accuracy="100%"
     ) -> None:
@@ -110,40 +256,47 @@ class LocationService:
             f"lat={latitude}, lon={longitude}, acc={accuracy_value}%"
         )
 
-    def configure_location(self) -> None:
+    def resolve_location(self) -> Optional[Tuple[float, float]]:
         """
-        Configure the browser's geolocation based on settings or proxy.
+        Determine the coordinates to use, without touching the browser.
 
         1. Use provided coordinates if available.
-        2. If a proxy is set, fetch the public IP and coordinates,
-           then set them.
-        3. Skip if no data is available.
+        2. If a proxy is set, resolve its coordinates
+           (see `resolve_proxy_location`).
+        3. None if no data is available.
         """
         lat, lon = self.settings.location_lat, self.settings.location_lon
         if lat and lon:
             logger.info(f"Using provided coordinates: {lat}, {lon}")
-            self.set_custom_location(lat, lon)
-            return
+            return lat, lon
 
         if self.proxy_url:
-            ip_address = self.get_public_ip()
-            if ip_address:
-                coords = self.get_coordinates_from_ip(ip_address)
-                if coords:
-                    lat, lon = coords
-                    logger.info(
-                        "Setting location based on proxy "
-                        f"IP coords: {lat}, {lon}"
-                    )
-                    self.set_custom_location(lat, lon)
-                    return
-                else:
-                    logger.info(
-                        "Could not retrieve coordinates from ipinfo.io."
-                    )
-            else:
-                logger.info("Could not retrieve IP via ipinfo.io/json.")
+            coords = self.resolve_proxy_location()
+            if coords:
+                logger.info(
+                    "Setting location based on proxy "
+                    f"IP coords: {coords[0]}, {coords[1]}"
+                )
+                return coords
         else:
             logger.info("No proxy configured and no coordinates provided.")
+        return None
 
-        logger.info("Skipping custom geolocation override.")
+    def apply_location(
+        self, coords: Optional[Tuple[float, float]]
+    ) -> None:
+        """Override the browser's geolocation, skipped if None."""
+        if coords is None:
+            logger.info("Skipping custom geolocation override.")
+            return
+        self.set_custom_location(*coords)
+
+    def configure_location(self) -> None:
+        """
+        Configure the browser's geolocation based on settings or proxy.
+
+        Resolving only needs the network, so callers that want to
+        overlap it with starting the browser can call
+        `resolve_location` and `apply_location` separately.
+        """
+        self.apply_location(self.resolve_location())
@@ -1,14 +1,13 @@
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
 from selenium.common.exceptions import (
     TimeoutException,
     ElementClickInterceptedException,
-    NoSuchElementException,
     NoSuchWindowException
 )
 from selenium.webdriver.common.keys import Keys
-import time
+from tinder_ai.constants.selectors import SELECTORS
+from tinder_ai.utils.readiness import wait_for_any, wait_for_new_window
+from tinder_ai.utils.tracing import traced
 from logging import getLogger
 from selenium.webdriver.common.action_chains import ActionChains
 
@@ -24,12 +23,15 @@ class LoginService:
     Attributes:
         WEBDRIVER_WAIT_TIME (int):
             The maximum wait time for web elements to be interactable.
+        POPUP_WAIT_TIME (int):
+            The maximum wait time for the OAuth popup window to open.
         browser (WebDriver):
             The Selenium WebDriver instance.
         main_window_handle (str):
             The handle of the main browser window.
     """
     WEBDRIVER_WAIT_TIME = 10
+    POPUP_WAIT_TIME = 15
 
     def __init__(self, browser) -> None:
         self.browser = browser
@@ -55,10 +57,10 @@ class LoginService:
                 If an error occurs while attempting to click the login button.
         """
         try:
-            xpath = "//a[contains(., 'Log in')]"
-
-            wait = WebDriverWait(self.browser, self.WEBDRIVER_WAIT_TIME)
-            button = wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
+            button = SELECTORS.find(
+                self.browser, 'login.login_button',
+                timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
+            )
 
             # Ensure the button is displayed before interacting
             if button.is_displayed():
@@ -77,6 +79,7 @@ class LoginService:
                 f"{e} occurred while clicking the login button."
             )
 
+    @traced()
     def login_by_google(self, email, password) -> bool:
         """
         Logs in to the application using Google authentication.
@@ -98,11 +101,9 @@ class LoginService:
         self._click_login_button()
 
         try:
-            xpath = '//*[@aria-label="Log in with Google"]'
-            google_button = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.element_to_be_clickable((By.XPATH, xpath))
+            google_button = SELECTORS.find(
+                self.browser, 'login.google_button',
+                timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
             )
             actions = ActionChains(self.browser)
             actions.move_to_element(google_button).click().perform()
@@ -116,21 +117,17 @@ class LoginService:
             return False
 
         try:
-            email_xpath = "//input[@type='email']"
-            email_field = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.presence_of_element_located((By.XPATH, email_xpath))
+            email_field = SELECTORS.find(
+                self.browser, 'login.google_email',
+                timeout=self.WEBDRIVER_WAIT_TIME
             )
             email_field.send_keys(email)
             email_field.send_keys(Keys.ENTER)
             logger.info("Entered email and proceeded.")
 
-            password_xpath = "//input[@type='password']"
-            password_field = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.presence_of_element_located((By.XPATH, password_xpath))
+            password_field = SELECTORS.find(
+                self.browser, 'login.google_password',
+                timeout=self.WEBDRIVER_WAIT_TIME
             )
             password_field.send_keys(password)
             password_field.send_keys(Keys.ENTER)
@@ -148,6 +145,7 @@ class LoginService:
         logger.info("Switched focus back to the main window.")
         return True
 
+    @traced()
     def login_by_facebook(self, email, password) -> bool:
         """
         Logs into the application using Facebook credentials.
@@ -178,11 +176,9 @@ class LoginService:
 
         # Wait for Facebook login button
         try:
-            xpath = '//*[@aria-label="Log in with Facebook"]'
-            facebook_button = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.element_to_be_clickable((By.XPATH, xpath))
+            facebook_button = SELECTORS.find(
+                self.browser, 'login.facebook_button',
+                timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
             )
             actions = ActionChains(self.browser)
             actions.move_to_element(facebook_button).click().perform()
@@ -195,31 +191,40 @@ class LoginService:
         if not self._change_focus_to_pop_up():
             return False
 
-        if not self._click_continue_as():
+        # A remembered Facebook session shows "Continue as",
+        # otherwise the login form. One wait tells which.
+        try:
+            index, element = wait_for_any(
+                self.browser,
+                [
+                    SELECTORS.xpath('login.continue_as'),
+                    SELECTORS.xpath('login.facebook_email'),
+                ],
+                timeout=self.WEBDRIVER_WAIT_TIME
+            )
+        except TimeoutException:
+            logger.error("Facebook login popup did not load.")
+            raise
+
+        if index == 0:
+            ActionChains(
+                self.browser
+            ).move_to_element(element).click().perform()
+            logger.info("Clicked 'Continue as' button.")
+        else:
             logger.info("Attempting manual login.")
             try:
-                xpath_email = '//*[@id="email"]'
-                xpath_password = '//*[@id="pass"]'
-                xpath_button = '//*[@id="loginbutton"]'
-
-                email_field = WebDriverWait(
-                    self.browser, self.WEBDRIVER_WAIT_TIME
-                ).until(
-                    EC.presence_of_element_located((By.XPATH, xpath_email))
-                )
-                email_field.send_keys(email)
+                element.send_keys(email)
 
-                password_field = WebDriverWait(
-                    self.browser, self.WEBDRIVER_WAIT_TIME
-                ).until(
-                    EC.presence_of_element_located((By.XPATH, xpath_password))
+                password_field = SELECTORS.find(
+                    self.browser, 'login.facebook_password',
+                    timeout=self.WEBDRIVER_WAIT_TIME
                 )
                 password_field.send_keys(password)
 
-                login_button = WebDriverWait(
-                    self.browser, self.WEBDRIVER_WAIT_TIME
-                ).until(
-                    EC.element_to_be_clickable((By.XPATH, xpath_button))
+                login_button = SELECTORS.find(
+                    self.browser, 'login.facebook_submit',
+                    timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
                 )
                 login_button.click()
                 logger.info("Manual email/password login successful.")
@@ -232,59 +237,35 @@ class LoginService:
         self._change_focus_to_main_window()
         return True
 
+    @traced()
     def _accept_cookies(self) -> None:
         """
-        Attempts to accept cookies on a webpage by
-        clicking the appropriate button.
-
-        This method waits for buttons to be clickable,
-        then iterates through them to find
-        one that either has a span element with text
-        indicating acceptance or has HTML
-        content suggesting it is an accept button.
-        If found, the button is clicked to accept cookies.
-
-        Exceptions:
-            - NoSuchElementException:
-                If an element is not found during the process.
-            - TimeoutException:
-                If the buttons do not become clickable
-                within the specified wait time.
-            - Exception:
-                For any other unexpected errors during the process.
+        Accepts cookies if the page shows a cookie banner.
+
+        A single in-page wait resolves as soon as the page renders its
+        first button, with the accept button if there is one (a button
+        whose text contains "accept"), which is then clicked.
 
         Logs:
             - Logs a message when cookies are successfully accepted.
-            - Logs a message if the loading
-              takes too much time and the element is not present.
+            - Logs a message if the page did not render any button
+              within the wait time.
             - Logs any other errors encountered during the process.
         """
         try:
-            xpath = '//*[@type="button"]'
-            WebDriverWait(self.browser, self.WEBDRIVER_WAIT_TIME).until(
-                EC.element_to_be_clickable((By.XPATH, xpath))
+            index, button = wait_for_any(
+                self.browser,
+                [
+                    SELECTORS.xpath('login.accept_cookies'),
+                    SELECTORS.xpath('login.cookie_buttons'),
+                ],
+                timeout=self.WEBDRIVER_WAIT_TIME
             )
-            buttons = self.browser.find_elements(By.XPATH, xpath)
-            for button in buttons:
-                try:
-                    try:
-                        text_span = button.find_element(
-                            By.XPATH, './/span'
-                        ).text
-                    except NoSuchElementException:
-                        text_span = button.text
-
-                    button_html = button.get_attribute('outerHTML')
-                    if (
-                        'accept' in text_span.lower()
-                        or
-                        'i accept' in button_html.lower()
-                    ):
-                        button.click()
-                        logger.info("COOKIES ACCEPTED.")
-                        break
-                except NoSuchElementException:
-                    pass
+            if index == 0:
+                button.click()
+                logger.info("COOKIES ACCEPTED.")
+            else:
+                logger.info("No cookie banner, continuing.")
 
         except TimeoutException:
             logger.info(
@@ -293,7 +274,7 @@ class LoginService:
                 "so we continue."
             )
         except Exception as e:
-            logger.info("Error while accepting cookies:", e)
+            logger.info(f"Error while accepting cookies: {e}")
 
     def _click_continue_as(self) -> None:
         """
@@ -310,11 +291,9 @@ class LoginService:
                 within the specified wait time.
         """
         try:
-            xpath_continue = '//div[starts-with(@aria-label, "Continue as")]'
-            continue_button = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.element_to_be_clickable((By.XPATH, xpath_continue))
+            continue_button = SELECTORS.find(
+                self.browser, 'login.continue_as',
+                timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
             )
             ActionChains(
                 self.browser
@@ -327,10 +306,9 @@ class LoginService:
         """
         Attempts to change the browser's focus to a popup window.
 
-        This method will retry up to 50 times, checking
-        for any new window handles
-        that are different from the main window handle.
-        If a popup window is found,
+        This method waits up to POPUP_WAIT_TIME seconds for a new
+        window handle that is different from the main window handle.
+        As soon as the popup window opens,
         it switches to that window and waits until the URL contains
         either "facebook" or "google" to ensure the popup is fully loaded.
 
@@ -340,28 +318,28 @@ class LoginService:
                 False otherwise.
         """
         main_window = self.browser.current_window_handle
-        for _ in range(50):  # Retry mechanism
-            handles = self.browser.window_handles
-            for handle in handles:
-                if handle != main_window:
-                    self.browser.switch_to.window(handle)
-                    logger.info(f"Switched to popup window: {handle}")
-
-                    # Ensure popup is loaded
-                    WebDriverWait(
-                        self.browser, self.WEBDRIVER_WAIT_TIME
-                    ).until(
-                        lambda driver: (
-                            "facebook" in driver.current_url
-                            or
-                            "google" in driver.current_url
-                        )
-                    )
-                    return True
-            time.sleep(0.3)
-
-        logger.error("Popup window not found.")
-        return False
+        try:
+            handle = wait_for_new_window(
+                self.browser, [main_window], timeout=self.POPUP_WAIT_TIME
+            )
+        except TimeoutException:
+            logger.error("Popup window not found.")
+            return False
+
+        self.browser.switch_to.window(handle)
+        logger.info(f"Switched to popup window: {handle}")
+
+        # Ensure popup is loaded
+        WebDriverWait(
+            self.browser, self.WEBDRIVER_WAIT_TIME
+        ).until(
+            lambda driver: (
+                "facebook" in driver.current_url
+                or
+                "google" in driver.current_url
+            )
+        )
+        return True
 
     def _change_focus_to_main_window(self) -> None:
         """
@@ -1,17 +1,21 @@
 from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from undetected_chromedriver import Chrome
 from tinder_ai.shared import MatchProfile, Message
+from tinder_ai.constants.selectors import SELECTORS
+from tinder_ai.services.extraction import ScriptExtractor, capture_snapshot
+from tinder_ai.utils import clock
+from tinder_ai.utils.dom import parse_html
+from tinder_ai.utils.readiness import wait_for_element
+from tinder_ai.utils.tracing import traced
 
 from logging import getLogger
-import time
 from urllib.parse import urlparse
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List, Literal
+
+if TYPE_CHECKING:
+    from undetected_chromedriver import Chrome
 
 
 logger = getLogger(__name__)
@@ -20,63 +24,101 @@ logger = getLogger(__name__)
 @dataclass
 class Match:
     match_id: str
-    browser: Chrome = field(default=None, repr=False)
+    browser: 'Chrome' = field(default=None, repr=False)
     profile: MatchProfile = field(
         default_factory=lambda: MatchProfile(match_id="")
     )
 
     @classmethod
-    def from_element(cls, element, browser, messages: bool = False) -> 'Match':
+    @traced()
+    def from_element(
+        cls,
+        element,
+        browser,
+        messages: bool = False,
+        extraction: Literal['script', 'local', 'webdriver'] = 'script',
+        cached_profile: Optional[MatchProfile] = None
+    ) -> 'Match':
         """Create a Match instance from a DOM element.
 
         Args:
             element: The DOM element (either match or message element)
             browser: Chrome instance
             messages: If True, extract last messages before closing profile
+            extraction: 'script' collects the whole profile in a single
+                `execute_script` round trip, 'local' fetches the
+                containers' outerHTML once and runs the per-field lookups
+                in-process (requires lxml). Both fall back to the
+                per-field WebDriver lookups on failure, 'webdriver'
+                always uses them.
+            cached_profile: A still fresh profile of this match. Profile
+                extraction is skipped and only the messages are read.
         """
         match = None
         try:
+            # The opened profile has to belong to the clicked element,
+            # not to a previously opened one that is still rendered
+            href = element.get_attribute('href') or ''
+            expected_id = urlparse(href).path.split('/')[-1] or None
+
             # Click the element to open profile
             element.click()
-            time.sleep(1)
+
+            if cached_profile is not None:
+                return cls._from_cached(
+                    cached_profile, browser, messages, extraction,
+                    expected_id
+                )
 
             # Wait for profile content
-            profile_content = WebDriverWait(browser, 10).until(
-                EC.visibility_of_element_located(
-                    (By.XPATH, "//div[contains(@class, 'profileContent')]")
+            with SELECTORS.timed('match.profile_content'):
+                profile_content = wait_for_element(
+                    browser,
+                    SELECTORS.xpath('match.profile_content'),
+                    timeout=10,
+                    visible=True,
+                    url_contains=expected_id
                 )
-            )
+
+            chat_content = None
+            if messages:
+                logger.debug("Getting last messages")
+                with SELECTORS.timed('match.conversation'):
+                    chat_content = wait_for_element(
+                        browser,
+                        SELECTORS.xpath('match.conversation'),
+                        timeout=5
+                    )
 
             # Extract match data
             profile_data = {
                 'match_id': urlparse(browser.current_url).path.split('/')[-1],
             }
 
-            # Extract all profile info
-            profile_data.update(cls._extract_basic_info(profile_content))
-            profile_data.update(cls._extract_bio(profile_content))
-            profile_data.update(cls._extract_looking_for(profile_content))
-            profile_data.update(
-                cls._extract_location_and_distance(profile_content)
-            )
-            profile_data.update(cls._extract_essentials(profile_content))
-            profile_data.update(cls._extract_interests(profile_content))
-            profile_data.update(cls._extract_lifestyle(profile_content))
-
-            # If messages flag is True, extract last messages
-            if messages:
-                logger.debug("Getting last messages")
-                chat_content = WebDriverWait(browser, 5).until(
-                    EC.presence_of_element_located(
-                        (By.XPATH,
-                         "//div[contains(@aria-label, 'Conversation history')]"
-                         )
+            extracted = None
+            if extraction == 'script':
+                try:
+                    extracted = ScriptExtractor(browser).extract(
+                        profile_content, chat_content
+                    )
+                except Exception as e:
+                    logger.debug(
+                        f"Script extraction failed, falling back: {e}"
+                    )
+            elif extraction == 'local':
+                try:
+                    profile_content, chat_content = capture_snapshot(
+                        browser, profile_content, chat_content
+                    )
+                except Exception as e:
+                    logger.debug(
+                        f"Snapshot capture failed, falling back: {e}"
                     )
-                )
 
-                profile_data['last_messages'] = cls._extract_last_messages(
-                    chat_content
-                )
+            if extracted is None:
+                extracted = cls._extract_all(profile_content, chat_content)
+
+            profile_data.update(extracted)
 
             # Create profile and match instance
             profile = MatchProfile(**profile_data)
@@ -92,12 +134,95 @@ class Match:
             logger.error(f"Error creating match from element: {e}")
             return cls(match_id="unknown", browser=browser)
 
+    @classmethod
+    def _from_cached(
+        cls,
+        cached_profile: MatchProfile,
+        browser,
+        messages: bool,
+        extraction: str,
+        expected_id: Optional[str]
+    ) -> 'Match':
+        """Reuse a cached profile, only refreshing the conversation."""
+        locator = 'match.conversation' if messages else 'match.message_input'
+        with SELECTORS.timed(locator):
+            chat_content = wait_for_element(
+                browser,
+                SELECTORS.xpath(locator),
+                timeout=10,
+                url_contains=expected_id
+            )
+
+        last_messages = None
+        if messages:
+            logger.debug("Using cached profile, getting last messages")
+            last_messages = cls._extract_messages_only(
+                browser, chat_content, extraction
+            )
+
+        profile = cached_profile.model_copy(
+            update={'last_messages': last_messages}
+        )
+        return cls(
+            match_id=profile.match_id, browser=browser, profile=profile
+        )
+
+    @classmethod
+    def _extract_messages_only(
+        cls, browser, chat_content, extraction: str
+    ) -> Optional[List[Message]]:
+        """Extract the conversation with the configured backend."""
+        if extraction == 'script':
+            try:
+                return ScriptExtractor(browser).extract_messages(
+                    chat_content
+                )
+            except Exception as e:
+                logger.debug(f"Script extraction failed, falling back: {e}")
+        elif extraction == 'local':
+            try:
+                _, chat_content = capture_snapshot(
+                    browser, None, chat_content
+                )
+            except Exception as e:
+                logger.debug(f"Snapshot capture failed, falling back: {e}")
+        return cls._extract_last_messages(chat_content)
+
+    @classmethod
+    def from_html(
+        cls,
+        profile_html: str,
+        chat_html: Optional[str] = None,
+        match_id: str = "",
+        browser=None
+    ) -> 'Match':
+        """Create a Match instance from saved HTML snapshots.
+
+        Runs the same per-field lookups as `from_element` on a local
+        parse of the markup, without any browser round trips.
+
+        Args:
+            profile_html: outerHTML of the 'profileContent' container
+            chat_html: outerHTML of the conversation history container
+            match_id: Id to assign to the profile
+            browser: Optional Chrome instance for later interactions
+        """
+        chat_content = parse_html(chat_html) if chat_html else None
+        profile_data = {'match_id': match_id}
+        profile_data.update(
+            cls._extract_all(parse_html(profile_html), chat_content)
+        )
+        profile = MatchProfile(**profile_data)
+        return cls(match_id=match_id, browser=browser, profile=profile)
+
+    @traced()
     def send_opener(self, message: str, mock: bool) -> bool:
         """
         Send an opener to the match.
         """
         return self._send_message(message=message, mock=mock, context="opener")
 
+    @traced()
     def send_reply(self, message: str, mock: bool) -> bool:
         """
         Send a reply to the match.
@@ -112,13 +237,13 @@ class Match:
         except Exception as e:
             logger.error(f"Error navigating to chat: {e}")
 
+    @traced()
     def close_profile(self) -> None:
         """Close the match profile view."""
         try:
-            close_button = WebDriverWait(self.browser, 10).until(
-                EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, "a[href='/app/matches'] div.close")
-                )
+            close_button = SELECTORS.find(
+                self.browser, 'match.close_button',
+                timeout=10, condition='clickable'
             )
             close_button.click()
             logger.debug(f"Closed profile for {self.profile.name}")
@@ -146,10 +271,8 @@ class Match:
             return True
 
         try:
-            message_input = WebDriverWait(self.browser, 10).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//textarea[@placeholder='Type a message']")
-                )
+            message_input = SELECTORS.find(
+                self.browser, 'match.message_input', timeout=10
             )
 
             actions = ActionChains(self.browser)
@@ -162,7 +285,7 @@ class Match:
                 f"{context.capitalize()} sent "
                 f"to {self.profile.name}: {message}"
             )
-            time.sleep(0.5)
+            clock.sleep(0.5)
             return True
         except Exception as e:
             logger.error(
@@ -170,24 +293,45 @@ class Match:
             )
             return False
 
+    @classmethod
+    def _extract_all(cls, profile_content, chat_content=None) -> dict:
+        """Extract the profile and, if given, the conversation."""
+        data = cls._extract_profile_fields(profile_content)
+        if chat_content is not None:
+            data['last_messages'] = cls._extract_last_messages(chat_content)
+        return data
+
+    @classmethod
+    def _extract_profile_fields(cls, profile_content) -> dict:
+        """Extract all profile info with one lookup per field."""
+        data = {}
+        data.update(cls._extract_basic_info(profile_content))
+        data.update(cls._extract_bio(profile_content))
+        data.update(cls._extract_looking_for(profile_content))
+        data.update(cls._extract_location_and_distance(profile_content))
+        data.update(cls._extract_essentials(profile_content))
+        data.update(cls._extract_interests(profile_content))
+        data.update(cls._extract_lifestyle(profile_content))
+        return data
+
     @staticmethod
     def _extract_last_messages(chat_content) -> Optional[List[Message]]:
         """Extract last few messages from conversation"""
         try:
             messages = []
             # Find all message helper containers
-            msg_helpers = chat_content.find_elements(
-                By.CLASS_NAME, "msgHelper"
+            msg_helpers = SELECTORS.find_all(
+                chat_content, 'match.msg_helper'
             )
 
             # Process each message helper
             for helper in msg_helpers:
                 try:
                     # Find the message container
-                    msg_div = helper.find_element(By.CLASS_NAME, "msg")
+                    msg_div = SELECTORS.find(helper, 'match.msg')
 
                     # Get the text content
-                    text_element = msg_div.find_element(By.CLASS_NAME, "text")
+                    text_element = SELECTORS.find(msg_div, 'match.msg_text')
                     message = text_element.text.strip()
 
                     # Skip empty messages
@@ -195,7 +339,7 @@ class Match:
                         continue
 
                     # Get parent div to check alignment
-                    parent = helper.find_element(By.XPATH, "./parent::div")
+                    parent = SELECTORS.find(helper, 'match.msg_parent')
                     parent_classes = parent.get_attribute('class')
 
                     # Ta(start) indicates received message
@@ -222,14 +366,8 @@ class Match:
         """Extract name and age."""
         data = {'name': None, 'age': None}
         try:
-            name_element = profile_content.find_element(
-                By.XPATH,
-                ".//h1[contains(@class, 'Typs(display-2-strong)')]/span[1]"
-            )
-            age_element = profile_content.find_element(
-                By.XPATH,
-                ".//h1[contains(@class, 'Typs(display-2-strong)')]/span[2]"
-            )
+            name_element = SELECTORS.find(profile_content, 'profile.name')
+            age_element = SELECTORS.find(profile_content, 'profile.age')
             data['name'] = name_element.text.strip()
             data['age'] = int(
                 age_element.text.strip()
@@ -242,11 +380,7 @@ class Match:
     def _extract_bio(profile_content) -> dict:
         """Extract bio."""
         try:
-            bio_element = profile_content.find_element(
-                By.XPATH,
-                ".//div[contains(@class, "
-                "'C($c-ds-text-primary) Typs(body-1-regular)')]"
-            )
+            bio_element = SELECTORS.find(profile_content, 'profile.bio')
             return {'bio': bio_element.text.strip()}
         except NoSuchElementException:
             logger.debug("Could not find bio element")
@@ -256,15 +390,11 @@ class Match:
     def _extract_looking_for(profile_content) -> dict:
         """Extract 'Looking For'."""
         try:
-            looking_for_section = profile_content.find_element(
-                By.XPATH,
-                ".//div[contains(@class, 'P(24px)') and "
-                ".//div[text()='Looking for']]"
+            looking_for_section = SELECTORS.find(
+                profile_content, 'profile.looking_for_section'
             )
-            main_preference = looking_for_section.find_element(
-                By.XPATH,
-                ".//span[contains(@class, "
-                "'Typs(display-3-strong)')]"
+            main_preference = SELECTORS.find(
+                looking_for_section, 'profile.looking_for_value'
             ).text.strip()
             return {'looking_for': main_preference}
         except NoSuchElementException:
@@ -276,21 +406,16 @@ class Match:
         """Extract location and distance."""
         data = {'location': None, 'distance': None}
         try:
-            location_element = profile_content.find_element(
-                By.XPATH,
-                ".//div[contains(@class, 'Typs(body-1-regular)') "
-                "and contains(text(), 'Lives in')]/following-sibling::div"
+            location_element = SELECTORS.find(
+                profile_content, 'profile.location'
             )
             data['location'] = location_element.text.strip()
         except NoSuchElementException:
             logger.debug("Could not find location element")
 
         try:
-            distance_element = profile_content.find_element(
-                By.XPATH,
-                ".//div[contains(@class, 'D(b) W(100%)')]"
-                "//div[contains(@class, 'Typs(body-1-regular)') and "
-                "contains(text(), 'kilometers away')]"
+            distance_element = SELECTORS.find(
+                profile_content, 'profile.distance'
             )
             data['distance'] = distance_element.text.strip()
         except NoSuchElementException:
@@ -301,10 +426,8 @@ class Match:
     def _extract_essentials(profile_content) -> dict:
         """Extract essentials."""
         try:
-            essentials_header = profile_content.find_element(
-                By.XPATH,
-                "//div[contains(text(), 'Essentials')]"
-                "/ancestor::div[contains(@class, 'P(24px)')]"
+            essentials_header = SELECTORS.find(
+                profile_content, 'profile.essentials'
             )
             essentials_text = essentials_header.text.splitlines()
             essentials = (
@@ -319,10 +442,8 @@ class Match:
     def _extract_interests(profile_content) -> dict:
         """Extract interests."""
         try:
-            interests_elements = profile_content.find_elements(
-                By.XPATH,
-                ".//div[contains(@class, 'passions')]"
-                "//span[contains(@class, 'passions-shared')]"
+            interests_elements = SELECTORS.find_all(
+                profile_content, 'profile.interests'
             )
             interests = [
                 interest.text.strip()
@@ -337,25 +458,20 @@ class Match:
     def _extract_lifestyle(profile_content) -> dict:
         """Extract lifestyle."""
         try:
-            lifestyle_section = profile_content.find_element(
-                By.XPATH,
-                ".//div[contains(@class, 'P(24px)') "
-                "and .//div[text()='Lifestyle']]"
+            lifestyle_section = SELECTORS.find(
+                profile_content, 'profile.lifestyle_section'
             )
-            lifestyle_items = lifestyle_section.find_elements(
-                By.XPATH,
-                ".//div[contains(@class, 'D(b) W(100%)')]"
+            lifestyle_items = SELECTORS.find_all(
+                lifestyle_section, 'profile.lifestyle_items'
             )
             lifestyle = {}
             for item in lifestyle_items:
                 try:
-                    category = item.find_element(
-                        By.XPATH,
-                        ".//h3[contains(@class, 'Typs(subheading-2)')]"
+                    category = SELECTORS.find(
+                        item, 'profile.lifestyle_category'
                     ).text.strip()
-                    value = item.find_element(
-                        By.XPATH,
-                        ".//div[contains(@class, 'Typs(body-1-regular)')]"
+                    value = SELECTORS.find(
+                        item, 'profile.lifestyle_value'
                     ).text.strip()
                     lifestyle[category] = value
                 except NoSuchElementException:
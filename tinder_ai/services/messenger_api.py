@@ -1,18 +1,39 @@
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
 from abc import ABC, abstractmethod
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
 import requests
 from urllib.parse import urljoin
+from logging import getLogger
+import random
+import threading
+from tinder_ai.utils import clock
+from tinder_ai.utils.metrics import METRICS
 from tinder_ai.shared import (
     MatchProfile,
     MessageResponse,
     OpeningMessageRequest,
     ReplyRequest,
+    ReplyDeltaRequest,
+    OpeningBatchRequest,
+    ReplyBatchRequest,
+    ReplyDeltaBatchRequest,
+    BatchResult,
+    BatchResponse,
     Message,
-    MatchReadyException
+    MatchReadyException,
+    messages_hash
 )
 
 
+logger = getLogger(__name__)
+
+# A generated message, or the exception generating it raised.
+GenerationResult = Union[MessageResponse, Exception]
+# A profile and the conversation to reply to.
+ReplyItem = Tuple[MatchProfile, Optional[List[Message]]]
+
+
 class BaseMessengerService(ABC):
     @abstractmethod
     def generate_opener(
@@ -30,53 +51,198 @@ class BaseMessengerService(ABC):
         """Generate a reply based on previous messages."""
         pass
 
+    def generate_openers(
+        self, profiles: List[MatchProfile]
+    ) -> List[GenerationResult]:
+        """
+        Generate opening messages for several profiles at once.
+
+        Returns one result per profile, in order: the response, or the
+        exception its generation raised (e.g. MatchReadyException), so
+        one failure does not fail the others. Services with a batch
+        backend override this, the default generates one by one.
+        """
+        return [
+            self._result_of(self.generate_opener, profile)
+            for profile in profiles
+        ]
+
+    def generate_replies(
+        self, items: List[ReplyItem]
+    ) -> List[GenerationResult]:
+        """
+        Generate replies for several (profile, last_messages) items
+        at once, see `generate_openers`.
+        """
+        return [
+            self._result_of(self.generate_reply, profile, last_messages)
+            for profile, last_messages in items
+        ]
 
-class MessengerService:
+    @staticmethod
+    def _result_of(function: Callable, *args) -> GenerationResult:
+        try:
+            return function(*args)
+        except Exception as e:
+            return e
+
+
+class MessengerService(BaseMessengerService):
     """
     A service class to interact with the Messenger API.
 
+    Requests go through a pooled `requests.Session`, so connections
+    to the API are kept alive and reused across openers and replies.
+
     Attributes:
         base_url (str): The base URL of the Messenger API.
-        timeout (int): The timeout duration for API requests in seconds.
+        timeout (float): The default timeout for API requests in seconds.
+        timeouts (Dict[str, float]): Per-endpoint timeout overrides.
+        max_retries (int): Retries for 5xx responses and connection errors.
+        delta_replies (bool): Send replies in the v2 format.
 
     Methods:
-        __init__(base_url: str, timeout: int = 10):
-            Initializes the MessengerService with the given base URL and
-            timeout.
+        __init__(base_url: str, timeout: int = 10, ...):
+            Initializes the MessengerService with the given base URL,
+            timeouts, connection pool and retry settings.
 
         _make_request(endpoint: str, data: BaseModel) -> MessageResponse:
             Makes an HTTP POST request to the specified API endpoint with
-            the provided data.
+            the provided data, retrying transient failures.
 
         generate_opener(profile: MatchProfile) -> MessageResponse:
             Generates an opening message based on the
             provided profile information.
 
+        generate_openers(profiles: List[MatchProfile]):
+            Generates opening messages for several profiles in one
+            request to the batch endpoint.
+
+        generate_replies(items: List[ReplyItem]):
+            Generates replies for several conversations in one request
+            to the batch endpoint.
+
         generate_reply(profile: MatchProfile,
             last_messages: Optional[List[Message]] = None) -> MessageResponse:
             Generates a reply based on the provided profile information
-            and previous messages.
+            and previous messages. With `delta_replies`, only the
+            messages added since the last acknowledged reply request
+            of the match are sent, the profile as a hash.
+
+        close():
+            Closes the pooled connections.
     """
-    def __init__(self, base_url: str, timeout: int = 10):
+    RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+    # Returned by /v2/generate/reply if the server lacks the base state.
+    CACHE_MISS_STATUS_CODE = 412
+    # A server without batch endpoints, requests are then sent one by one.
+    UNSUPPORTED_STATUS_CODES = frozenset({404, 405, 501})
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 10,
+        timeouts: Optional[Dict[str, float]] = None,
+        pool_size: int = 4,
+        max_retries: int = 2,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 8.0,
+        delta_replies: bool = False
+    ):
+        """
+        :param base_url: The base URL of the Messenger API.
+        :param timeout: Default request timeout in seconds.
+        :param timeouts: Timeouts per endpoint, e.g.
+            {"/v1/generate/reply": 30}, falling back to `timeout`.
+        :param pool_size: Maximum number of kept-alive connections.
+        :param max_retries: Retries for 5xx responses and connection errors.
+        :param backoff_factor: Base of the exponential backoff in seconds.
+        :param backoff_max: Upper bound of a single backoff in seconds.
+        :param delta_replies: Send reply requests in the v2 format
+            (`ReplyDeltaRequest`): the profile hash and only the messages
+            appended since the last acknowledged request of the match,
+            the full state when the server reports a cache miss.
+        """
         self.base_url = base_url
         self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.delta_replies = delta_replies
+        # match_id -> (profile hash, message count, messages hash)
+        # of the last reply request the server acknowledged.
+        self._acknowledged: Dict[str, Tuple[str, int, str]] = {}
+        self._acknowledged_lock = threading.Lock()
+        self.batch_supported = True
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=0
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self) -> 'MessengerService':
+        return self
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter: a random delay up to the exponential backoff."""
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_factor * 2 ** attempt)
+        )
 
     def _make_request(
-        self, endpoint: str, data: BaseModel
-    ) -> MessageResponse:
+        self,
+        endpoint: str,
+        data: BaseModel,
+        response_model: Type[BaseModel] = MessageResponse
+    ) -> BaseModel:
         """Make HTTP request to API endpoint"""
         url = urljoin(self.base_url, endpoint)
-        try:
-            response = requests.post(
-                url, json=data.model_dump(),
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            return MessageResponse.model_validate(response.json())
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 409:
-                raise MatchReadyException(e.response.json()['detail'])
-            raise
+        timeout = self.timeouts.get(endpoint, self.timeout)
+        payload = data.model_dump()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.post(
+                    url, json=payload, timeout=timeout
+                )
+                if (
+                    response.status_code in self.RETRY_STATUS_CODES
+                    and attempt < self.max_retries
+                ):
+                    logger.warning(
+                        f"{endpoint} returned {response.status_code}, "
+                        f"retrying ({attempt + 1}/{self.max_retries})"
+                    )
+                    METRICS.inc('retries')
+                    clock.sleep(self._backoff(attempt))
+                    continue
+                response.raise_for_status()
+                return response_model.model_validate(response.json())
+            except requests.exceptions.ConnectionError as e:
+                if attempt >= self.max_retries:
+                    raise
+                logger.warning(
+                    f"Connection error on {endpoint}: {e}, "
+                    f"retrying ({attempt + 1}/{self.max_retries})"
+                )
+                METRICS.inc('retries')
+                clock.sleep(self._backoff(attempt))
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code == 409:
+                    raise MatchReadyException(e.response.json()['detail'])
+                raise
 
     def generate_opener(
             self, profile: MatchProfile,
@@ -93,12 +259,250 @@ class MessengerService:
     ) -> MessageResponse:
         # return MessageResponse(message="Hello, I am a bot REPLY")
         """Generate a reply based on previous messages"""
+        if self.delta_replies:
+            return self._generate_reply_delta(profile, last_messages)
         request = ReplyRequest(
             profile=profile,
             last_messages=last_messages
         )
         return self._make_request("/v1/generate/reply", request)
 
+    def _generate_reply_delta(
+        self,
+        profile: MatchProfile,
+        last_messages: Optional[List[Message]] = None
+    ) -> MessageResponse:
+        """
+        Request a reply in the v2 format, sending the messages appended
+        since the last acknowledged request only if the profile did not
+        change and the acknowledged messages are still a prefix of
+        the conversation.
+        """
+        messages = self._conversation(profile, last_messages)
+        response = None
+        request = self._delta_request(profile, messages)
+        if request is not None:
+            response = self._request_delta(request)
+        if response is None:
+            response = self._make_request(
+                "/v2/generate/reply", self._full_request(profile, messages)
+            )
+        self._acknowledge(profile, messages)
+        return response
+
+    @staticmethod
+    def _conversation(
+        profile: MatchProfile, last_messages: Optional[List[Message]]
+    ) -> List[Message]:
+        return list(
+            last_messages if last_messages is not None
+            else profile.last_messages or []
+        )
+
+    def _delta_request(
+        self, profile: MatchProfile, messages: List[Message]
+    ) -> Optional[ReplyDeltaRequest]:
+        """The delta on the acknowledged state, None if there is none."""
+        profile_hash = profile.content_hash()
+        with self._acknowledged_lock:
+            acknowledged = self._acknowledged.get(profile.match_id)
+        if acknowledged is None:
+            return None
+        acknowledged_hash, count, base_hash = acknowledged
+        if (
+            acknowledged_hash != profile_hash
+            or count > len(messages)
+            or messages_hash(messages[:count]) != base_hash
+        ):
+            return None
+        return ReplyDeltaRequest(
+            match_id=profile.match_id,
+            profile_hash=profile_hash,
+            base_messages=count,
+            base_hash=base_hash,
+            new_messages=messages[count:]
+        )
+
+    @staticmethod
+    def _full_request(
+        profile: MatchProfile, messages: List[Message]
+    ) -> ReplyDeltaRequest:
+        return ReplyDeltaRequest(
+            match_id=profile.match_id,
+            profile_hash=profile.content_hash(),
+            base_hash=messages_hash([]),
+            new_messages=messages,
+            profile=profile.model_copy(update={'last_messages': None})
+        )
+
+    def _acknowledge(
+        self, profile: MatchProfile, messages: List[Message]
+    ) -> None:
+        with self._acknowledged_lock:
+            self._acknowledged[profile.match_id] = (
+                profile.content_hash(), len(messages), messages_hash(messages)
+            )
+
+    def _request_delta(
+        self, request: ReplyDeltaRequest
+    ) -> Optional[MessageResponse]:
+        """Send a delta request, None if the server lacks its base."""
+        try:
+            return self._make_request("/v2/generate/reply", request)
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code != self.CACHE_MISS_STATUS_CODE:
+                raise
+        self._log_cache_miss(request.match_id)
+        return None
+
+    def _log_cache_miss(self, match_id: str) -> None:
+        logger.debug(
+            f"Reply state of {match_id} is not cached "
+            "by the server, sending it in full"
+        )
+        METRICS.inc('reply_cache_misses')
+
+    def generate_openers(
+        self, profiles: List[MatchProfile]
+    ) -> List[GenerationResult]:
+        """Generate openers in one request to /v1/generate/openers."""
+        if not profiles:
+            return []
+        response = self._make_batch_request(
+            "/v1/generate/openers",
+            OpeningBatchRequest(requests=[
+                OpeningMessageRequest(profile=profile)
+                for profile in profiles
+            ])
+        )
+        if response is None:
+            return super().generate_openers(profiles)
+        return [self._batch_result(result) for result in response.results]
+
+    def generate_replies(
+        self, items: List[ReplyItem]
+    ) -> List[GenerationResult]:
+        """
+        Generate replies in one request to /v1/generate/replies, or
+        /v2/generate/replies with `delta_replies`. In the v2 format,
+        the items the server reports as cache misses are sent again
+        in full, in one more batch (one by one if that is rejected).
+        """
+        if not items:
+            return []
+        if self.delta_replies:
+            return self._generate_replies_delta(items)
+        response = self._make_batch_request(
+            "/v1/generate/replies",
+            ReplyBatchRequest(requests=[
+                ReplyRequest(profile=profile, last_messages=last_messages)
+                for profile, last_messages in items
+            ])
+        )
+        if response is None:
+            return super().generate_replies(items)
+        return [self._batch_result(result) for result in response.results]
+
+    def _generate_replies_delta(
+        self, items: List[ReplyItem]
+    ) -> List[GenerationResult]:
+        conversations = [
+            (profile, self._conversation(profile, last_messages))
+            for profile, last_messages in items
+        ]
+        batch = [
+            self._delta_request(profile, messages)
+            or self._full_request(profile, messages)
+            for profile, messages in conversations
+        ]
+        response = self._make_batch_request(
+            "/v2/generate/replies",
+            ReplyDeltaBatchRequest(requests=batch)
+        )
+        if response is None:
+            return super().generate_replies(items)
+        results = [self._batch_result(result) for result in response.results]
+
+        missed = [
+            index for index, result in enumerate(response.results)
+            if result.status == self.CACHE_MISS_STATUS_CODE
+            and batch[index].profile is None
+        ]
+        for index in missed:
+            self._log_cache_miss(batch[index].match_id)
+        if missed:
+            retried = self._generate_full_replies(
+                [conversations[index] for index in missed]
+            )
+            for index, result in zip(missed, retried):
+                results[index] = result
+
+        for (profile, messages), result in zip(conversations, results):
+            if isinstance(result, MessageResponse):
+                self._acknowledge(profile, messages)
+        return results
+
+    def _generate_full_replies(
+        self, conversations: List[Tuple[MatchProfile, List[Message]]]
+    ) -> List[GenerationResult]:
+        """
+        Send conversations in full after cache misses, in one batch, or
+        one by one if the server stopped accepting batches meanwhile.
+        """
+        batch = [
+            self._full_request(profile, messages)
+            for profile, messages in conversations
+        ]
+        response = self._make_batch_request(
+            "/v2/generate/replies",
+            ReplyDeltaBatchRequest(requests=batch)
+        )
+        if response is None:
+            return [
+                self._result_of(
+                    self._make_request, "/v2/generate/reply", request
+                )
+                for request in batch
+            ]
+        return [self._batch_result(result) for result in response.results]
+
+    def _make_batch_request(
+        self, endpoint: str, data: BaseModel
+    ) -> Optional[BatchResponse]:
+        """
+        Send a batch, None if the server has no batch endpoints,
+        in which case later batches are sent one by one right away.
+        """
+        if not self.batch_supported:
+            return None
+        try:
+            response = self._make_request(endpoint, data, BatchResponse)
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code not in self.UNSUPPORTED_STATUS_CODES:
+                raise
+            logger.info(
+                f"{endpoint} is not supported, "
+                "generating messages one by one"
+            )
+            self.batch_supported = False
+            return None
+        if len(response.results) != len(data.requests):
+            raise ValueError(
+                f"{endpoint} returned {len(response.results)} results "
+                f"for {len(data.requests)} requests"
+            )
+        return response
+
+    @staticmethod
+    def _batch_result(result: BatchResult) -> GenerationResult:
+        if result.status == 200:
+            return MessageResponse(message=result.message)
+        if result.status == 409:
+            return MatchReadyException(message=result.detail)
+        return requests.exceptions.HTTPError(
+            f"{result.status} error for a batched request: {result.detail}"
+        )
+
 
 class MockMessengerService(BaseMessengerService):
     """A fallback implementation of the Messenger Service."""
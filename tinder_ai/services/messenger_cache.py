@@ -0,0 +1,275 @@
+from tinder_ai.services.messenger_api import (
+    BaseMessengerService,
+    GenerationResult,
+    ReplyItem
+)
+from tinder_ai.shared import (
+    MatchProfile,
+    Message,
+    MessageResponse,
+    content_hash
+)
+from tinder_ai.utils import clock
+
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
+import sqlite3
+import threading
+
+
+logger = getLogger(__name__)
+
+
+class CachedMessengerService(BaseMessengerService):
+    """
+    Wraps any `BaseMessengerService` with an idempotent response cache.
+
+    Responses are keyed on the match id plus a hash of the profile
+    fields and the conversation, so generating for a conversation
+    state that was already answered returns the stored response
+    instead of sending another request. Exceptions, e.g.
+    `MatchReadyException`, are never cached.
+
+    The cache lives in SQLite, in memory by default or on disk when
+    `path` is given, and is bounded by `ttl` and `max_entries`
+    (least recently used entries are dropped first).
+    """
+
+    DEFAULT_TTL = 24 * 60 * 60
+    DEFAULT_MAX_ENTRIES = 1000
+
+    def __init__(
+        self,
+        service: BaseMessengerService,
+        path: Union[str, Path] = ":memory:",
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        """
+        :param service: The service that actually generates messages.
+        :param path: Database file, in memory by default.
+        :param ttl: Seconds a response stays valid.
+        :param max_entries: Maximum number of stored responses.
+        """
+        self.service = service
+        self.path = str(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # Pipelined sessions generate from worker threads.
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False
+        )
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                match_id TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+        self.evict()
+
+    def __enter__(self) -> 'CachedMessengerService':
+        return self
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+        if hasattr(self.service, 'close'):
+            self.service.close()
+
+    def generate_opener(self, profile: MatchProfile) -> MessageResponse:
+        """Generate an opening message, or return the cached one."""
+        return self._cached(
+            'opener', profile, None,
+            lambda: self.service.generate_opener(profile)
+        )
+
+    def generate_reply(
+        self,
+        profile: MatchProfile,
+        last_messages: Optional[List[Message]] = None
+    ) -> MessageResponse:
+        """Generate a reply, or return the cached one."""
+        return self._cached(
+            'reply', profile, last_messages,
+            lambda: self.service.generate_reply(profile, last_messages)
+        )
+
+    def generate_openers(
+        self, profiles: List[MatchProfile]
+    ) -> List[GenerationResult]:
+        """Return cached openers, generate the others in one batch."""
+        return self._cached_batch(
+            'opener',
+            [(profile, None) for profile in profiles],
+            lambda missing: self.service.generate_openers(
+                [profile for profile, _ in missing]
+            )
+        )
+
+    def generate_replies(
+        self, items: List[ReplyItem]
+    ) -> List[GenerationResult]:
+        """Return cached replies, generate the others in one batch."""
+        return self._cached_batch(
+            'reply', items, self.service.generate_replies
+        )
+
+    def invalidate(self, match_id: str) -> None:
+        """Drop all cached responses of a match."""
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM responses WHERE match_id = ?", (match_id,)
+            )
+            self._connection.commit()
+
+    def evict(self) -> int:
+        """
+        Drop expired entries and the least recently used ones
+        above `max_entries`.
+
+        :return: The number of removed entries.
+        """
+        with self._lock:
+            expired = self._connection.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (clock.now() - self.ttl,)
+            ).rowcount
+            overflow = self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            ).rowcount
+            self._connection.commit()
+
+        if expired or overflow:
+            logger.debug(
+                f"Evicted {expired} expired and {overflow} "
+                "least recently used responses"
+            )
+        return expired + overflow
+
+    @staticmethod
+    def cache_key(
+        kind: str,
+        profile: MatchProfile,
+        last_messages: Optional[List[Message]] = None
+    ) -> str:
+        """
+        Hash everything a generated message depends on.
+
+        :param kind: 'opener' or 'reply'.
+        :param profile: The match profile, including its messages.
+        :param last_messages: Messages passed next to the profile.
+        """
+        state = {
+            'kind': kind,
+            'profile': profile.model_dump(mode='json'),
+            'last_messages': [
+                message.model_dump() for message in last_messages
+            ] if last_messages is not None else None,
+        }
+        return f"{profile.match_id}:{content_hash(state)}"
+
+    def _cached(self, kind, profile, last_messages, generate):
+        key = self.cache_key(kind, profile, last_messages)
+        response = self._lookup(key)
+        if response is not None:
+            logger.debug(f"Reusing cached {kind} for {profile.match_id}")
+            return response
+
+        response = generate()
+        self._store(key, profile.match_id, response)
+        self.evict()
+        return response
+
+    def _cached_batch(
+        self,
+        kind: str,
+        items: List[Tuple[MatchProfile, Optional[List[Message]]]],
+        generate: Callable[[List], List[GenerationResult]]
+    ) -> List[GenerationResult]:
+        """
+        Like `_cached` for several items: the ones not in the cache are
+        passed to `generate` together. Failed results are not cached.
+        """
+        keys = [
+            self.cache_key(kind, profile, last_messages)
+            for profile, last_messages in items
+        ]
+        results: List[Optional[GenerationResult]] = [
+            self._lookup(key) for key in keys
+        ]
+        missing = [
+            index for index, result in enumerate(results) if result is None
+        ]
+        if len(missing) < len(items):
+            logger.debug(
+                f"Reusing {len(items) - len(missing)} cached {kind}s"
+            )
+        if missing:
+            generated = generate([items[index] for index in missing])
+            for index, result in zip(missing, generated):
+                results[index] = result
+                if isinstance(result, MessageResponse):
+                    self._store(keys[index], items[index][0].match_id, result)
+            self.evict()
+        return results
+
+    def _lookup(self, key: str) -> Optional[MessageResponse]:
+        """The fresh cached response for `key`, counting hits and misses."""
+        now = clock.now()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response FROM responses "
+                "WHERE key = ? AND created_at >= ?",
+                (key, now - self.ttl)
+            ).fetchone()
+            if row is not None:
+                self._connection.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                    (now, key)
+                )
+                self._connection.commit()
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if row is None:
+            return None
+        return MessageResponse.model_validate_json(row[0])
+
+    def _store(
+        self, key: str, match_id: str, response: MessageResponse
+    ) -> None:
+        now = clock.now()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, match_id, response, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, match_id, response.model_dump_json(), now, now)
+            )
+            self._connection.commit()
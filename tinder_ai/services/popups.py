@@ -0,0 +1,207 @@
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    ElementNotInteractableException,
+    ElementNotVisibleException
+)
+
+from tinder_ai.utils.metrics import METRICS
+
+from collections import Counter
+from dataclasses import dataclass
+from logging import getLogger
+from typing import List, Optional
+
+
+logger = getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PopupRule:
+    """
+    Describes a popup and the button that dismisses it.
+
+    Attributes:
+        name: Unique rule name, used for hit counters.
+        xpath: XPath of the dismiss button, relative to the popup container.
+        message: Logged after the popup was dismissed.
+        exclusive: Stop handling the other hits of the same probe once
+            this one fired, they are probed again.
+    """
+    name: str
+    xpath: str
+    message: Optional[str] = None
+    exclusive: bool = True
+
+
+# Probes per `PopupDetector.dismiss`, bounds the work on a popup
+# that keeps coming back.
+MAX_DISMISS_PROBES = 3
+
+# Evaluated in order, the first exclusive hit ends the probe.
+DEFAULT_POPUP_RULES = [
+    PopupRule(
+        name='maybe_later',
+        xpath='.//button/span[contains(text(), "Maybe Later")]',
+        message="POPUP: Dismissed 'Maybe Later'"
+    ),
+    PopupRule(
+        name='upgrade_like',
+        xpath='.//main/div/button[2]',
+        message="POPUP: Denied upgrade to superlike"
+    ),
+    PopupRule(
+        name='add_to_homescreen',
+        xpath='.//main/div/div[2]/button[2]',
+        message="POPUP: Denied Tinder to homescreen"
+    ),
+    PopupRule(
+        name='match',
+        xpath='//button[@title="Back to Tinder"]',
+        exclusive=False
+    ),
+    PopupRule(
+        name='superlikes',
+        xpath='.//main/div/div[3]/button[2]',
+        message="POPUP: Denied buying more superlikes",
+        exclusive=False
+    ),
+]
+
+# Evaluates every rule against the popup container in one round trip.
+# Returns null if the container is missing, otherwise
+# [rule index, dismiss element] pairs in rule order.
+#
+# arguments[0]: XPath of the popup container
+# arguments[1]: rule XPaths
+POPUP_PROBE_SCRIPT = """
+const [baseXPath, xpaths] = arguments;
+const first = (path, ctx) => document.evaluate(
+    path, ctx, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+
+const base = first(baseXPath, document);
+if (!base) {
+    return null;
+}
+const hits = [];
+xpaths.forEach((xpath, index) => {
+    const node = first(xpath, base);
+    if (node) {
+        hits.push([index, node]);
+    }
+});
+return hits;
+"""
+
+
+class PopupDetector:
+    """
+    Detects and dismisses popups with a single in-page probe.
+
+    Rules are kept in a registry and evaluated by `POPUP_PROBE_SCRIPT`,
+    so a probe that finds nothing costs one WebDriver round trip
+    regardless of the number of rules.
+    `hit_counts` records how often each rule fired.
+    """
+
+    # last possible id based div
+    CONTAINER_XPATH = '/html/body/div[2]'
+
+    def __init__(
+        self,
+        browser,
+        rules: Optional[List[PopupRule]] = None
+    ) -> None:
+        self.browser = browser
+        self.rules: List[PopupRule] = list(
+            DEFAULT_POPUP_RULES if rules is None else rules
+        )
+        self.probes = 0
+        self.hit_counts: Counter = Counter()
+
+    def register(
+        self, rule: PopupRule, before: Optional[str] = None
+    ) -> None:
+        """
+        Add a rule to the registry.
+
+        :param rule: The rule to add.
+        :param before: Name of an existing rule to insert it in front of,
+            appended at the end if not given.
+        """
+        if any(existing.name == rule.name for existing in self.rules):
+            raise ValueError(f"Popup rule '{rule.name}' already registered")
+
+        if before is None:
+            self.rules.append(rule)
+            return
+        names = [existing.name for existing in self.rules]
+        if before not in names:
+            raise ValueError(f"Unknown popup rule: '{before}'")
+        self.rules.insert(names.index(before), rule)
+
+    def detect(self) -> List[tuple]:
+        """
+        Probe the page for all registered popups.
+
+        :return: (rule, dismiss element) pairs in rule order.
+        :raises NoSuchElementException: If the popup container is missing.
+        """
+        self.probes += 1
+        hits = self.browser.execute_script(
+            POPUP_PROBE_SCRIPT,
+            self.CONTAINER_XPATH,
+            [rule.xpath for rule in self.rules]
+        )
+        if hits is None:
+            raise NoSuchElementException(
+                f"Popup container {self.CONTAINER_XPATH} not found"
+            )
+        return [(self.rules[index], element) for index, element in hits]
+
+    def dismiss(
+        self, max_probes: int = MAX_DISMISS_PROBES
+    ) -> List[PopupRule]:
+        """
+        Dismiss the popups currently on screen.
+
+        Handles hits in rule order up to the first exclusive rule, then
+        probes again until nothing matches or `max_probes` probes were
+        made. A dismiss button that went stale or is not interactable
+        triggers a page refresh, like a stuck popup would need, and the
+        refreshed page is probed again too.
+
+        :return: The rules that were dismissed.
+        :raises NoSuchElementException: If the popup container is
+            missing on the first probe.
+        """
+        dismissed = []
+        for probe in range(max_probes):
+            try:
+                hits = self.detect()
+            except NoSuchElementException:
+                if probe == 0:
+                    raise
+                break
+            if not hits:
+                break
+            for rule, element in hits:
+                try:
+                    element.click()
+                except (
+                    StaleElementReferenceException,
+                    ElementNotInteractableException,
+                    ElementNotVisibleException
+                ):
+                    METRICS.inc('refreshes')
+                    self.browser.refresh()
+                    break
+
+                self.hit_counts[rule.name] += 1
+                dismissed.append(rule)
+                if rule.message:
+                    logger.info(rule.message)
+                if rule.exclusive:
+                    break
+        return dismissed
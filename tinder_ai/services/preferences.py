@@ -1,20 +1,210 @@
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
 from selenium.common.exceptions import (
     TimeoutException,
     StaleElementReferenceException
 )
 from selenium.webdriver.common.action_chains import ActionChains
 from tinder_ai.constants.models import Sexuality
+from tinder_ai.constants.selectors import SELECTORS
+from tinder_ai.utils.tracing import traced
+from tinder_ai.utils.readiness import wait_for_element
 from tinder_ai.settings import Settings
-import time
+from tinder_ai.shared import content_hash
+from tinder_ai.utils import clock
 import random
 from logging import getLogger
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+import json
+import os
 
 
 logger = getLogger(__name__)
 
+# Drags after the first one when a slider handle did not land exactly.
+MAX_SLIDER_CORRECTIONS = 2
+
+# Value bounds of the sliders, used when a handle does not expose
+# aria-valuemin/aria-valuemax (the scales the sliders were built for).
+DISTANCE_BOUNDS = (0, 161)
+AGE_BOUNDS = (18, 100)
+
+# Reads everything needed to compute a slider drag in one round trip:
+# the rail's left edge and width, the handle's center (all in viewport
+# pixels) and the handle's value bounds and current value.
+#
+# arguments[0]: slider handle (role=slider)
+# arguments[1]: rail element, or null for the handle's parent
+# arguments[2]: [min, max] bounds if the handle does not expose them
+SLIDER_STATE_SCRIPT = """
+const [handle, railElement, [fallbackMin, fallbackMax]] = arguments;
+const rail = (railElement || handle.parentElement).getBoundingClientRect();
+const box = handle.getBoundingClientRect();
+const number = (name, fallback) => {
+    const value = parseFloat(handle.getAttribute(name));
+    return Number.isNaN(value) ? fallback : value;
+};
+return {
+    left: rail.left,
+    width: rail.width,
+    center: box.left + box.width / 2,
+    min: number('aria-valuemin', fallbackMin),
+    max: number('aria-valuemax', fallbackMax),
+    now: Math.round(number('aria-valuenow', fallbackMin))
+};
+"""
+
+
+PREFERENCES_XPATHS = {
+    key: SELECTORS.xpath(f'preferences.{key}')
+    for key in (
+        'distance_handle', 'min_age_handle', 'max_age_handle',
+        'looking_for_list', 'checkboxes', 'global_toggle',
+    )
+}
+
+# Reads the current value of every preference control in one round
+# trip, so only the controls that differ from the settings are touched.
+# Values of missing controls are null, `looking_for` holds the labels
+# of the checked gender options. The options are only read from the
+# "Looking for" list while it is expanded; the page renders it collapsed,
+# so `looking_for` is usually null (unknown) and the option is applied.
+#
+# arguments[0]: PREFERENCES_XPATHS
+PREFERENCES_STATE_SCRIPT = """
+const xp = arguments[0];
+const first = (path) => document.evaluate(
+    path, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+const all = (path) => {
+    const res = document.evaluate(
+        path, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    const nodes = [];
+    for (let i = 0; i < res.snapshotLength; i++) {
+        nodes.push(res.snapshotItem(i));
+    }
+    return nodes;
+};
+const value = (path) => {
+    const node = first(path);
+    const number = node ? parseFloat(node.getAttribute('aria-valuenow')) : NaN;
+    return Number.isNaN(number) ? null : Math.round(number);
+};
+
+const toggle = first(xp.global_toggle);
+const list = first(xp.looking_for_list);
+const expanded = list && (
+    list.offsetWidth || list.offsetHeight || list.getClientRects().length
+);
+const options = expanded
+    ? all(xp.checkboxes).filter((box) => box !== toggle && list.contains(box))
+    : [];
+const label = (box) => {
+    const node = box.id
+        ? document.querySelector(`label[for="${CSS.escape(box.id)}"]`)
+        : null;
+    return node ? node.textContent.trim() : box.id;
+};
+
+return {
+    distance: value(xp.distance_handle),
+    age_min: value(xp.min_age_handle),
+    age_max: value(xp.max_age_handle),
+    looking_for: options.length
+        ? options.filter((box) => box.checked).map(label)
+        : null,
+    global: toggle
+        ? (toggle.hasAttribute('aria-checked')
+            ? toggle.getAttribute('aria-checked') === 'true'
+            : toggle.checked)
+        : null
+};
+"""
+
+
+def age_bounds(min_age: int, max_age: int) -> Tuple[int, int]:
+    """The age range the sliders can represent."""
+    low, high = AGE_BOUNDS
+    min_age = max(low, min(min_age, high))
+    return min_age, min(high, max(max_age, min_age))
+
+
+class AppliedPreferences:
+    """
+    Remembers a hash of the preferences last applied to the account.
+
+    The hash covers the preference settings and the login account
+    (never passwords). While it matches, the profile page does not need
+    to be opened at all. Entries older than `ttl` seconds are ignored,
+    so changes made in the app itself are eventually overwritten.
+    """
+
+    DEFAULT_TTL = 24 * 60 * 60
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl: float = DEFAULT_TTL
+    ) -> None:
+        """
+        :param path: JSON file to persist to, in memory only if None.
+        :param ttl: Seconds an applied state is trusted.
+        """
+        self.path = Path(path) if path is not None else None
+        self.ttl = ttl
+        self._entry: Optional[dict] = self._load()
+
+    @staticmethod
+    def key(settings: Settings) -> str:
+        applied = {
+            'account': settings.facebook_email or settings.google_email,
+            'distance_range': settings.distance_range,
+            'age_range': age_bounds(
+                settings.age_range_min, settings.age_range_max
+            ),
+            'gender_preference': settings.gender_preference.value,
+            'set_global': settings.set_global,
+        }
+        return content_hash(applied)
+
+    def matches(self, settings: Settings) -> bool:
+        """Whether `settings` were applied within the last `ttl` seconds."""
+        entry = self._entry
+        return (
+            entry is not None
+            and entry.get("key") == self.key(settings)
+            and clock.now() - entry.get("applied_at", 0) <= self.ttl
+        )
+
+    def record(self, settings: Settings) -> None:
+        self._entry = {"key": self.key(settings), "applied_at": clock.now()}
+        self._save()
+
+    def clear(self) -> None:
+        self._entry = None
+        self._save()
+
+    def _load(self) -> Optional[dict]:
+        if self.path is None or not self.path.exists():
+            return None
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.info(f"Ignoring unreadable preferences {self.path}: {e}")
+            return None
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            partial = self.path.with_suffix(".partial")
+            partial.write_text(json.dumps(self._entry), encoding="utf-8")
+            os.replace(partial, self.path)
+        except OSError as e:
+            logger.info(f"Unable to write preferences {self.path}: {e}")
+
 
 class PreferencesService:
     WEBDRIVER_WAIT_TIME = 10
@@ -26,11 +216,10 @@ class PreferencesService:
         self.browser = browser
         try:
             logger.info('Open profile')
-            xpath = '//*[@href="/app/profile"]'
-            profile_button = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.element_to_be_clickable((By.XPATH, xpath)))
+            profile_button = SELECTORS.find(
+                self.browser, 'preferences.profile_link',
+                timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
+            )
             profile_button.click()
             logger.info('found profile page')
         except TimeoutException:
@@ -38,26 +227,67 @@ class PreferencesService:
         except Exception as e:
             logger.info(f"Error opening profile: {e}")
 
-    def set_preferences(self, settings: Settings) -> None:
+    @traced()
+    def set_preferences(self, settings: Settings) -> bool:
         """
-        Sets multiple preferences in sequence:
-        distance range, age range, gender preference,
-        global setting, then navigates back to the main screen.
+        Sets the preferences that differ from the current ones:
+        distance range, age range, gender preference and global
+        setting, then navigates back to the main screen.
+
+        The current values are read in one probe. Controls it could
+        not read are set unconditionally.
+
+        :return: Whether every control that needed a change was set.
         """
-        self.set_distance_range(settings.distance_range)
-        time.sleep(random.randint(0, 2))
+        current = self.read_preferences() or {}
+        applied = True
 
-        self.set_age_range(settings.age_range_min, settings.age_range_max)
-        time.sleep(random.randint(0, 2))
+        if current.get('distance') != settings.distance_range:
+            applied &= self.set_distance_range(settings.distance_range)
+            clock.sleep(random.randint(0, 2))
 
-        self.set_sexuality(settings.gender_preference)
-        time.sleep(random.randint(0, 2))
+        min_age, max_age = age_bounds(
+            settings.age_range_min, settings.age_range_max
+        )
+        if (current.get('age_min'), current.get('age_max')) != (
+            min_age, max_age
+        ):
+            applied &= self.set_age_range(min_age, max_age)
+            clock.sleep(random.randint(0, 2))
+
+        # None while the list is collapsed: unknown, so it is applied
+        if current.get('looking_for') != [settings.gender_preference.value]:
+            applied &= self.set_sexuality(settings.gender_preference)
+            clock.sleep(random.randint(0, 2))
 
-        self.set_global(settings.set_global)
-        time.sleep(random.randint(1, 3))
+        if current.get('global') != settings.set_global:
+            applied &= self.set_global(settings.set_global)
+            clock.sleep(random.randint(1, 3))
 
         self.navigate_to_main_screen()
-        time.sleep(random.randint(1, 3))
+        clock.sleep(random.randint(1, 3))
+        return applied
+
+    def read_preferences(self) -> Optional[Dict]:
+        """
+        The current values of the preference controls
+        (see PREFERENCES_STATE_SCRIPT), None if the profile page
+        did not load.
+        """
+        try:
+            wait_for_element(
+                self.browser,
+                PREFERENCES_XPATHS['distance_handle'],
+                timeout=self.WEBDRIVER_WAIT_TIME
+            )
+            state = self.browser.execute_script(
+                PREFERENCES_STATE_SCRIPT, PREFERENCES_XPATHS
+            )
+            logger.info(f"Current preferences: {state}")
+            return state
+        except Exception as e:
+            logger.info(f"Unable to read current preferences: {e}")
+            return None
 
     def set_custom_location(
         self, latitude, longitude, accuracy="100%"
@@ -73,186 +303,168 @@ class PreferencesService:
         except Exception as e:
             logger.info(f"Error setting custom location: {e}")
 
-    def set_distance_range(self, km) -> None:
-        """Sets the distance range using slider manipulation."""
-        try:
-            # Correct out-of-bounds values
-            final_percentage = min(max((km / 161) * 100, 0), 100)
-
-            slider_handle_xpath = (
-                '//div[@role="slider" and '
-                '@aria-label="Maximum distance in kilometers"]'
-            )
-            slider_track_xpath = '//*[@data-testid="slider-rail"]'
+    def set_distance_range(self, km) -> bool:
+        """
+        Sets the distance range by dragging the slider once.
 
-            # Locate the slider handle and track
-            slider_handle = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.presence_of_element_located((By.XPATH, slider_handle_xpath))
-            )
-            slider_track = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.presence_of_element_located((By.XPATH, slider_track_xpath))
+        :return: Whether the slider reached `km`, or its closest bound.
+        """
+        try:
+            slider_handle = SELECTORS.find(
+                self.browser, 'preferences.distance_handle',
+                timeout=self.WEBDRIVER_WAIT_TIME
             )
-
-            # Extract the current percentage from the 'style' attribute
-            current_percentage = float(
-                slider_handle
-                .get_attribute('style')
-                .split('left: ')[1]
-                .replace('%;', '')
-                .strip()
+            slider_track = SELECTORS.find(
+                self.browser, 'preferences.slider_rail',
+                timeout=self.WEBDRIVER_WAIT_TIME
             )
-
-            slider_track_width_px = slider_track.size['width']
-
-            # Calculate movement
-            pixel_distance_to_move = (
-                (final_percentage - current_percentage) / 100
-            ) * slider_track_width_px
-
-            # Adjust the slider in small steps
-            action = ActionChains(self.browser).click_and_hold(slider_handle)
-            steps = max(1, int(abs(pixel_distance_to_move) / 5))
-            step_distance = pixel_distance_to_move / steps
-
-            for _ in range(steps):
-                action.move_by_offset(step_distance, 0)
-
-            action.release().perform()
-
-            # Verify the slider's final position
-            time.sleep(0.5)
-            updated_percentage = float(
-                slider_handle
-                .get_attribute('style')
-                .split('left: ')[1]
-                .replace('%;', '')
-                .strip()
+            start, final, target = self._move_slider(
+                slider_handle, km, slider_track, DISTANCE_BOUNDS
             )
             logger.info(
-                "Ended slider with distance from "
-                f"{updated_percentage * 1.61:.1f} km to "
-                f"{final_percentage * 1.61:.1f} km\n\n"
+                f"Moved distance slider from {start} km to {final} km "
+                f"(target {km} km)\n\n"
             )
-
+            return final == target
         except Exception as e:
             logger.info(f"Error setting distance range: {e}")
+            return False
+
+    def set_age_range(self, min_age, max_age) -> bool:
+        """
+        Sets the age range by dragging each handle once.
 
-    def set_age_range(self, min_age, max_age) -> None:
-        """Sets the age range using slider manipulation."""
+        :return: Whether both handles reached their (clamped) target.
+        """
         try:
-            min_slider = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, '//*[@data-testid="min-age-handle"]')
-                )
+            min_slider = SELECTORS.find(
+                self.browser, 'preferences.min_age_handle',
+                timeout=self.WEBDRIVER_WAIT_TIME
             )
-            max_slider = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, '//*[@data-testid="max-age-handle"]')
-                )
+            max_slider = SELECTORS.find(
+                self.browser, 'preferences.max_age_handle',
+                timeout=self.WEBDRIVER_WAIT_TIME
             )
 
-            def adjust_slider(slider, target_age, slider_type) -> int:
-                current_age = int(slider.get_attribute('aria-valuenow'))
+            min_age, max_age = age_bounds(min_age, max_age)
+
+            # Move the minimum first, unless it would have to pass
+            # the current maximum.
+            moves = [
+                (min_slider, min_age, "Minimum"),
+                (max_slider, max_age, "Maximum"),
+            ]
+            if min_age > int(max_slider.get_attribute('aria-valuenow')):
+                moves.reverse()
+
+            final = {}
+            reached = True
+            for slider, target, slider_type in moves:
+                start, final[slider_type], target = self._move_slider(
+                    slider, target, bounds=AGE_BOUNDS
+                )
+                reached &= final[slider_type] == target
                 logger.info(
-                    f"\nAdjusting {slider_type} from {current_age} "
-                    f"to {target_age} years")
-
-                if current_age == target_age:
-                    return current_age
-
-                # Start holding the slider
-                action = ActionChains(self.browser)
-                action.click_and_hold(slider)
-                action.perform()
-                time.sleep(0.1)
-
-                while True:
-                    current_age = int(slider.get_attribute('aria-valuenow'))
-                    if current_age == target_age:
-                        break
-
-                    # Calculate movement based on distance to target
-                    age_diff = target_age - current_age
-                    # Movement grows with distance but stays proportional
-                    movement = abs(age_diff) * 0.5
-                    pixels = movement if age_diff > 0 else -movement
-
-                    action = ActionChains(self.browser)
-                    action.move_by_offset(pixels, 0)
-                    action.perform()
-                    time.sleep(0.1)
-
-                    # Prevent infinite loop if we can't hit exact target
-                    if abs(age_diff) <= 1:
-                        break
-
-                # Release the slider
-                action = ActionChains(self.browser)
-                action.release()
-                action.perform()
-
-                final_age = int(slider.get_attribute('aria-valuenow'))
-                logger.info(f"Finished at age: {final_age}")
-                return final_age
-
-            # Adjust both sliders
-            min_age = max(18, min(min_age, 100))
-            max_age = min(100, max(max_age, min_age))
-
-            final_min = adjust_slider(min_slider, min_age, "Minimum")
-            time.sleep(0.3)
-            final_max = adjust_slider(max_slider, max_age, "Maximum")
-
-            logger.info(f"Final age range: {final_min}-{final_max} years")
+                    f"Adjusted {slider_type} from {start} "
+                    f"to {final[slider_type]} years"
+                )
 
+            logger.info(
+                f"Final age range: {final['Minimum']}-{final['Maximum']} "
+                "years"
+            )
+            return reached
         except Exception as e:
             logger.info(f"Error setting age range: {e}")
-
-    def set_sexuality(self, type: Sexuality) -> None:
+            return False
+
+    def _move_slider(
+        self,
+        handle,
+        target: int,
+        rail=None,
+        bounds: Tuple[int, int] = DISTANCE_BOUNDS
+    ) -> Tuple[int, int, int]:
+        """
+        Drag a slider handle to `target` in a single action.
+
+        The pixel offset is computed from one read of the rail geometry
+        and the handle's value bounds, assuming a linear rail. If the
+        handle does not land exactly (rounding, a rail that does not
+        start at the minimum), up to MAX_SLIDER_CORRECTIONS further
+        drags by the remaining difference follow.
+
+        :param handle: The slider handle (role=slider) element.
+        :param target: The value to set, clamped to the slider's bounds.
+        :param rail: The rail element, the handle's parent if None.
+        :param bounds: The slider's value bounds, if the handle
+            does not expose them through aria-valuemin/aria-valuemax.
+        :return: The value before and after the move, and the clamped
+            target.
+        """
+        state = self.browser.execute_script(
+            SLIDER_STATE_SCRIPT, handle, rail, list(bounds)
+        )
+        low, high = state['min'], state['max']
+        target = min(max(target, low), high)
+        start = value = state['now']
+        if value == target or high <= low:
+            return start, value, target
+
+        pixels_per_unit = state['width'] / (high - low)
+        offset = (
+            state['left'] + (target - low) * pixels_per_unit - state['center']
+        )
+        for _ in range(1 + MAX_SLIDER_CORRECTIONS):
+            self._drag(handle, offset)
+            value = int(handle.get_attribute('aria-valuenow'))
+            if value == target:
+                break
+            offset = (target - value) * pixels_per_unit
+        return start, value, target
+
+    def _drag(self, handle, offset: float) -> None:
+        """Press the handle, move it horizontally by `offset` and release."""
+        # Moves are whole pixels, never round a needed move away
+        pixels = round(offset) or (1 if offset > 0 else -1)
+        action = ActionChains(self.browser).click_and_hold(handle)
+        action.move_by_offset(pixels, 0).release().perform()
+
+    def set_sexuality(self, type: Sexuality) -> bool:
         """
         Sets the sexuality preference with enhanced error handling.
+
+        :return: Whether the option was selected.
         """
+        selected = False
         try:
             # Locate the "Looking for" button
-            settings_button_xpath = (
-                "//button[@aria-label='Looking for' and "
-                "not(@data-id) and not(@data-route)]")
-            settings_button = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.element_to_be_clickable((By.XPATH, settings_button_xpath))
+            settings_button = SELECTORS.find(
+                self.browser, 'preferences.looking_for_button',
+                timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
             )
 
             # Click the settings button
             actions = ActionChains(self.browser)
             actions.move_to_element(settings_button).click().perform()
-            time.sleep(0.3)
+            clock.sleep(0.3)
 
             # Wait for the checkbox list to appear
-            WebDriverWait(self.browser, self.WEBDRIVER_WAIT_TIME).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//ul[contains(@class, 'List')]")
-                )
+            SELECTORS.find(
+                self.browser, 'preferences.looking_for_list',
+                timeout=self.WEBDRIVER_WAIT_TIME
             )
 
             # Uncheck all selected checkboxes
-            checkboxes = self.browser.find_elements(
-                By.XPATH, "//input[@type='checkbox']"
+            checkboxes = SELECTORS.find_all(
+                self.browser, 'preferences.checkboxes'
             )
             for checkbox in checkboxes:
                 try:
                     if checkbox.is_selected():
-                        label = checkbox.find_element(
-                            By.XPATH,
-                            f"//label[@for='{checkbox.get_attribute('id')}']"
+                        label = SELECTORS.find(
+                            checkbox, 'preferences.checkbox_label',
+                            id=checkbox.get_attribute('id')
                         )
                         actions.move_to_element(label).click().perform()
                 except StaleElementReferenceException:
@@ -260,22 +472,22 @@ class PreferencesService:
                         "Checkbox element became stale; "
                         "attempting to refresh and continue.")
                     # Refresh the list of checkboxes
-                    checkboxes = self.browser.find_elements(
-                        By.XPATH, "//input[@type='checkbox']"
+                    checkboxes = SELECTORS.find_all(
+                        self.browser, 'preferences.checkboxes'
                     )
 
             # Locate and select the given option
-            option_xpath = f"//label[contains(., '{type.value}')]"
-            option = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.element_to_be_clickable((By.XPATH, option_xpath))
+            option = SELECTORS.find(
+                self.browser, 'preferences.gender_option',
+                timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable',
+                value=type.value
             )
             actions.move_to_element(option).click().perform()
+            selected = True
 
         except StaleElementReferenceException:
             logger.info("Element became stale during interaction. Retrying...")
-            self.set_sexuality(type)  # Retry the operation
+            selected = self.set_sexuality(type)  # Retry the operation
         except TimeoutException:
             logger.info(
                 "Timed out waiting for elements. Please check the page state."
@@ -285,48 +497,39 @@ class PreferencesService:
         finally:
             # Close the settings menu
             self.navigate_to_main_settings()
+        return selected
 
-    def set_global(self, enable_global: bool) -> None:
+    def set_global(self, enable_global: bool) -> bool:
         """
-        Toggle global mode to ensure it's explicitly set.
+        Set global mode, clicking the toggle only if it differs.
         :param enable_global:
             Boolean indicating whether to enable or disable global mode.
+        :return: Whether the toggle ended up in the requested state.
         """
+        expected = str(enable_global).lower()
         try:
             # Locate the toggle input element for the Global option
-            xpath_global_toggle = (
-                '//input[@name="global" and @type="checkbox"]'
+            global_toggle = SELECTORS.find(
+                self.browser, 'preferences.global_toggle',
+                timeout=self.WEBDRIVER_WAIT_TIME
             )
-            global_toggle = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.presence_of_element_located((By.XPATH, xpath_global_toggle))
-            )
-
-            # Check the current state of the toggle
-            is_activated = global_toggle.get_attribute(
-                "aria-checked"
-            ) == "true"
 
-            if enable_global != is_activated:
+            if global_toggle.get_attribute("aria-checked") != expected:
                 global_toggle.click()
-            else:
-                # Toggle just to be sure
-                global_toggle.click()  # Turn it off
                 WebDriverWait(self.browser, self.WEBDRIVER_WAIT_TIME).until(
                     lambda _: global_toggle.get_attribute(
                         "aria-checked"
-                    ) == str(not enable_global).lower()
+                    ) == expected
                 )
-                time.sleep(0.5)
-                global_toggle.click()  # Turn it back on
 
             logger.info(
                 f"Global mode "
                 f"{'enabled' if enable_global else 'disabled'} "
             )
+            return True
         except Exception as e:
             logger.error(f"Error occurred in set_global: {e}")
+            return False
 
     def navigate_to_main_settings(self) -> None:
         """
@@ -334,13 +537,9 @@ class PreferencesService:
         """
         actions = ActionChains(self.browser)
         # Navigate back to the main settings page
-        profile_button_xpath = (
-            "//a[@title='My Profile' and contains(@href, '/app/profile')]"
-        )
-        profile_button = WebDriverWait(
-            self.browser, self.WEBDRIVER_WAIT_TIME
-        ).until(
-            EC.element_to_be_clickable((By.XPATH, profile_button_xpath))
+        profile_button = SELECTORS.find(
+            self.browser, 'preferences.my_profile_link',
+            timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
         )
         actions.move_to_element(profile_button).click().perform()
         logger.info("Navigated back to the main settings page.")
@@ -350,13 +549,9 @@ class PreferencesService:
         Navigate back to the main screen for swiping/liking profiles.
         """
         actions = ActionChains(self.browser)
-        back_button_xpath = (
-            "//a[@title='Back' and contains(@href, '/app/recs')]"
-        )
-        back_button = WebDriverWait(
-            self.browser, self.WEBDRIVER_WAIT_TIME
-        ).until(
-            EC.element_to_be_clickable((By.XPATH, back_button_xpath))
+        back_button = SELECTORS.find(
+            self.browser, 'preferences.back_link',
+            timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
         )
         actions.move_to_element(back_button).click().perform()
         logger.info("Navigated back to the main screen for liking profiles.")
@@ -0,0 +1,153 @@
+from tinder_ai.shared import MatchProfile
+from tinder_ai.utils import clock
+
+from logging import getLogger
+from pathlib import Path
+from typing import Optional, Union
+import sqlite3
+
+
+logger = getLogger(__name__)
+
+
+class ProfileStore:
+    """
+    A local SQLite cache of extracted match profiles, keyed by match id.
+
+    Stores each `MatchProfile` including its message history, so a
+    later cycle can skip re-extracting a profile that is still fresh.
+    Entries older than `ttl` seconds are treated as missing and evicted,
+    however often they are read, and the store keeps at most
+    `max_entries`, dropping the least recently used ones first.
+    """
+
+    DEFAULT_TTL = 24 * 60 * 60
+    DEFAULT_MAX_ENTRIES = 1000
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ":memory:",
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        """
+        :param path: Database file, in memory by default.
+        :param ttl: Seconds an entry stays fresh.
+        :param max_entries: Maximum number of stored profiles.
+        """
+        self.path = str(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS profiles (
+                match_id TEXT PRIMARY KEY,
+                profile TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+        self.evict()
+
+    def __enter__(self) -> 'ProfileStore':
+        return self
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM profiles"
+        ).fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def get(self, match_id: str) -> Optional[MatchProfile]:
+        """Return the cached profile if present and fresh, else None."""
+        now = clock.now()
+        row = self._connection.execute(
+            "SELECT profile FROM profiles "
+            "WHERE match_id = ? AND updated_at >= ?",
+            (match_id, now - self.ttl)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self._connection.execute(
+            "UPDATE profiles SET accessed_at = ? WHERE match_id = ?",
+            (now, match_id)
+        )
+        self._connection.commit()
+        self.hits += 1
+        return MatchProfile.model_validate_json(row[0])
+
+    def put(self, profile: MatchProfile) -> None:
+        """
+        Insert or refresh a freshly extracted profile, then enforce
+        the size limit.
+        """
+        if not profile.match_id:
+            raise ValueError("Cannot store a profile without match_id")
+        now = clock.now()
+        self._connection.execute(
+            "INSERT OR REPLACE INTO profiles "
+            "(match_id, profile, updated_at, accessed_at) "
+            "VALUES (?, ?, ?, ?)",
+            (profile.match_id, profile.model_dump_json(), now, now)
+        )
+        self._connection.commit()
+        self.evict()
+
+    def update(self, profile: MatchProfile) -> None:
+        """
+        Replace a stored profile, e.g. with its latest messages, without
+        refreshing it: the entry still expires `ttl` seconds after the
+        profile was put. Does nothing if the profile is not stored.
+        """
+        self._connection.execute(
+            "UPDATE profiles SET profile = ? WHERE match_id = ?",
+            (profile.model_dump_json(), profile.match_id)
+        )
+        self._connection.commit()
+
+    def delete(self, match_id: str) -> None:
+        self._connection.execute(
+            "DELETE FROM profiles WHERE match_id = ?", (match_id,)
+        )
+        self._connection.commit()
+
+    def evict(self) -> int:
+        """
+        Drop expired entries and the least recently used ones
+        above `max_entries`.
+
+        :return: The number of removed entries.
+        """
+        expired = self._connection.execute(
+            "DELETE FROM profiles WHERE updated_at < ?",
+            (clock.now() - self.ttl,)
+        ).rowcount
+        overflow = self._connection.execute(
+            "DELETE FROM profiles WHERE match_id IN ("
+            "SELECT match_id FROM profiles "
+            "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        ).rowcount
+        self._connection.commit()
+
+        if expired or overflow:
+            logger.debug(
+                f"Evicted {expired} expired and {overflow} "
+                "least recently used profiles"
+            )
+        return expired + overflow
@@ -1,28 +1,39 @@
-import undetected_chromedriver as uc
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.common.exceptions import (
     NoSuchElementException,
-    TimeoutException,
-    ElementNotVisibleException,
-    StaleElementReferenceException
+    TimeoutException
 )
 
 import time
-from tinder_ai.services.preferences import PreferencesService
+from tinder_ai.utils import clock
+from tinder_ai.services.preferences import (
+    AppliedPreferences,
+    PreferencesService
+)
 from tinder_ai.services.login import LoginService
-from tinder_ai.services.messenger_api import BaseMessengerService
+from tinder_ai.services.messenger_api import (
+    BaseMessengerService,
+    GenerationResult
+)
 from tinder_ai.constants.models import LoginMethods, SessionData
+from tinder_ai.constants.selectors import SELECTORS
 from tinder_ai.settings import Settings
 from tinder_ai.utils.utils import random_sleep
+from tinder_ai.utils.readiness import wait_for_any, wait_for_element
+from tinder_ai.utils.browser import build_chrome_options, launch_browser
+from tinder_ai.utils.metrics import METRICS
+from tinder_ai.utils.recording import Recorder
+from tinder_ai.utils.tracing import Tracer, traced
 from pathlib import Path
 import random
 from tinder_ai.services.match import Match
-from tinder_ai.services.location import LocationService
+from tinder_ai.services.location import GeoCache, LocationService
+from tinder_ai.services.popups import PopupDetector
+from tinder_ai.services.store import ProfileStore
 from logging import getLogger
-from typing import Literal, List
+from typing import Iterator, Literal, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from tinder_ai.shared import MatchReadyException
 
 
@@ -33,92 +44,195 @@ class Session:
 
     WEBDRIVER_WAIT_TIME = 10
     DEFAULT_WINDOW_SIZE = (1250, 750)
+    USER_DATA_DIR = Path(__file__).parent.parent / "user_data"
+    TINDER_URL = "https://tinder.com/?lang=en"
 
     def __init__(
         self,
         settings: Settings,
         messenger_service: BaseMessengerService,
-        mock: bool = False,
-        headless: bool = False,
-        persist_user_data: bool = False
+        mock: Optional[bool] = None,
+        headless: Optional[bool] = None,
+        persist_user_data: Optional[bool] = None,
+        pipeline: Optional[bool] = None,
+        pipeline_workers: Optional[int] = None,
+        batch: Optional[bool] = None,
+        profile_store: Optional[ProfileStore] = None,
+        cache_driver: Optional[bool] = None,
+        debugger_address: Optional[str] = None,
+        metrics_dir: Optional[Path] = None,
+        trace_path: Optional[Path] = None,
+        record_path: Optional[Path] = None,
+        browser: Optional[WebDriver] = None
     ) -> None:
         """
         Initializes a session with support for a local proxy server.
         :param settings:
-            Configuration settings containing proxy details.
+            Configuration settings: proxy details, preferences and
+            the run mode (`mock`, `pipeline`, `metrics_dir`, ...,
+            see the Session section of `Settings`). The arguments
+            below override their run mode fields when not None.
         :type settings:
             Settings
         :param messenger_service:
             Service for handling messaging operations.
         :type messenger_service:
             BaseMessengerService
+        :param mock:
+            Generate messages but do not send them, defaults to
+            `settings.mock`.
+        :type mock:
+            bool, optional
         :param headless:
-            Run the browser in headless mode, defaults to False.
+            Run the browser in headless mode, defaults to
+            `settings.headless`.
         :type headless:
             bool, optional
         :param persist_user_data:
-            Persist user data across sessions, defaults to False.
+            Persist user data across sessions, defaults to
+            `settings.persist_user_data`.
         :type persist_user_data:
             bool, optional
+        :param pipeline:
+            Generate messages in the background while the next items
+            are extracted, defaults to `settings.pipeline`.
+        :type pipeline:
+            bool, optional
+        :param pipeline_workers:
+            Messages generated at a time in pipeline mode, defaults
+            to `settings.pipeline_workers`.
+        :type pipeline_workers:
+            int, optional
+        :param batch:
+            Extract all items of a cycle first and generate their
+            messages in one batched call, defaults to `settings.batch`.
+        :type batch:
+            bool, optional
+        :param profile_store:
+            Cache of extracted profiles, fresh profiles are not
+            extracted again, defaults to None.
+        :type profile_store:
+            ProfileStore, optional
+        :param cache_driver:
+            Reuse the patched chromedriver binary across runs,
+            defaults to `settings.cache_driver`.
+        :type cache_driver:
+            bool, optional
+        :param debugger_address:
+            host:port of a local Chrome to attach to and leave running
+            on exit, defaults to `settings.debugger_address`.
+        :type debugger_address:
+            str, optional
+        :param metrics_dir:
+            Directory to export the metrics to, defaults to
+            `settings.metrics_dir`.
+        :type metrics_dir:
+            Path, optional
+        :param trace_path:
+            Trace every WebDriver command and write a Chrome trace
+            JSON file here on exit, defaults to `settings.trace_path`.
+        :type trace_path:
+            Path, optional
+        :param record_path:
+            Record every WebDriver command and response to this file
+            on exit, for `testing.ReplayDriver`, defaults to
+            `settings.record_path`.
+        :type record_path:
+            Path, optional
+        :param browser:
+            An already started WebDriver to use instead of launching
+            Chrome, e.g. a `testing.ReplayDriver`. Its window size is
+            left as is, defaults to None.
+        :type browser:
+            WebDriver, optional
         """
-        self.session_data = SessionData()
-        self.mock = mock
-        self.start_session = time.time()
-
-        options = uc.ChromeOptions()
-        options.binary_location = "/usr/bin/google-chrome"
-        options.add_argument("homepage=http://example.com")
-        options.add_argument("--disable-notifications")
-        options.add_argument(
-            '--no-first-run --no-service-autorun --password-store=basic'
+        settings = settings.with_overrides(
+            mock=mock,
+            headless=headless,
+            persist_user_data=persist_user_data,
+            pipeline=pipeline,
+            pipeline_workers=pipeline_workers,
+            batch=batch,
+            cache_driver=cache_driver,
+            debugger_address=debugger_address,
+            metrics_dir=metrics_dir,
+            trace_path=trace_path,
+            record_path=record_path
         )
-        options.add_argument("--lang=en")
-        options.add_argument("--disable-webrtc")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument(
-            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-            " AppleWebKit/537.36 (KHTML, like Gecko)"
-            " Chrome/112.0.5615.138"
-            " Safari/537.36"
+        self.session_data = SessionData()
+        self.mock = settings.mock
+        self.pipeline = settings.pipeline
+        self.pipeline_workers = settings.pipeline_workers
+        self.batch = settings.batch
+        self.profile_store = profile_store
+        self.metrics_dir = settings.metrics_dir
+        self.start_session = clock.now()
+        METRICS.reset()
+
+        self.debugger_address = settings.debugger_address
+        self.settings = settings
+        self.applied_preferences = AppliedPreferences(
+            path=self.USER_DATA_DIR / "preferences.json"
         )
 
-        if persist_user_data:
-            user_data_dir = Path(__file__).parent.parent / "user_data"
-            options.add_argument(f"--user-data-dir={user_data_dir}")
-
-        if settings.proxy_url is not None:
-            # Use local proxy server
-            logger.info(
-                "Routing traffic through local proxy server: "
-                f"{settings.proxy_url}"
+        location_setter = LocationService(
+            browser=None,
+            settings=self.settings,
+            resolver_url=self.settings.geo_resolver_url,
+            cache=GeoCache(
+                path=self.USER_DATA_DIR / "geo_cache.json",
+                ttl=self.settings.geo_cache_ttl
             )
-            options.add_argument(f"--proxy-server={settings.proxy_url}")
-
-        if headless:
-            options.headless = True
-
-        # Allow geolocation by default
-        options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values.geolocation": 1
-        })
+        )
 
-        # Initialize the browser
-        self.browser = uc.Chrome(options=options)
+        # The location lookup only needs the network, so it runs
+        # while Chrome starts and is applied once both are done.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            location = executor.submit(
+                self._timed_phase,
+                'location',
+                location_setter.resolve_location
+            )
+            if browser is not None:
+                self.browser = browser
+            else:
+                self.browser = self._timed_phase(
+                    'browser',
+                    self._launch_browser,
+                    settings=settings
+                )
+                self._timed_phase(
+                    'window',
+                    self.browser.set_window_size,
+                    *self.DEFAULT_WINDOW_SIZE
+                )
+            coords = location.result()
 
-        self.browser.set_window_size(*self.DEFAULT_WINDOW_SIZE)
-        self.settings = settings
+        self.record_path = settings.record_path
+        self.recorder = (
+            Recorder(self.browser).install() if self.record_path else None
+        )
+        self.trace_path = settings.trace_path
+        self.tracer = (
+            Tracer(self.browser).install() if self.trace_path else None
+        )
 
-        location_setter = LocationService(
-            browser=self.browser,
-            settings=self.settings
+        location_setter.browser = self.browser
+        self._timed_phase(
+            'geolocation', location_setter.apply_location, coords
         )
-        location_setter.configure_location()
 
         self.messenger_service = messenger_service
+        self.popups = PopupDetector(browser=self.browser)
 
-        random_sleep()
+        self._timed_phase('settle', random_sleep)
+        self.session_data.startup_timings['total'] = (
+            clock.now() - self.start_session
+        )
 
-        self.started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+        self.started = time.strftime(
+            "%Y-%m-%d %H:%M:%S", time.localtime(clock.now())
+        )
         logger.info(f"Started session: {self.started}\n\n")
 
     def __enter__(self) -> 'Session':
@@ -126,32 +240,126 @@ class Session:
 
     def __exit__(self, *args, **kwargs) -> None:
         """Clean up when exiting context."""
-        seconds = int(time.time() - self.start_session)
-        self.session_data.duration = seconds
+        self.export_metrics()
 
         logger.info(self.session_data)
+        logger.debug(f"Locator statistics:\n{SELECTORS.report()}")
+        if self.profile_store is not None:
+            logger.info(
+                f"Profile cache: {self.profile_store.hits} hits, "
+                f"{self.profile_store.misses} misses"
+            )
+        if self.popups.hit_counts:
+            logger.info(
+                f"Popups dismissed: {dict(self.popups.hit_counts)} "
+                f"in {self.popups.probes} probes"
+            )
+        if self.tracer is not None:
+            logger.info(f"WebDriver round trips:\n{self.tracer.report()}")
+            self.tracer.export_chrome_trace(self.trace_path)
+            self.tracer.uninstall()
+        if self.recorder is not None:
+            self.recorder.uninstall()
+            self.recorder.save(self.record_path)
         logger.info(
             "Ended session: "
-            f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())}"
+            + time.strftime(
+                '%Y-%m-%d %H:%M:%S', time.localtime(clock.now())
+            )
         )
 
-        self.browser.quit()
+        if self.debugger_address is None:
+            self.browser.quit()
+        else:
+            # Only stop the driver, the browser stays warm.
+            logger.info(f"Leaving Chrome running on {self.debugger_address}")
+            self.browser.service.stop()
 
-    def set_preferences(self) -> None:
+    def export_metrics(self) -> None:
+        """
+        Export the metrics collected so far to `metrics_dir`.
+
+        Appends a snapshot to metrics.jsonl and rewrites metrics.prom,
+        does nothing if no `metrics_dir` is set.
+        """
+        self.session_data.duration = int(clock.now() - self.start_session)
+        if self.metrics_dir is None:
+            return
+
+        counters = self.session_data.counters()
+        try:
+            METRICS.write_jsonl(
+                self.metrics_dir / "metrics.jsonl",
+                extra={
+                    'session': counters,
+                    'startup': self.session_data.startup_timings,
+                }
+            )
+            METRICS.write_prometheus(
+                self.metrics_dir / "metrics.prom", gauges=counters
+            )
+        except OSError as e:
+            logger.warning(f"Unable to export metrics: {e}")
+
+    def _timed_phase(self, name: str, function, *args, **kwargs):
+        """Run one startup phase and record its duration."""
+        start = clock.monotonic()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.session_data.startup_timings[name] = (
+                clock.monotonic() - start
+            )
+
+    def _launch_browser(
+        self,
+        settings: Settings
+    ):
+        """Start Chrome, or attach to it if a debugger address is set."""
+        options = build_chrome_options(
+            proxy_url=settings.proxy_url,
+            headless=settings.headless,
+            user_data_dir=(
+                self.USER_DATA_DIR if settings.persist_user_data else None
+            )
+        )
+        return launch_browser(
+            options,
+            cache_driver=settings.cache_driver,
+            debugger_address=self.debugger_address,
+            user_data_dir=self.USER_DATA_DIR
+        )
+
+    @traced()
+    def set_preferences(self, force: bool = False) -> None:
         """
         Sets user preferences using the PreferencesService.
 
-        This method initializes the PreferencesService
-        with the current browser instance
-        and applies the user settings to set preferences.
+        Skips the profile page entirely if the same settings were
+        applied to the same account before (see AppliedPreferences).
+
+        Args:
+            force (bool):
+                Open the profile page and compare every control
+                even if the settings did not change.
 
         Returns:
             None
         """
-        PreferencesService(
+        if not force and self.applied_preferences.matches(self.settings):
+            logger.info("Preferences unchanged since last applied, skipping")
+            return
+
+        applied = PreferencesService(
             browser=self.browser
         ).set_preferences(settings=self.settings)
+        if applied:
+            self.applied_preferences.record(self.settings)
+        else:
+            self.applied_preferences.clear()
 
+    @METRICS.time('login')
+    @traced()
     def login(self, method: LoginMethods) -> None:
         """
         Logs in the user using the specified login method.
@@ -213,11 +421,12 @@ class Session:
         else:
             raise Exception("Unsupported login method")
 
-        # After attempting to log in, check again
-        if not self._is_logged_in():
+        # After attempting to log in, wait for the app
+        if not self._wait_for_app():
             logger.warning('Unable to login, solve (the captcha) manually.')
             input('Press any key to continue')
 
+    @traced()
     def start_swiping(self, ratio='90%') -> None:
         """
         Start liking or disliking profiles with a given ratio (e.g., '80%').
@@ -244,30 +453,26 @@ class Session:
                 )
             except NoSuchElementException as e:
                 logger.warning(f"Element not found: {e}. Retrying...")
-                self.browser.refresh()
-                time.sleep(self.WEBDRIVER_WAIT_TIME)
+                self._refresh_and_wait()
             except TimeoutException as e:
                 logger.warning(f"Timeout encountered: {e}. Retrying...")
-                self.browser.refresh()
-                time.sleep(self.WEBDRIVER_WAIT_TIME)
+                self._refresh_and_wait()
             except Exception as e:
                 logger.error(
                     f"Unexpected error occurred: {e}. Skipping this iteration."
                 )
 
+    @METRICS.time('navigation')
+    @traced()
     def go_to_matches(self) -> None:
         """
         Navigate to the "Matches" tab.
         """
         try:
-            # XPath for the "Matches" button
-            matches_button_xpath = '//button[contains(text(), "Matches")]'
-
-            # Wait for the button to be clickable
-            matches_button = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.element_to_be_clickable((By.XPATH, matches_button_xpath))
+            # Wait for the "Matches" button to be clickable
+            matches_button = SELECTORS.find(
+                self.browser, 'session.matches_tab',
+                timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
             )
 
             # Click the "Matches" button
@@ -284,19 +489,17 @@ class Session:
             )
             raise
 
+    @METRICS.time('navigation')
+    @traced()
     def go_to_messages(self) -> None:
         """
         Navigate to the "Messages" tab.
         """
         try:
-            # XPath for the "Messages" button
-            messages_button_xpath = '//button[contains(text(), "Messages")]'
-
-            # Wait for the button to be clickable
-            messages_button = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.element_to_be_clickable((By.XPATH, messages_button_xpath))
+            # Wait for the "Messages" button to be clickable
+            messages_button = SELECTORS.find(
+                self.browser, 'session.messages_tab',
+                timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
             )
 
             # Click the "Messages" button
@@ -325,30 +528,76 @@ class Session:
         """
         Checks if the user is logged into Tinder.
 
-        This method verifies if the current URL of the
-        browser contains "tinder.com".
-        If not, it navigates to the Tinder homepage
-        and waits until the URL contains "tinder.com".
-        Then, it waits for the Tinder app page
-        to load and confirms if the user is logged in.
+        Answers from the current URL if the app is already open.
+        Otherwise Tinder is opened, unless it already is. A browser
+        profile without any Tinder cookies cannot be logged in, which
+        one CDP call tells without waiting for the page. With cookies,
+        a single in-page wait resolves as soon as the page shows either
+        the app or the login button.
 
         Returns:
             bool: True if the user is logged in, False otherwise.
         """
-        if "tinder.com" not in self.browser.current_url:
-            self.browser.get("https://tinder.com/?lang=en")
-            try:
-                WebDriverWait(self.browser, self.WEBDRIVER_WAIT_TIME).until(
-                    EC.url_contains("tinder.com")
-                )
-            except TimeoutException:
-                logger.info("Timeout while waiting for Tinder to load.")
-                return False
+        url = self.browser.current_url
+        if "tinder.com/app" in url:
+            logger.info("User is logged in.")
+            return True
+
+        has_cookies = self._has_tinder_cookies()
+        if "tinder.com" not in url:
+            self.browser.get(self.TINDER_URL)
+        if not has_cookies:
+            logger.info("No Tinder cookies in the browser profile.")
+            return False
 
         try:
-            # Wait for the app page
-            WebDriverWait(self.browser, self.WEBDRIVER_WAIT_TIME).until(
-                EC.url_contains("tinder.com/app")
+            index, _ = wait_for_any(
+                self.browser,
+                [
+                    SELECTORS.xpath('session.matches_tab'),
+                    SELECTORS.xpath('login.login_button'),
+                ],
+                timeout=self.WEBDRIVER_WAIT_TIME
+            )
+        except TimeoutException:
+            logger.info("Timeout while waiting for Tinder to load.")
+            return False
+
+        if index == 0:
+            logger.info("User is logged in.")
+            return True
+        logger.info(
+            "User is not logged in yet. Current URL:\n "
+            f"{self.browser.current_url}"
+        )
+        return False
+
+    def _has_tinder_cookies(self) -> bool:
+        """
+        Whether the browser profile has any cookies for tinder.com,
+        read through CDP so it works from any page. True if unknown.
+        """
+        try:
+            cookies = self.browser.execute_cdp_cmd(
+                "Network.getCookies", {"urls": [self.TINDER_URL]}
+            ).get("cookies", [])
+        except Exception as e:
+            logger.debug(f"Unable to read cookies: {e}")
+            return True
+        return bool(cookies)
+
+    def _wait_for_app(self) -> bool:
+        """
+        Wait until the app is shown, at most WEBDRIVER_WAIT_TIME seconds.
+
+        Returns:
+            bool: True if the app loaded, False otherwise.
+        """
+        try:
+            wait_for_element(
+                self.browser,
+                SELECTORS.xpath('session.matches_tab'),
+                timeout=self.WEBDRIVER_WAIT_TIME
             )
             logger.info("User is logged in.")
             return True
@@ -359,6 +608,27 @@ class Session:
             )
             return False
 
+    @METRICS.time('navigation')
+    @traced()
+    def _refresh_and_wait(self) -> None:
+        """
+        Refresh the page and wait until the swipe controls are rendered,
+        at most WEBDRIVER_WAIT_TIME seconds.
+        """
+        METRICS.inc('refreshes')
+        self.browser.refresh()
+        try:
+            with SELECTORS.timed('session.like_button'):
+                wait_for_element(
+                    self.browser,
+                    SELECTORS.xpath('session.like_button'),
+                    timeout=self.WEBDRIVER_WAIT_TIME,
+                    visible=True
+                )
+        except TimeoutException:
+            logger.debug("Swipe controls did not appear after refresh.")
+
+    @traced()
     def _swipe_once(self, ratio_val: float) -> None:
         """
         Perform a single swipe iteration (like or dislike)
@@ -383,14 +653,9 @@ class Session:
         :return: True if successful, False otherwise.
         """
         try:
-            like_button_xpath = (
-                "//button[contains(@class, 'gamepad-button')]"
-                "[.//span[contains(@class, 'Hidden') and text()='Like']]"
-            )
-            like_button = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.element_to_be_clickable((By.XPATH, like_button_xpath))
+            like_button = SELECTORS.find(
+                self.browser, 'session.like_button',
+                timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
             )
 
             actions = ActionChains(self.browser)
@@ -408,15 +673,9 @@ class Session:
         :return: True if successful, False otherwise.
         """
         try:
-            dislike_button_xpath = (
-                "//button[contains(@class, 'gamepad-button')]"
-                "[.//span[contains(@class, 'Hidden') and "
-                "(text()='Nope' or text()='No')]]"
-            )
-            dislike_button = WebDriverWait(
-                self.browser, self.WEBDRIVER_WAIT_TIME
-            ).until(
-                EC.element_to_be_clickable((By.XPATH, dislike_button_xpath))
+            dislike_button = SELECTORS.find(
+                self.browser, 'session.dislike_button',
+                timeout=self.WEBDRIVER_WAIT_TIME, condition='clickable'
             )
 
             actions = ActionChains(self.browser)
@@ -428,6 +687,7 @@ class Session:
             logger.error(f"Error occurred while disliking: {e}")
         return False
 
+    @traced()
     def _handle_items(
         self,
         item_type: Literal['matches', 'unread_messages']
@@ -454,25 +714,19 @@ class Session:
 
         logger.info(f"Found {len(data_list)} items to process")
 
+        if self.batch:
+            self._process_items_batched(item_type, data_list)
+            return
+
+        if self.pipeline:
+            self._process_items_pipelined(item_type, data_list)
+            return
+
         match_obj = None
         # Iterate over match/message data
         for index, item_id in enumerate(data_list[:10]):
             try:
-                # Get the clickable element by ID
-                match_selector = f"a[href*='{item_id}']"
-                match_element = WebDriverWait(self.browser, 10).until(
-                    EC.element_to_be_clickable(
-                        (By.CSS_SELECTOR, match_selector))
-                )
-
-                if item_type == 'matches':
-                    match_obj = Match.from_element(
-                        match_element, self.browser
-                    )
-                else:
-                    match_obj = Match.from_element(
-                        match_element, self.browser, messages=True
-                    )
+                match_obj = self._open_item(item_type, item_id)
 
                 # Validatation
                 if not match_obj.profile.name:
@@ -488,25 +742,8 @@ class Session:
                 random_sleep()
 
                 # Generate either an opener or a reply
-                if item_type == 'matches':
-                    message_to_send = self.messenger_service.generate_opener(
-                        profile=match_obj.profile
-                    ).message
-                else:
-                    message_to_send = self.messenger_service.generate_reply(
-                        profile=match_obj.profile,
-                        last_messages=match_obj.profile.last_messages,
-                    ).message
-
-                if message_to_send:
-                    if item_type == 'matches':
-                        match_obj.send_opener(message_to_send, mock=self.mock)
-                        self.session_data.sent_openings += 1
-                    else:
-                        match_obj.send_reply(message_to_send, mock=self.mock)
-                        self.session_data.sent_replies += 1
-                else:
-                    logger.info("No message to send.")
+                message_to_send = self._generate_message(item_type, match_obj)
+                self._deliver_message(item_type, match_obj, message_to_send)
 
                 random_sleep()
 
@@ -520,28 +757,264 @@ class Session:
                 continue
             finally:
                 if match_obj is not None:
-                    if item_type == 'matches':
-                        self.go_to_matches()
-                    else:
-                        match_obj.close_profile()
+                    self._leave_item(item_type, match_obj)
+
+    def _process_items_pipelined(
+        self,
+        item_type: Literal['matches', 'unread_messages'],
+        data_list: List[str]
+    ) -> None:
+        """
+        Process items with message generation overlapped with extraction.
+
+        All items are extracted first, each generation request is handed
+        to a background executor as soon as its profile is known, so the
+        messenger works on item N while the browser extracts item N+1.
+        Messages are then delivered in the original item order.
+        """
+        pending = []
+        with ThreadPoolExecutor(
+            max_workers=self.pipeline_workers,
+            thread_name_prefix="messenger"
+        ) as executor:
+            # Phase 1: extract and start generating
+            for match_obj in self._extract_items(item_type, data_list):
+                pending.append((
+                    match_obj,
+                    executor.submit(
+                        self._generate_message, item_type, match_obj
+                    )
+                ))
+
+            # Phase 2: deliver in order
+            self._deliver_items(item_type, pending)
+
+    def _process_items_batched(
+        self,
+        item_type: Literal['matches', 'unread_messages'],
+        data_list: List[str]
+    ) -> None:
+        """
+        Process items with one batched message generation.
+
+        All items are extracted first, then their messages are generated
+        in a single messenger call, which lets the backend batch them,
+        and delivered in the original item order.
+        """
+        extracted = list(self._extract_items(item_type, data_list))
+        if not extracted:
+            return
+        try:
+            results = self._generate_messages(item_type, extracted)
+        except Exception as e:
+            logger.error(f"Error generating messages: {e}")
+            return
+
+        pending = []
+        for match_obj, result in zip(extracted, results):
+            future = Future()
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result.message)
+            pending.append((match_obj, future))
+        self._deliver_items(item_type, pending)
+
+    def _extract_items(
+        self,
+        item_type: Literal['matches', 'unread_messages'],
+        data_list: List[str]
+    ) -> Iterator[Match]:
+        """
+        Open and extract up to 10 items, yielding each one with a
+        profile while it is still open, and leave it afterwards.
+        """
+        for index, item_id in enumerate(data_list[:10]):
+            match_obj = None
+            try:
+                match_obj = self._open_item(item_type, item_id)
+
+                if not match_obj.profile.name:
+                    logger.warning(
+                        "Could not extract data properly "
+                        f"for {item_id}, skipping..."
+                    )
+                    continue
+
+                logger.info(
+                    f"Extracted {index + 1} of {len(data_list)} "
+                    f"- {match_obj.profile.name, match_obj.profile.age}")
+                yield match_obj
+                random_sleep()
+            except Exception as e:
+                logger.error(f"Error processing item: {e}")
+            finally:
+                if match_obj is not None:
+                    self._leave_item(item_type, match_obj)
+
+    def _deliver_items(
+        self,
+        item_type: Literal['matches', 'unread_messages'],
+        pending: List[Tuple[Match, Future]]
+    ) -> None:
+        """
+        Deliver generated messages in order, reopening each chat.
+        Each future holds the message of its match or the exception
+        generating it raised.
+        """
+        for match_obj, future in pending:
+            reopened = False
+            try:
+                message_to_send = future.result()
+                if message_to_send and not self.mock:
+                    self._reopen_chat(match_obj)
+                    reopened = True
+                self._deliver_message(
+                    item_type, match_obj, message_to_send
+                )
+                random_sleep()
+            except MatchReadyException:
+                logger.info(
+                    f"Match {match_obj.profile.name} is ready to meet."
+                )
+            except Exception as e:
+                logger.error(f"Error processing item: {e}")
+            finally:
+                if reopened:
+                    self._leave_item(item_type, match_obj)
+
+    @METRICS.time('extraction')
+    @traced()
+    def _open_item(
+        self,
+        item_type: Literal['matches', 'unread_messages'],
+        item_id: str
+    ) -> Match:
+        """Open a match or conversation and extract its profile."""
+        # Get the clickable element by ID
+        match_element = SELECTORS.find(
+            self.browser, 'session.item_link',
+            timeout=10, condition='clickable', item_id=item_id
+        )
+        cached_profile = (
+            self.profile_store.get(item_id)
+            if self.profile_store is not None else None
+        )
+        match_obj = Match.from_element(
+            match_element,
+            self.browser,
+            messages=item_type == 'unread_messages',
+            cached_profile=cached_profile
+        )
+        if self.profile_store is not None and match_obj.profile.name:
+            # Reading a cached profile must not extend its lifetime
+            if cached_profile is None:
+                self.profile_store.put(match_obj.profile)
+            else:
+                self.profile_store.update(match_obj.profile)
+        return match_obj
+
+    @METRICS.time('navigation')
+    @traced()
+    def _reopen_chat(self, match_obj: Match) -> None:
+        """Open the chat of an already extracted match again."""
+        SELECTORS.find(
+            self.browser, 'session.item_link',
+            timeout=10, condition='clickable', item_id=match_obj.match_id
+        ).click()
+        with SELECTORS.timed('match.message_input'):
+            wait_for_element(
+                self.browser,
+                SELECTORS.xpath('match.message_input'),
+                timeout=10,
+                url_contains=match_obj.match_id
+            )
+
+    @METRICS.time('messenger_api')
+    @traced()
+    def _generate_message(
+        self,
+        item_type: Literal['matches', 'unread_messages'],
+        match_obj: Match
+    ) -> Optional[str]:
+        """Generate either an opener or a reply."""
+        if item_type == 'matches':
+            return self.messenger_service.generate_opener(
+                profile=match_obj.profile
+            ).message
+        return self.messenger_service.generate_reply(
+            profile=match_obj.profile,
+            last_messages=match_obj.profile.last_messages,
+        ).message
+
+    @METRICS.time('messenger_api')
+    @traced()
+    def _generate_messages(
+        self,
+        item_type: Literal['matches', 'unread_messages'],
+        match_objs: List[Match]
+    ) -> List[GenerationResult]:
+        """Generate the openers or replies of several items in one call."""
+        if item_type == 'matches':
+            return self.messenger_service.generate_openers(
+                [match_obj.profile for match_obj in match_objs]
+            )
+        return self.messenger_service.generate_replies([
+            (match_obj.profile, match_obj.profile.last_messages)
+            for match_obj in match_objs
+        ])
+
+    @traced()
+    def _deliver_message(
+        self,
+        item_type: Literal['matches', 'unread_messages'],
+        match_obj: Match,
+        message_to_send: Optional[str]
+    ) -> None:
+        """Send the generated message (or log it in mock mode)."""
+        if not message_to_send:
+            logger.info("No message to send.")
+            return
+
+        with METRICS.time('message_send'):
+            if item_type == 'matches':
+                match_obj.send_opener(message_to_send, mock=self.mock)
+                self.session_data.sent_openings += 1
+            else:
+                match_obj.send_reply(message_to_send, mock=self.mock)
+                self.session_data.sent_replies += 1
+
+    @METRICS.time('navigation')
+    @traced()
+    def _leave_item(
+        self,
+        item_type: Literal['matches', 'unread_messages'],
+        match_obj: Match
+    ) -> None:
+        """Navigate back from an opened match or conversation."""
+        if item_type == 'matches':
+            self.go_to_matches()
+        else:
+            match_obj.close_profile()
 
     def _get_unread_messages_data(self) -> List[str]:
         """Get list of unread message data"""
         try:
-            message_elements = WebDriverWait(self.browser, 10).until(
-                EC.presence_of_all_elements_located(
-                    (By.CSS_SELECTOR, "a.messageListItem")
-                )
+            message_elements = SELECTORS.find(
+                self.browser, 'session.message_list_item',
+                timeout=10, condition='all'
             )
 
             messages_data = []
             for message in message_elements:
                 try:
-                    message_div = message.find_element(
-                        By.CSS_SELECTOR, "div.messageListItem__message"
+                    message_div = SELECTORS.find(
+                        message, 'session.message_preview'
                     )
 
-                    has_svg = message_div.find_elements(By.TAG_NAME, "svg")
+                    has_svg = SELECTORS.find_all(
+                        message_div, 'session.sent_icon'
+                    )
                     if has_svg:
                         # We sent the last message, skip this chat
                         continue
@@ -561,10 +1034,9 @@ class Session:
     def _get_matches_data(self) -> List[str]:
         """Get list of basic match data (IDs and names)"""
         try:
-            match_elements = WebDriverWait(self.browser, 10).until(
-                EC.presence_of_all_elements_located(
-                    (By.CSS_SELECTOR, "a.matchListItem")
-                )
+            match_elements = SELECTORS.find(
+                self.browser, 'session.match_list_item',
+                timeout=10, condition='all'
             )
 
             matches_data = []
@@ -582,12 +1054,14 @@ class Session:
             logger.error(f"Error getting match elements: {e}")
             return []
 
+    @METRICS.time('popups')
+    @traced()
     def _handle_potential_popups(self) -> None:
         """
         Handles various popups that may appear during the session.
 
-        This method attempts to find and dismiss several types of popups
-        that can interrupt the session. The popups handled include:
+        All popup rules registered on `self.popups` are checked with a
+        single in-page probe. The default rules handle:
         - 'See who liked you' popup
         - 'Upgrade like' popup
         - 'Add Tinder to homescreen' popup
@@ -595,71 +1069,14 @@ class Session:
         - Superlikes popup
 
         If a popup is found,
-        it is dismissed and an appropriate log message is recorded.
-        If a popup is not found,
-        the method continues to check for the next type of popup.
+        it is dismissed and an appropriate log message is recorded,
+        then the page is probed again until no popup is left.
         In case of a stale element reference or an element not being visible,
         the browser is refreshed to attempt to resolve the issue.
 
-        Exceptions handled:
-        - NoSuchElementException: If the popup element is not found.
-        - StaleElementReferenceException: If the popup element becomes stale.
-        - ElementNotVisibleException: If the popup element is not visible.
+        Raises:
+        - NoSuchElementException: If the popup container is not found.
         """
-        # last possible id based div
-        base_element = self.browser.find_element(By.XPATH, '/html/body/div[2]')
-
-        # 'see who liked you' popup
-        try:
-            xpath = './/button/span[contains(text(), "Maybe Later")]'
-            deny_btn = base_element.find_element(By.XPATH, xpath)
-            deny_btn.click()
-            logger.info("POPUP: Dismissed 'Maybe Later'")
-            return
-        except NoSuchElementException:
-            pass
-
-        # 'upgrade like' popup
-        try:
-            xpath = './/main/div/button[2]'
-            base_element.find_element(By.XPATH, xpath).click()
-            logger.info("POPUP: Denied upgrade to superlike")
-            return
-        except NoSuchElementException:
-            pass
-
-        # 'add tinder to homescreen' popup
-        try:
-            xpath = './/main/div/div[2]/button[2]'
-
-            add_to_home_popup = base_element.find_element(By.XPATH, xpath)
-            add_to_home_popup.click()
-            logger.info("POPUP: Denied Tinder to homescreen")
-            return
-        except NoSuchElementException:
-            pass
-
-        # match popup
-        try:
-            xpath = '//button[@title="Back to Tinder"]'
-
-            match_popup = base_element.find_element(By.XPATH, xpath)
-            match_popup.click()
-            self.session_data.matches += 1
-        except NoSuchElementException:
-            pass
-        except StaleElementReferenceException:
-            self.browser.refresh()
-
-        # superlikes popup
-        try:
-            xpath = './/main/div/div[3]/button[2]'
-            deny_btn = base_element.find_element(By.XPATH, xpath)
-            deny_btn.click()
-            logger.info("POPUP: Denied buying more superlikes")
-        except ElementNotVisibleException:
-            self.browser.refresh()
-        except NoSuchElementException:
-            pass
-        except StaleElementReferenceException:
-            self.browser.refresh()
+        for rule in self.popups.dismiss():
+            if rule.name == 'match':
+                self.session_data.matches += 1
@@ -1,6 +1,7 @@
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from tinder_ai.constants.models import Sexuality
+from pathlib import Path
 from typing import Optional
 from tinder_ai.constants.models import LoginMethods
 
@@ -15,9 +16,14 @@ class Settings(BaseSettings):
 
     # Messenger Service
     messenger_api: Optional[str] = Field(None, env="MESSENGER_API")
+    messenger_api_delta: bool = Field(False, env="MESSENGER_API_DELTA")
 
     # Proxy Configuration
     proxy_url: Optional[str] = Field(None, env="PROXY_URL")
+    geo_resolver_url: str = Field(
+        "https://ipinfo.io", env="GEO_RESOLVER_URL"
+    )
+    geo_cache_ttl: int = Field(6 * 60 * 60, env="GEO_CACHE_TTL")
 
     # Tinder Preferences
     age_range_min: int = Field(18, env="AGE_RANGE_MIN")
@@ -33,6 +39,35 @@ class Settings(BaseSettings):
     # Bot Behavior
     swipe_limit: int = Field(100, env="SWIPE_LIMIT")
 
+    # Session
+    # Generate messages but do not send them
+    mock: bool = Field(False, env="MOCK")
+    headless: bool = Field(False, env="HEADLESS")
+    persist_user_data: bool = Field(False, env="PERSIST_USER_DATA")
+    # Generate messages in the background while the next items
+    # are extracted, `pipeline_workers` at a time
+    pipeline: bool = Field(False, env="PIPELINE")
+    pipeline_workers: int = Field(2, env="PIPELINE_WORKERS")
+    # Extract all items of a cycle first and generate their messages
+    # in one batched messenger call, takes precedence over `pipeline`
+    batch: bool = Field(False, env="BATCH")
+    # Reuse the patched chromedriver binary across runs
+    cache_driver: bool = Field(False, env="CACHE_DRIVER")
+    # host:port of a local Chrome to attach to. If none is listening,
+    # one is started with the persisted user data and left running on
+    # exit, so later sessions start warm. Implies `cache_driver`.
+    debugger_address: Optional[str] = Field(None, env="DEBUGGER_ADDRESS")
+    # Export phase latencies and counters to metrics.jsonl (appended)
+    # and metrics.prom (Prometheus text format) in this directory, on
+    # exit and on every `Session.export_metrics` call
+    metrics_dir: Optional[Path] = Field(None, env="METRICS_DIR")
+    # Record every WebDriver command, attributed to the operation that
+    # sent it, and write them as a Chrome trace JSON file on exit
+    trace_path: Optional[Path] = Field(None, env="TRACE_PATH")
+    # Record every WebDriver command and its response and write them
+    # to this file on exit, for `testing.ReplayDriver`
+    record_path: Optional[Path] = Field(None, env="RECORD_PATH")
+
     def get_login_method(self) -> LoginMethods:
         """Determine login method based on available credentials"""
         if self.facebook_email and self.facebook_password:
@@ -41,6 +76,19 @@ class Settings(BaseSettings):
             return LoginMethods.GOOGLE
         raise ValueError("No valid login credentials found in settings")
 
+    def with_overrides(self, **overrides) -> 'Settings':
+        """
+        Return a validated copy with the given fields replaced,
+        overrides that are None keep the current value.
+        """
+        return self.model_validate({
+            **self.model_dump(),
+            **{
+                key: value for key, value in overrides.items()
+                if value is not None
+            }
+        })
+
     def get_messenger_api(self) -> Optional[str]:
         """" Return the given messenger service base url """
         if self.messenger_api:
@@ -6,7 +6,15 @@ from tinder_ai.shared.models import (
     MatchProfile,
     OpeningMessageRequest,
     MessageResponse,
-    ReplyRequest
+    ReplyRequest,
+    ReplyDeltaRequest,
+    OpeningBatchRequest,
+    ReplyBatchRequest,
+    ReplyDeltaBatchRequest,
+    BatchResult,
+    BatchResponse,
+    content_hash,
+    messages_hash
 )
 
 __all__ = [
@@ -15,5 +23,13 @@ __all__ = [
     "MatchProfile",
     "OpeningMessageRequest",
     "MessageResponse",
-    "ReplyRequest"
+    "ReplyRequest",
+    "ReplyDeltaRequest",
+    "OpeningBatchRequest",
+    "ReplyBatchRequest",
+    "ReplyDeltaBatchRequest",
+    "BatchResult",
+    "BatchResponse",
+    "content_hash",
+    "messages_hash"
 ]
@@ -1,6 +1,15 @@
 from dataclasses import dataclass, asdict
 from typing import List, Optional, Dict
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
+import hashlib
+import json
+
+
+def content_hash(data) -> str:
+    """SHA-256 of the canonical JSON of `data`."""
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
 
 
 @dataclass
@@ -29,6 +38,12 @@ class MatchProfile(BaseModel):
     lifestyle: Dict[str, str] = {}
     last_messages: Optional[List[Message]] = None
 
+    def content_hash(self) -> str:
+        """Hash of the profile fields, without the messages."""
+        return content_hash(
+            self.model_dump(mode='json', exclude={'last_messages'})
+        )
+
     def in_llm_format(self):
         interests = ", ".join(self.interests) if self.interests else "N/A"
         essentials = ", ".join(self.essentials) if self.essentials else "N/A"
@@ -60,3 +75,62 @@ class MessageResponse(BaseModel):
 
 class ReplyRequest(BaseModel):
     profile: MatchProfile
+
+
+def messages_hash(messages: Optional[List[Message]]) -> str:
+    """Hash of a conversation, as a v2 request's `base_hash`."""
+    return content_hash([message.model_dump() for message in messages or []])
+
+
+class ReplyDeltaRequest(BaseModel):
+    """
+    A v2 reply request, which only carries what the server does not
+    have yet.
+
+    The server keeps the profile and messages of the last acknowledged
+    request per match. `profile_hash` and `base_hash` must match that
+    state, `new_messages` are appended to it. `profile` (without
+    messages) is only sent when the server has no state, which it
+    reports as a cache miss; `base_messages` is 0 then.
+    """
+    match_id: str
+    profile_hash: str
+    base_messages: int = 0
+    base_hash: str
+    new_messages: List[Message] = []
+    profile: Optional[MatchProfile] = None
+
+
+class OpeningBatchRequest(BaseModel):
+    requests: List[OpeningMessageRequest]
+
+
+class ReplyBatchRequest(BaseModel):
+    requests: List[ReplyRequest]
+
+
+class ReplyDeltaBatchRequest(BaseModel):
+    requests: List[ReplyDeltaRequest]
+
+
+class BatchResult(BaseModel):
+    """
+    The outcome of one request of a batch. `status` is what the single
+    request's HTTP status would have been, e.g. 409 for a match that
+    is ready to meet or 412 for a v2 cache miss, with `detail`.
+    A successful result always carries its `message`.
+    """
+    status: int = 200
+    message: Optional[str] = None
+    detail: Optional[str] = None
+
+    @model_validator(mode='after')
+    def _check_message(self) -> 'BatchResult':
+        if self.status == 200 and self.message is None:
+            raise ValueError("A successful result must carry a message")
+        return self
+
+
+class BatchResponse(BaseModel):
+    """One result per request, in request order."""
+    results: List[BatchResult]
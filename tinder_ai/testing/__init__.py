@@ -0,0 +1,22 @@
+from tinder_ai.testing.server import (
+    FixtureCorpus,
+    FixtureServer,
+    FIXTURE_VERSION
+)
+from tinder_ai.testing.fake import FakeElement, FakeWebDriver
+from tinder_ai.testing.geo import GeoResolverServer
+from tinder_ai.testing.messenger import MessengerServer
+from tinder_ai.testing.replay import ReplayDriver, ReplayMismatch
+
+
+__all__ = [
+    'FakeElement',
+    'FakeWebDriver',
+    'FixtureCorpus',
+    'FixtureServer',
+    'FIXTURE_VERSION',
+    'GeoResolverServer',
+    'MessengerServer',
+    'ReplayDriver',
+    'ReplayMismatch'
+]
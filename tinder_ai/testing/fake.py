@@ -0,0 +1,766 @@
+from selenium.common.exceptions import (
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    WebDriverException
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.timeouts import Timeouts
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from tinder_ai.services.extraction import (
+    PROFILE_EXTRACTION_SCRIPT,
+    SNAPSHOT_SCRIPT
+)
+from tinder_ai.services.popups import POPUP_PROBE_SCRIPT
+from tinder_ai.services.preferences import (
+    PREFERENCES_STATE_SCRIPT,
+    SLIDER_STATE_SCRIPT
+)
+from tinder_ai.testing.server import FixtureCorpus
+from tinder_ai.utils import clock
+from tinder_ai.utils.dom import LocalElement, inner_text, parse_html
+from tinder_ai.utils.readiness import (
+    DEFAULT_SCRIPT_TIMEOUT,
+    WAIT_FOR_ANY_SCRIPT,
+    WAIT_FOR_ELEMENT_SCRIPT
+)
+
+from collections import Counter
+from logging import getLogger
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+import re
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None
+
+
+logger = getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://tinder.com"
+WINDOW_HANDLE = "fake-window"
+
+# Geometry of the fixture's slider rails, see `.rail` in preferences.html.
+RAIL_LEFT = 16
+RAIL_WIDTH = 320
+HANDLE_SIZE = 24
+DEFAULT_SIZE = {'width': 100, 'height': 20}
+
+# Hidden by inline styles, the `hidden` attribute or the fixture's
+# `.List:not(.open)` rule.
+HIDDEN_XPATH = (
+    "ancestor-or-self::*[@hidden or "
+    "contains(translate(@style, ' ', ''), 'display:none') or "
+    "(contains(concat(' ', @class, ' '), ' List ') and "
+    "not(contains(concat(' ', @class, ' '), ' open ')))]"
+)
+
+SUBMIT_KEYS = (Keys.RETURN, Keys.ENTER)
+
+# Key of an element reference in W3C payloads.
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class FakeElement(LocalElement, WebElement):
+    """
+    A `LocalElement` that belongs to a `FakeWebDriver` page and can be
+    interacted with: clicks and keys are dispatched to the driver.
+
+    It passes for a `WebElement`, so `ActionChains` accept it, and like
+    one it goes stale once its page was replaced or it was removed from
+    the document.
+    """
+
+    def __init__(self, node, driver: 'FakeWebDriver') -> None:
+        LocalElement.__init__(self, node)
+        self._driver = driver
+        self._parent = driver
+        self._id = driver._register(node)
+
+    def __repr__(self) -> str:
+        return f"<FakeElement {self.tag_name}>"
+
+    def _wrap(self, node) -> 'FakeElement':
+        return FakeElement(node, self._driver)
+
+    def _check(self) -> None:
+        self._driver._command()
+        if not self._driver._is_attached(self._node):
+            raise StaleElementReferenceException(
+                f"{self!r} is no longer attached to the DOM"
+            )
+
+    @property
+    def text(self) -> str:
+        self._check()
+        return inner_text(self._node) if self.is_displayed() else ""
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        self._check()
+        if name == 'href' and self._node.get('href') is not None:
+            # Like the DOM property, resolved against the page URL
+            return urljoin(self._driver._url, self._node.get('href'))
+        if name == 'value':
+            return self._value()
+        if name in ('checked', 'disabled', 'selected'):
+            return "true" if self._node.get(name) is not None else None
+        return super().get_attribute(name)
+
+    def get_dom_attribute(self, name: str) -> Optional[str]:
+        self._check()
+        return self._node.get(name)
+
+    def find_elements(self, by=By.ID, value=None) -> List['FakeElement']:
+        self._check()
+        return super().find_elements(by, value)
+
+    def is_displayed(self) -> bool:
+        return not self._node.xpath(HIDDEN_XPATH)
+
+    def is_enabled(self) -> bool:
+        return self._node.get('disabled') is None
+
+    def is_selected(self) -> bool:
+        return self._node.get('checked') is not None
+
+    @property
+    def rect(self) -> Dict[str, float]:
+        return self._driver.layout(self._node)
+
+    @property
+    def size(self) -> Dict[str, float]:
+        rect = self.rect
+        return {'width': rect['width'], 'height': rect['height']}
+
+    @property
+    def location(self) -> Dict[str, float]:
+        rect = self.rect
+        return {'x': rect['x'], 'y': rect['y']}
+
+    def click(self) -> None:
+        self._check()
+        self._driver._click(self._node)
+
+    def send_keys(self, *values) -> None:
+        self._check()
+        self._driver._focused = self._node
+        for value in values:
+            for key in str(value):
+                self._driver._type(key)
+
+    def clear(self) -> None:
+        self._check()
+        self._node.text = ""
+
+    def _value(self) -> Optional[str]:
+        if self._node.tag == 'textarea':
+            return self._node.text or ""
+        return self._node.get('value')
+
+
+class _SwitchTo:
+    def __init__(self, driver: 'FakeWebDriver') -> None:
+        self._driver = driver
+
+    def window(self, handle: str) -> None:
+        self._driver._command()
+        if handle not in self._driver.window_handles:
+            raise NoSuchWindowException(f"No window {handle!r}")
+
+    def default_content(self) -> None:
+        self._driver._command()
+
+    @property
+    def active_element(self) -> Optional[FakeElement]:
+        focused = self._driver._focused
+        return FakeElement(focused, self._driver) if focused is not None \
+            else None
+
+
+class FakeWebDriver:
+    """
+    An in-memory stand-in for Chrome serving a `FixtureCorpus`.
+
+    Implements the subset of the WebDriver API this package uses:
+    `get`, `refresh`, `current_url`, `find_element(s)` by XPath, CSS,
+    class, id, name and tag, element `text`, `get_attribute`, `click`
+    and `send_keys`, `ActionChains` clicks, typing and slider drags,
+    window handles, and the package's in-page scripts (popup probe,
+    element wait, profile extraction, snapshot and slider state),
+    evaluated on the lxml tree. Other scripts can be added with
+    `register_script`.
+
+    Pages are rendered by `FixtureCorpus.render` and behave like the
+    fixture's scripts: links and tab buttons navigate, popup buttons
+    close their modal, checkboxes toggle. Nothing is asynchronous, so
+    waits resolve at once; a missed wait advances a `VirtualClock` by
+    its timeout. Every call counts as one WebDriver round trip.
+
+    Usage:
+        browser = FakeWebDriver()
+        with Session(settings, service, browser=browser) as session:
+            session.handle_matches()
+        browser.sent_messages
+    """
+
+    def __init__(
+        self,
+        corpus: Optional[FixtureCorpus] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        logged_in: bool = True
+    ) -> None:
+        """
+        :param corpus: The pages to serve, the default corpus if None.
+        :param base_url: Origin the corpus is served from.
+        :param logged_in: Redirect / to /app/recs like tinder.com does
+            for a logged in user, and report a session cookie. Otherwise
+            / is the landing page.
+        """
+        if etree is None:
+            raise ImportError(
+                "The fake driver requires lxml, install it with "
+                "`pip install tinder-ai[local]`."
+            )
+        self.corpus = corpus or FixtureCorpus()
+        self.base_url = base_url.rstrip("/")
+        self.logged_in = logged_in
+        self.caps = {'browserName': 'chrome', 'fake': True}
+        self.session_id = "fake"
+        self.switch_to = _SwitchTo(self)
+
+        self.round_trips = 0
+        self.history: List[str] = []
+        self.cdp_commands: List[Tuple[str, Dict]] = []
+        self.sent_messages: List[Tuple[str, str]] = []
+        self.swipes: Counter = Counter()
+        self.window_size = (0, 0)
+        self.script_timeout: float = DEFAULT_SCRIPT_TIMEOUT
+        self.cookies: List[Dict] = (
+            [{'name': 'session', 'domain': '.tinder.com'}] if logged_in else []
+        )
+
+        self._url = "data:,"
+        self._nodes: Dict[str, object] = {}
+        self._document = parse_html("<html><body></body></html>").node
+        self._focused = None
+        self._dragged = None
+        self._pointer = (0.0, 0.0)
+        self._pointer_target = None
+        self._pressed_on = None
+        self._scripts: Dict[str, Callable] = {
+            POPUP_PROBE_SCRIPT: self._popup_probe,
+            PROFILE_EXTRACTION_SCRIPT: self._extract_profile,
+            SNAPSHOT_SCRIPT: self._snapshot,
+            SLIDER_STATE_SCRIPT: self._slider_state,
+            PREFERENCES_STATE_SCRIPT: self._preferences_state,
+        }
+        self._async_scripts: Dict[str, Callable] = {
+            WAIT_FOR_ELEMENT_SCRIPT: self._wait_for_element,
+            WAIT_FOR_ANY_SCRIPT: self._wait_for_any,
+        }
+
+    def _command(self) -> None:
+        self.round_trips += 1
+
+    # Navigation
+
+    @property
+    def current_url(self) -> str:
+        self._command()
+        return self._url
+
+    @property
+    def title(self) -> str:
+        self._command()
+        titles = self._document.xpath('//title')
+        return inner_text(titles[0]) if titles else ""
+
+    @property
+    def page_source(self) -> str:
+        self._command()
+        return etree.tostring(self._document, encoding='unicode')
+
+    def get(self, url: str) -> None:
+        self._command()
+        self._load(urljoin(self._url, url))
+
+    def refresh(self) -> None:
+        self._command()
+        self._load(self._url, record=False)
+
+    def back(self) -> None:
+        self._command()
+        if len(self.history) > 1:
+            self.history.pop()
+            self._load(self.history[-1], record=False)
+
+    def _load(self, url: str, record: bool = True) -> None:
+        parsed = urlparse(url)
+        base = urlparse(self.base_url)
+        if (parsed.scheme, parsed.netloc) != (base.scheme, base.netloc):
+            raise WebDriverException(
+                f"unknown error: net::ERR_NAME_NOT_RESOLVED ({url})"
+            )
+        if parsed.path in ('', '/') and self.logged_in:
+            url = f"{self.base_url}/app/recs"
+            parsed = urlparse(url)
+
+        if parsed.path in ('', '/') and not self.logged_in:
+            page = self.corpus.render_landing()
+        else:
+            page = self.corpus.render(parsed.path, parsed.query)
+        if page is None:
+            page = "<html><body><h1>Not Found</h1></body></html>"
+        self._document = parse_html(page).node
+        self._url = url
+        self._nodes = {}
+        self._focused = None
+        self._dragged = None
+        if record:
+            self.history.append(url)
+
+    def _is_attached(self, node) -> bool:
+        return node.getroottree().getroot() is self._document
+
+    def _register(self, node) -> str:
+        """A stable element reference for `node`, as W3C payloads use."""
+        reference = f"fake-{id(node):x}"
+        self._nodes[reference] = node
+        return reference
+
+    def _node_of(self, reference: str):
+        node = self._nodes.get(reference)
+        if node is None or not self._is_attached(node):
+            raise StaleElementReferenceException(
+                f"Element {reference} is no longer attached to the DOM"
+            )
+        return node
+
+    # Lookups
+
+    def find_element(self, by=By.ID, value=None) -> FakeElement:
+        self._command()
+        return FakeElement(self._document, self).find_element(by, value)
+
+    def find_elements(self, by=By.ID, value=None) -> List[FakeElement]:
+        self._command()
+        return FakeElement(self._document, self).find_elements(by, value)
+
+    # Windows
+
+    @property
+    def window_handles(self) -> List[str]:
+        self._command()
+        return [WINDOW_HANDLE]
+
+    @property
+    def current_window_handle(self) -> str:
+        self._command()
+        return WINDOW_HANDLE
+
+    def set_window_size(self, width: int, height: int) -> None:
+        self._command()
+        self.window_size = (width, height)
+
+    @property
+    def timeouts(self) -> Timeouts:
+        self._command()
+        return Timeouts(script=self.script_timeout)
+
+    def set_script_timeout(self, seconds: float) -> None:
+        self._command()
+        self.script_timeout = seconds
+
+    def implicitly_wait(self, seconds: float) -> None:
+        self._command()
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: Dict) -> Dict:
+        self._command()
+        self.cdp_commands.append((cmd, cmd_args))
+        if cmd == "Network.getCookies":
+            return {'cookies': [dict(cookie) for cookie in self.cookies]}
+        return {}
+
+    def quit(self) -> None:
+        self._command()
+
+    # Scripts
+
+    def register_script(
+        self, script: str, handler: Callable, asynchronous: bool = False
+    ) -> None:
+        """
+        Evaluate `script` with `handler(*args)` in Python.
+
+        Scripts are matched by their exact source, like the constants
+        the services pass to `execute_script`.
+        """
+        registry = self._async_scripts if asynchronous else self._scripts
+        registry[script] = handler
+
+    def execute_script(self, script: str, *args):
+        return self._run_script(self._scripts, script, args)
+
+    def execute_async_script(self, script: str, *args):
+        return self._run_script(self._async_scripts, script, args)
+
+    def _run_script(self, registry: Dict, script: str, args):
+        self._command()
+        handler = registry.get(script)
+        if handler is None:
+            raise WebDriverException(
+                "javascript error: script not supported by FakeWebDriver: "
+                f"{' '.join(script.split())[:80]}"
+            )
+        return handler(*(self._unwrap(arg) for arg in args))
+
+    def _unwrap(self, value):
+        if isinstance(value, FakeElement):
+            if not self._is_attached(value.node):
+                raise StaleElementReferenceException(
+                    f"{value!r} is no longer attached to the DOM"
+                )
+            return value.node
+        return value
+
+    def _wrap(self, node) -> Optional[FakeElement]:
+        return FakeElement(node, self) if node is not None else None
+
+    @staticmethod
+    def _first(context, xpath: str):
+        nodes = context.xpath(xpath)
+        return nodes[0] if nodes else None
+
+    def _popup_probe(self, base_xpath: str, xpaths: List[str]):
+        base = self._first(self._document, base_xpath)
+        if base is None:
+            return None
+        hits = []
+        for index, xpath in enumerate(xpaths):
+            node = self._first(base, xpath)
+            if node is not None:
+                hits.append([index, self._wrap(node)])
+        return hits
+
+    def _wait_for_element(
+        self,
+        xpath: str,
+        timeout_ms: int,
+        visible: bool,
+        url_contains: Optional[str]
+    ):
+        node = None
+        if not url_contains or url_contains in self._url:
+            node = self._first(self._document, xpath)
+            if node is not None and visible and node.xpath(HIDDEN_XPATH):
+                node = None
+        if node is None:
+            # The page never changes by itself, the wait would time out.
+            current = clock.get_clock()
+            if isinstance(current, clock.VirtualClock):
+                current.advance(timeout_ms / 1000)
+        return self._wrap(node)
+
+    def _wait_for_any(self, xpaths: List[str], timeout_ms: int):
+        for index, xpath in enumerate(xpaths):
+            node = self._first(self._document, xpath)
+            if node is not None:
+                return [index, self._wrap(node)]
+        current = clock.get_clock()
+        if isinstance(current, clock.VirtualClock):
+            current.advance(timeout_ms / 1000)
+        return None
+
+    def _extract_profile(self, root, chat, xp: Dict[str, str]) -> Dict:
+        """`PROFILE_EXTRACTION_SCRIPT` on the lxml tree."""
+        def text(node) -> Optional[str]:
+            return inner_text(node) if node is not None else None
+
+        messages = None
+        if chat is not None:
+            messages = []
+            for helper in chat.xpath(
+                ".//*[contains(concat(' ', @class, ' '), ' msgHelper ')]"
+            ):
+                body = self._first(
+                    helper,
+                    ".//*[contains(concat(' ', @class, ' '), ' msg ')][1]"
+                    "//*[contains(concat(' ', @class, ' '), ' text ')]"
+                )
+                if body is None:
+                    continue
+                parent = helper.getparent()
+                messages.append([
+                    text(body),
+                    parent.get('class', '') if parent is not None else ''
+                ])
+
+        if root is None:
+            return {'messages': messages}
+
+        looking_for = self._first(root, xp['looking_for_section'])
+        lifestyle = []
+        section = self._first(root, xp['lifestyle_section'])
+        if section is not None:
+            for item in section.xpath(xp['lifestyle_items']):
+                category = self._first(item, xp['lifestyle_category'])
+                value = self._first(item, xp['lifestyle_value'])
+                if category is not None and value is not None:
+                    lifestyle.append([text(category), text(value)])
+
+        return {
+            'name': text(self._first(root, xp['name'])),
+            'age': text(self._first(root, xp['age'])),
+            'bio': text(self._first(root, xp['bio'])),
+            'looking_for': (
+                text(self._first(looking_for, xp['looking_for_value']))
+                if looking_for is not None else None
+            ),
+            'location': text(self._first(root, xp['location'])),
+            'distance': text(self._first(root, xp['distance'])),
+            'essentials': text(self._first(root, xp['essentials'])),
+            'interests': [text(node) for node in root.xpath(xp['interests'])],
+            'lifestyle': lifestyle,
+            'messages': messages,
+        }
+
+    def _snapshot(self, profile, chat) -> List[Optional[str]]:
+        return [
+            etree.tostring(node, encoding='unicode', with_tail=False)
+            if node is not None else None
+            for node in (profile, chat)
+        ]
+
+    def _slider_state(self, handle, rail, bounds: List[float]) -> Dict:
+        rail = self.layout(rail if rail is not None else handle.getparent())
+        low, high = bounds
+
+        def number(name: str, fallback: float) -> float:
+            try:
+                return float(handle.get(name))
+            except (TypeError, ValueError):
+                return fallback
+
+        return {
+            'left': rail['x'],
+            'width': rail['width'],
+            'center': self._center(handle)[0],
+            'min': number('aria-valuemin', low),
+            'max': number('aria-valuemax', high),
+            'now': round(number('aria-valuenow', low)),
+        }
+
+    def _preferences_state(self, xp: Dict[str, str]) -> Dict:
+        def value(xpath: str) -> Optional[int]:
+            node = self._first(self._document, xpath)
+            try:
+                return round(float(node.get('aria-valuenow')))
+            except (AttributeError, TypeError, ValueError):
+                return None
+
+        toggle = self._first(self._document, xp['global_toggle'])
+        options = []
+        listed = self._first(self._document, xp['looking_for_list'])
+        if listed is not None and not listed.xpath(HIDDEN_XPATH):
+            options = [
+                box for box in self._document.xpath(xp['checkboxes'])
+                if box is not toggle and listed in box.iterancestors()
+            ]
+
+        def label(box) -> str:
+            node = self._first(
+                self._document, f"//label[@for='{box.get('id', '')}']"
+            )
+            if node is None:
+                return box.get('id', '')
+            return inner_text(node).strip()
+
+        if toggle is None:
+            enabled = None
+        elif toggle.get('aria-checked') is not None:
+            enabled = toggle.get('aria-checked') == 'true'
+        else:
+            enabled = toggle.get('checked') is not None
+        return {
+            'distance': value(xp['distance_handle']),
+            'age_min': value(xp['min_age_handle']),
+            'age_max': value(xp['max_age_handle']),
+            'looking_for': [
+                label(box) for box in options
+                if box.get('checked') is not None
+            ] if options else None,
+            'global': enabled,
+        }
+
+    # Layout
+
+    def layout(self, node) -> Dict[str, float]:
+        """
+        Approximate bounding box of a node. Only the slider rails and
+        handles have a real geometry, enough to drag them.
+        """
+        classes = node.get('class', '').split()
+        if 'rail' in classes:
+            return {'x': RAIL_LEFT, 'y': 0, 'width': RAIL_WIDTH, 'height': 8}
+        if node.get('role') == 'slider':
+            match = re.search(r'left:\s*([\d.]+)%', node.get('style', ''))
+            ratio = float(match.group(1)) / 100 if match else 0.0
+            return {
+                'x': RAIL_LEFT + ratio * RAIL_WIDTH - HANDLE_SIZE / 2,
+                'y': -8,
+                'width': HANDLE_SIZE,
+                'height': HANDLE_SIZE,
+            }
+        return {'x': 0, 'y': 0, **DEFAULT_SIZE}
+
+    def _center(self, node) -> Tuple[float, float]:
+        rect = self.layout(node)
+        return (
+            rect['x'] + rect['width'] / 2, rect['y'] + rect['height'] / 2
+        )
+
+    # Input
+
+    def execute(self, command: str, params: Optional[Dict] = None) -> Dict:
+        """The W3C actions endpoint `ActionChains.perform` sends to."""
+        self._command()
+        if command == Command.W3C_ACTIONS:
+            self._perform(params['actions'])
+        elif command != Command.W3C_CLEAR_ACTIONS:
+            raise WebDriverException(
+                f"Command {command!r} not supported by FakeWebDriver"
+            )
+        return {'value': None}
+
+    def _perform(self, sources: List[Dict]) -> None:
+        ticks = max((len(source['actions']) for source in sources), default=0)
+        for tick in range(ticks):
+            for source in sources:
+                if tick < len(source['actions']):
+                    self._act(source['type'], source['actions'][tick])
+
+    def _act(self, source_type: str, action: Dict) -> None:
+        kind = action['type']
+        if source_type == 'key':
+            if kind == 'keyDown':
+                self._type(action['value'])
+            return
+        if source_type != 'pointer':
+            return
+
+        if kind == 'pointerMove':
+            origin = action.get('origin', 'viewport')
+            x, y = action.get('x', 0), action.get('y', 0)
+            if isinstance(origin, dict):
+                node = self._node_of(origin[ELEMENT_KEY])
+                center = self._center(node)
+                self._pointer = (center[0] + x, center[1] + y)
+                self._pointer_target = node
+            elif origin == 'pointer':
+                self._pointer = (self._pointer[0] + x, self._pointer[1] + y)
+            else:
+                self._pointer = (x, y)
+            if self._dragged is not None:
+                self._drag_to(self._pointer[0])
+        elif kind == 'pointerDown':
+            self._pressed_on = self._pointer_target
+            if (
+                self._pointer_target is not None
+                and self._pointer_target.get('role') == 'slider'
+            ):
+                self._dragged = self._pointer_target
+        elif kind == 'pointerUp':
+            if self._dragged is not None:
+                self._dragged = None
+            elif (
+                self._pressed_on is not None
+                and self._pressed_on is self._pointer_target
+                and self._is_attached(self._pressed_on)
+            ):
+                self._click(self._pressed_on)
+            self._pressed_on = None
+
+    def _drag_to(self, x: float) -> None:
+        """Move the dragged slider, like the fixture's mousemove handler."""
+        handle = self._dragged
+        rail = self.layout(handle.getparent())
+        ratio = min(max((x - rail['x']) / rail['width'], 0), 1)
+        low = float(handle.get('data-min', 0))
+        high = float(handle.get('data-max', 100))
+        handle.set('style', f"left: {ratio * 100}%;")
+        handle.set('aria-valuenow', str(round(low + ratio * (high - low))))
+
+    def _type(self, key: str) -> None:
+        node = self._focused
+        if node is None:
+            return
+        if key in SUBMIT_KEYS:
+            if node.tag == 'textarea' and node.text:
+                self.sent_messages.append((self._url, node.text))
+                node.text = ""
+            return
+        if node.tag == 'textarea':
+            node.text = (node.text or "") + key
+        elif node.tag == 'input':
+            node.set('value', node.get('value', '') + key)
+
+    def _click(self, node) -> None:
+        """Dispatch a click like the fixture pages' scripts would."""
+        self._focused = node
+
+        link = self._first(node, 'ancestor-or-self::a[@href]')
+        if link is not None:
+            self._load(urljoin(self._url, link.get('href')))
+            return
+
+        button = self._first(node, 'ancestor-or-self::button')
+        if button is not None:
+            if self._first(button, 'ancestor::nav') is not None:
+                self._load(urljoin(
+                    self._url, "/app/" + inner_text(button).strip().lower()
+                ))
+                return
+            banner = self._first(button, "ancestor::*[@id='cookie-banner']")
+            if banner is not None:
+                banner.getparent().remove(banner)
+                return
+            modal = self._first(
+                button, "ancestor::*[parent::*[@id='modal-manager']]"
+            )
+            if modal is not None:
+                modal.getparent().remove(modal)
+                return
+            if 'gamepad-button' in button.get('class', ''):
+                self.swipes[inner_text(button).strip()] += 1
+                return
+            if button.get('aria-label') == 'Looking for':
+                for options in self._document.xpath(
+                    "//ul[contains(concat(' ', @class, ' '), ' List ')]"
+                ):
+                    options.set('class', options.get('class') + ' open')
+                return
+
+        if node.tag == 'label' and node.get('for'):
+            target = self._first(
+                self._document, f"//*[@id='{node.get('for')}']"
+            )
+            if target is not None:
+                self._toggle(target)
+            return
+        if node.tag == 'input' and node.get('type') == 'checkbox':
+            self._toggle(node)
+
+    @staticmethod
+    def _toggle(checkbox) -> None:
+        if checkbox.get('checked') is not None:
+            del checkbox.attrib['checked']
+        else:
+            checkbox.set('checked', '')
+        if checkbox.get('aria-checked') is not None:
+            checkbox.set(
+                'aria-checked',
+                str(checkbox.get('checked') is not None).lower()
+            )
@@ -0,0 +1,101 @@
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from threading import Thread
+from logging import getLogger
+from typing import List, Optional
+from urllib.parse import urlparse
+import json
+
+
+logger = getLogger(__name__)
+
+
+class GeoResolverServer:
+    """
+    A local stand-in for the ipinfo.io endpoints `LocationService` uses.
+
+    Routes:
+        /json        -> {"ip": ..., "loc": "lat,lon"}
+        /<ip>/geo    -> {"ip": ..., "loc": "lat,lon"}
+
+    Every request path is recorded in `requests`, so callers can
+    assert how many lookups a cache saved. Proxied requests carry the
+    full URL as path, so the server can also stand in for the proxy:
+    set both `proxy_url` and `resolver_url` to `base_url`.
+
+    Usage:
+        with GeoResolverServer() as resolver:
+            LocationService(..., resolver_url=resolver.base_url)
+    """
+
+    def __init__(
+        self,
+        ip: str = "203.0.113.7",
+        loc: Optional[str] = "52.3676,4.9041",
+        host: str = "127.0.0.1",
+        port: int = 0
+    ) -> None:
+        """
+        :param ip: The public IP to report (TEST-NET-3 by default).
+        :param loc: "lat,lon" to report, None to omit the field.
+        """
+        self.ip = ip
+        self.loc = loc
+        self.requests: List[str] = []
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: Optional[Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'GeoResolverServer':
+        self._thread = Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.debug(f"Geo resolver listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'GeoResolverServer':
+        return self.start()
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self.stop()
+
+    def render(self, path: str) -> Optional[dict]:
+        """The JSON body for a request path, None if unknown."""
+        parts = [part for part in path.split("/") if part]
+        if parts == ["json"] or (len(parts) == 2 and parts[1] == "geo"):
+            data = {"ip": parts[0] if len(parts) == 2 else self.ip}
+            if self.loc is not None:
+                data["loc"] = self.loc
+            return data
+        return None
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                path = urlparse(self.path).path
+                server.requests.append(path)
+                data = server.render(path)
+                if data is None:
+                    self.send_error(404)
+                    return
+                payload = json.dumps(data).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args) -> None:
+                logger.debug(format % args)
+
+        return Handler
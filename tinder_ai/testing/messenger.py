@@ -0,0 +1,189 @@
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pydantic import ValidationError
+from threading import Lock, Thread
+from logging import getLogger
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+import json
+
+from tinder_ai.shared import (
+    MatchProfile,
+    Message,
+    OpeningMessageRequest,
+    ReplyDeltaRequest,
+    ReplyRequest,
+    messages_hash
+)
+
+
+logger = getLogger(__name__)
+
+# Batch route -> the route of its single requests.
+BATCH_ROUTES = {
+    "/v1/generate/openers": "/v1/generate/opener",
+    "/v1/generate/replies": "/v1/generate/reply",
+    "/v2/generate/replies": "/v2/generate/reply",
+}
+
+
+class MessengerServer:
+    """
+    A local stand-in for a messenger API, see `MessengerService`.
+
+    Routes (POST, JSON):
+        /v1/generate/opener -> {"message": ...}
+        /v1/generate/reply  -> {"message": ...}
+        /v2/generate/reply  -> {"message": ...}, or 412 if the request
+                               builds on state the server does not have
+        /v1/generate/openers, /v1/generate/replies, /v2/generate/replies
+                            -> {"results": [{"status": ..., "message"
+                               or "detail": ...}, ...]} for a batch of
+                               {"requests": [...]} to the route above
+
+    For v2 requests the server keeps the profile and messages of the
+    last request per match and rebuilds the full conversation from
+    them, so replies are the same in both formats. Every request is
+    recorded in `requests` as (path, body size in bytes), so callers
+    can compare payloads. `forget` drops the kept state, like a
+    restart or an eviction would. Requests for match ids in `ready`
+    get a 409, like for a match that is ready to meet.
+
+    Usage:
+        with MessengerServer() as server:
+            MessengerService(server.base_url, delta_replies=True)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.requests: List[Tuple[str, int]] = []
+        self.misses = 0
+        self.ready: Set[str] = set()
+        # match_id -> (profile hash, profile, messages)
+        self._state: Dict[str, Tuple[str, MatchProfile, List[Message]]] = {}
+        self._lock = Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: Optional[Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MessengerServer':
+        self._thread = Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.debug(f"Messenger API listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'MessengerServer':
+        return self.start()
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self.stop()
+
+    def forget(self, match_id: Optional[str] = None) -> None:
+        """Drop the v2 state of a match, or of all matches if None."""
+        with self._lock:
+            if match_id is None:
+                self._state.clear()
+            else:
+                self._state.pop(match_id, None)
+
+    @staticmethod
+    def opener(profile: MatchProfile) -> str:
+        return f"Hi {profile.name or 'there'}!"
+
+    @staticmethod
+    def reply(profile: MatchProfile) -> str:
+        messages = profile.last_messages or []
+        last = messages[-1].message if messages else ""
+        return f"Reply to {len(messages)} messages, last: {last}"
+
+    def render(self, path: str, data: dict) -> Tuple[int, dict]:
+        """The status and JSON body for a request."""
+        if path in BATCH_ROUTES:
+            requests = data.get("requests") if isinstance(data, dict) else None
+            if not isinstance(requests, list):
+                return 422, {"detail": "Expected a list of requests"}
+            results = []
+            for request in requests:
+                status, body = self.render(BATCH_ROUTES[path], request)
+                results.append({"status": status, **body})
+            return 200, {"results": results}
+        if path == "/v1/generate/opener":
+            request = OpeningMessageRequest.model_validate(data)
+            if request.profile.match_id in self.ready:
+                return self._ready(request.profile)
+            return 200, {"message": self.opener(request.profile)}
+        if path == "/v1/generate/reply":
+            request = ReplyRequest.model_validate(data)
+            if request.profile.match_id in self.ready:
+                return self._ready(request.profile)
+            return 200, {"message": self.reply(request.profile)}
+        if path == "/v2/generate/reply":
+            request = ReplyDeltaRequest.model_validate(data)
+            if request.match_id in self.ready:
+                return self._ready(request.profile)
+            profile = self._apply(request)
+            if profile is None:
+                return 412, {"detail": "Reply state not cached"}
+            return 200, {"message": self.reply(profile)}
+        return 404, {"detail": "Not Found"}
+
+    @staticmethod
+    def _ready(profile: Optional[MatchProfile]) -> Tuple[int, dict]:
+        name = profile.name if profile is not None else None
+        match = f"Match {name}" if name else "Match"
+        return 409, {"detail": f"{match} is ready to meet."}
+
+    def _apply(self, request: ReplyDeltaRequest) -> Optional[MatchProfile]:
+        """
+        Append a v2 request to the kept state of its match and return
+        the full profile, None if the request's base is not the state.
+        """
+        with self._lock:
+            if request.profile is not None:
+                state = (request.profile_hash, request.profile, [])
+            else:
+                state = self._state.get(request.match_id)
+            if (
+                state is None
+                or state[0] != request.profile_hash
+                or len(state[2]) != request.base_messages
+                or messages_hash(state[2]) != request.base_hash
+            ):
+                self.misses += 1
+                return None
+            messages = state[2] + list(request.new_messages)
+            self._state[request.match_id] = (state[0], state[1], messages)
+        return state[1].model_copy(update={'last_messages': messages})
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                path = urlparse(self.path).path
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                server.requests.append((path, length))
+                try:
+                    status, data = server.render(path, json.loads(body))
+                except (ValueError, ValidationError) as e:
+                    status, data = 422, {"detail": str(e)}
+                payload = json.dumps(data).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args) -> None:
+                logger.debug(format % args)
+
+        return Handler
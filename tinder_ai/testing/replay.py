@@ -0,0 +1,143 @@
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+from tinder_ai.utils.recording import load_recording
+
+from collections import defaultdict, deque
+from logging import getLogger
+from pathlib import Path
+from typing import Deque, Dict, Optional, Tuple, Union
+import json
+import threading
+
+
+logger = getLogger(__name__)
+
+REPLAY_SESSION_ID = "replay"
+
+
+class ReplayMismatch(WebDriverException):
+    """A command that is not in the recording."""
+
+
+def _key(command: str, params: Optional[Dict]) -> Tuple[str, str]:
+    params = {
+        key: value for key, value in (params or {}).items()
+        if key != 'sessionId'
+    }
+    return command, json.dumps(params, sort_keys=True, default=str)
+
+
+class ReplayExecutor:
+    """
+    Serves recorded responses in place of chromedriver.
+
+    A command gets the next unused response recorded for the same
+    command and parameters, so independent commands may be reordered
+    (e.g. by pipeline workers). Repeating a command more often than
+    recorded repeats its last response. Unless `strict`, a command with
+    unrecorded parameters (a different location, window size, ...) gets
+    the next response of the same command.
+    """
+
+    def __init__(self, entries, strict: bool = False) -> None:
+        self.strict = strict
+        self._exact: Dict[Tuple[str, str], Deque[Dict]] = defaultdict(deque)
+        self._by_command: Dict[str, Deque[Dict]] = defaultdict(deque)
+        self._last: Dict[Tuple[str, str], Dict] = {}
+        self._lock = threading.Lock()
+        self.served = 0
+        self.repeated = 0
+        self.substituted = 0
+        for entry in entries:
+            key = _key(entry['command'], entry['params'])
+            self._exact[key].append(entry)
+            self._by_command[entry['command']].append(entry)
+
+    @property
+    def unused(self) -> int:
+        """Recorded commands that were never replayed."""
+        return sum(len(queue) for queue in self._exact.values())
+
+    def execute(self, command: str, params: Optional[Dict]) -> Dict:
+        if command == Command.NEW_SESSION:
+            return {'value': {'sessionId': REPLAY_SESSION_ID}}
+        if command == Command.QUIT:
+            return {'value': None}
+
+        key = _key(command, params)
+        with self._lock:
+            entry = self._take(key)
+            self.served += 1
+        if entry is None:
+            raise ReplayMismatch(f"Not recorded: {command} {key[1]}")
+
+        if 'error' in entry:
+            raise WebDriverException(entry['error']['message'])
+        # A copy, the driver unwraps elements in place.
+        return json.loads(json.dumps(entry['response']))
+
+    def _take(self, key: Tuple[str, str]) -> Optional[Dict]:
+        command = key[0]
+        if self._exact[key]:
+            entry = self._exact[key].popleft()
+            self._by_command[command].remove(entry)
+        elif key in self._last:
+            self.repeated += 1
+            return self._last[key]
+        elif not self.strict and self._by_command[command]:
+            self.substituted += 1
+            entry = self._by_command[command].popleft()
+            recorded = _key(entry['command'], entry['params'])
+            self._exact[recorded].remove(entry)
+        else:
+            return None
+        self._last[key] = entry
+        return entry
+
+    def close(self) -> None:
+        pass
+
+
+class ReplayDriver(WebDriver):
+    """
+    A WebDriver that replays a recording made with `Recorder` (see
+    `Settings.record_path`), without Chrome.
+
+    `Session`, `Match` and the services run against it unchanged, which
+    makes their Python side measurable on a box without a browser and
+    comparable across changes on identical inputs.
+
+    Usage:
+        browser = ReplayDriver("session.jsonl.gz")
+        with Session(settings, service, browser=browser) as session:
+            session.handle_matches()
+    """
+
+    def __init__(self, path: Union[str, Path], strict: bool = False) -> None:
+        """
+        :param path: A recording written by `Recorder.save`.
+        :param strict: Fail on commands whose parameters were not
+            recorded, instead of substituting the next response
+            of the same command.
+        """
+        header, entries = load_recording(path)
+        self.path = Path(path)
+        self.recorded_caps = {
+            'browserName': 'chrome', **(header.get('capabilities') or {})
+        }
+        super().__init__(
+            command_executor=ReplayExecutor(entries, strict=strict),
+            options=Options()
+        )
+        self.caps = self.recorded_caps
+
+    def stats(self) -> Dict[str, int]:
+        executor = self.command_executor
+        return {
+            'served': executor.served,
+            'repeated': executor.repeated,
+            'substituted': executor.substituted,
+            'unused': executor.unused,
+        }
@@ -0,0 +1,231 @@
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from string import Template
+from threading import Thread
+from logging import getLogger
+from typing import Optional, List
+from urllib.parse import parse_qs, urlparse
+import json
+
+
+logger = getLogger(__name__)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+FIXTURE_VERSION = "v1"
+
+
+class FixtureCorpus:
+    """
+    A versioned set of synthetic Tinder web snapshots.
+
+    The snapshots mirror the DOM structure the services expect
+    (see `services/match.py` and `session.py`) and contain no real
+    user data. A new corpus version should be added as a new
+    directory instead of editing an existing one, so benchmark
+    results stay comparable.
+    """
+
+    def __init__(self, version: str = FIXTURE_VERSION) -> None:
+        self.version = version
+        self.root = FIXTURES_DIR / version
+        if not self.root.is_dir():
+            raise ValueError(f"Unknown fixture version: {version}")
+        self.manifest = json.loads(
+            (self.root / "manifest.json").read_text(encoding="utf-8")
+        )
+
+    @property
+    def match_ids(self) -> List[str]:
+        """Ids of new matches without a conversation."""
+        return list(self.manifest["matches"])
+
+    @property
+    def message_ids(self) -> List[str]:
+        """Ids of matches with an open conversation."""
+        return [item["id"] for item in self.manifest["messages"]]
+
+    @property
+    def unread_message_ids(self) -> List[str]:
+        """Ids of conversations where the match sent the last message."""
+        return [
+            item["id"] for item in self.manifest["messages"]
+            if not item["last_sent"]
+        ]
+
+    def read(self, name: str) -> str:
+        """Read a raw snapshot file relative to the corpus root."""
+        return (self.root / name).read_text(encoding="utf-8")
+
+    def profile_html(self, match_id: str) -> str:
+        """The 'profileContent' subtree of a match."""
+        return self.read(f"profiles/{match_id}.html")
+
+    def conversation_html(self, match_id: str) -> str:
+        """The message rows of a conversation, empty for new matches."""
+        path = self.root / "conversations" / f"{match_id}.html"
+        return path.read_text(encoding="utf-8") if path.exists() else ""
+
+    def name_of(self, match_id: str) -> str:
+        """Best effort name lookup, used for list item labels."""
+        html = self.profile_html(match_id)
+        start = html.index('<span class="Pend(8px)">') + 24
+        return html[start:html.index("</span>", start)]
+
+    def render_app(self, content: str = "", popup: str = "") -> str:
+        """Render the app shell with match and message lists."""
+        match_item = Template(self.read("match_item.html"))
+        message_item = Template(self.read("message_item.html"))
+
+        matches = "".join(
+            match_item.safe_substitute(id=id_, name=self.name_of(id_))
+            for id_ in self.match_ids
+        )
+        messages = "".join(
+            message_item.safe_substitute(
+                id=item["id"],
+                name=self.name_of(item["id"]),
+                preview="...",
+                sent_icon="<svg></svg>" if item["last_sent"] else "",
+            )
+            for item in self.manifest["messages"]
+        )
+        return Template(self.read("app.html")).safe_substitute(
+            version=self.version,
+            matches=matches,
+            messages=messages,
+            content=content,
+            popup=popup,
+        )
+
+    @property
+    def popup_names(self) -> List[str]:
+        """Popups that can be rendered over the app shell."""
+        return sorted(
+            path.stem for path in (self.root / "popups").glob("*.html")
+        )
+
+    def popup_html(self, name: str) -> str:
+        return self.read(f"popups/{name}.html")
+
+    def render_landing(self) -> str:
+        """Render the logged out landing page with a cookie banner."""
+        return Template(self.read("landing.html")).safe_substitute(
+            version=self.version
+        )
+
+    def render_preferences(self) -> str:
+        """Render the app shell with the discovery settings page."""
+        return self.render_app(content=self.read("preferences.html"))
+
+    def render_chat(self, match_id: str) -> str:
+        """Render the app shell with the chat and profile of a match."""
+        chat = Template(self.read("chat.html")).safe_substitute(
+            name=self.name_of(match_id),
+            conversation=self.conversation_html(match_id),
+            profile=self.profile_html(match_id),
+        )
+        return self.render_app(content=chat)
+
+    def render(self, path: str, query: str = "") -> Optional[str]:
+        """
+        Render the page for a request path, None if unknown.
+        See `FixtureServer` for the routes.
+        """
+        parts = [part for part in path.split("/") if part]
+        if parts in ([], ["app"], ["app", "recs"], ["app", "matches"],
+                     ["app", "messages"]):
+            popup = parse_qs(query).get("popup", [None])[0]
+            if popup is None:
+                return self.render_app()
+            names = popup.split(",")
+            if not set(names) <= set(self.popup_names):
+                return None
+            return self.render_app(
+                popup="".join(self.popup_html(name) for name in names)
+            )
+        if parts == ["app", "profile"]:
+            return self.render_preferences()
+        if len(parts) == 3 and parts[:2] == ["app", "messages"]:
+            known = self.match_ids + self.message_ids
+            if parts[2] in known:
+                return self.render_chat(parts[2])
+        return None
+
+
+class FixtureServer:
+    """
+    Serve a `FixtureCorpus` as a local stand-in for tinder.com.
+
+    Routes:
+        /, /app/recs, /app/matches, /app/messages -> app shell
+        /app/messages/<match_id>                  -> chat and profile
+        /app/profile                              -> discovery settings
+        any app shell route with ?popup=<name>    -> shell with a popup
+        ... ?popup=<name>,<name>                  -> stacked popups
+
+    Usage:
+        with FixtureServer() as server:
+            browser.get(server.url("/app/matches"))
+    """
+
+    def __init__(
+        self,
+        corpus: Optional[FixtureCorpus] = None,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ) -> None:
+        self.corpus = corpus or FixtureCorpus()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: Optional[Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str = "/") -> str:
+        return f"{self.base_url}{path}"
+
+    def start(self) -> 'FixtureServer':
+        self._thread = Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.debug(f"Fixture server listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'FixtureServer':
+        return self.start()
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self.stop()
+
+    def render(self, path: str, query: str = "") -> Optional[str]:
+        """Render the page for a request path, None if unknown."""
+        return self.corpus.render(path, query)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                body = server.render(url.path, url.query)
+                if body is None:
+                    self.send_error(404)
+                    return
+                payload = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args) -> None:
+                logger.debug(format % args)
+
+        return Handler
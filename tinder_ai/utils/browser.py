@@ -0,0 +1,229 @@
+from logging import getLogger
+from pathlib import Path
+from typing import List, Optional, Union
+import json
+import re
+import shutil
+import subprocess
+import time
+import urllib.error
+import urllib.request
+
+
+logger = getLogger(__name__)
+
+CHROME_BINARY = "/usr/bin/google-chrome"
+DRIVER_CACHE_DIR = Path(__file__).parent.parent.parent / "driver_cache"
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+    " AppleWebKit/537.36 (KHTML, like Gecko)"
+    " Chrome/112.0.5615.138"
+    " Safari/537.36"
+)
+CHROME_START_TIMEOUT = 20
+
+
+def build_chrome_options(
+    proxy_url: Optional[str] = None,
+    headless: bool = False,
+    user_data_dir: Optional[Union[str, Path]] = None
+):
+    """
+    Build the Chrome options every session starts with.
+
+    :param proxy_url: Route all traffic through this proxy.
+    :param headless: Run the browser without a window.
+    :param user_data_dir: Persistent profile directory, if any.
+    """
+    import undetected_chromedriver as uc
+
+    options = uc.ChromeOptions()
+    options.binary_location = CHROME_BINARY
+    options.add_argument("homepage=http://example.com")
+    options.add_argument("--disable-notifications")
+    options.add_argument(
+        '--no-first-run --no-service-autorun --password-store=basic'
+    )
+    options.add_argument("--lang=en")
+    options.add_argument("--disable-webrtc")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument(f"--user-agent={USER_AGENT}")
+
+    if user_data_dir is not None:
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+
+    if proxy_url is not None:
+        # Use local proxy server
+        logger.info(
+            "Routing traffic through local proxy server: "
+            f"{proxy_url}"
+        )
+        options.add_argument(f"--proxy-server={proxy_url}")
+
+    if headless:
+        options.headless = True
+
+    # Allow geolocation by default
+    options.add_experimental_option("prefs", {
+        "profile.default_content_setting_values.geolocation": 1
+    })
+    return options
+
+
+def chrome_major_version(binary: str = CHROME_BINARY) -> int:
+    """The major version of the installed Chrome, e.g. 120."""
+    output = subprocess.run(
+        [binary, "--version"], capture_output=True, text=True, check=True
+    ).stdout
+    match = re.search(r"(\d+)\.\d+", output)
+    if match is None:
+        raise RuntimeError(f"Unexpected Chrome version output: {output!r}")
+    return int(match.group(1))
+
+
+def cached_driver_path(
+    version_main: int,
+    cache_dir: Union[str, Path] = DRIVER_CACHE_DIR
+) -> str:
+    """
+    Path of a patched chromedriver for `version_main`, downloading and
+    patching it only if the cache does not hold one yet.
+
+    undetected_chromedriver downloads and patches a fresh binary for
+    every browser it starts and deletes it afterwards. Passing this
+    path as `driver_executable_path` skips both, since it treats a
+    given binary as user owned and only patches it if needed.
+    """
+    from undetected_chromedriver.patcher import Patcher
+
+    cache_dir = Path(cache_dir)
+    path = cache_dir / f"chromedriver_{version_main}"
+    if Patcher().is_binary_patched(str(path)):
+        logger.debug(f"Using cached chromedriver {path}")
+        return str(path)
+
+    logger.info(f"Caching patched chromedriver {version_main} in {path}")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    patcher = Patcher(version_main=version_main)
+    patcher.auto()
+    # Copy first and rename, so a concurrent run never sees
+    # a partially written binary.
+    partial = path.with_suffix(".partial")
+    shutil.copy2(patcher.executable_path, partial)
+    partial.replace(path)
+    return str(path)
+
+
+def debugger_available(debugger_address: str, timeout: float = 1) -> bool:
+    """Whether a Chrome is listening on `debugger_address` (host:port)."""
+    try:
+        with urllib.request.urlopen(
+            f"http://{debugger_address}/json/version", timeout=timeout
+        ) as response:
+            json.load(response)
+            return True
+    except (urllib.error.URLError, OSError, ValueError):
+        return False
+
+
+def start_debuggable_chrome(
+    options,
+    debugger_address: str,
+    user_data_dir: Union[str, Path],
+    timeout: float = CHROME_START_TIMEOUT
+) -> None:
+    """
+    Start a detached Chrome that outlives this process, so later
+    sessions can attach to it through `debugger_address`.
+
+    :raises TimeoutError: If the debugger did not come up in time.
+    """
+    host, port = debugger_address.rsplit(":", 1)
+    # Chrome reads these prefs from the profile, not the command line.
+    options.handle_prefs(str(user_data_dir))
+
+    arguments: List[str] = [
+        argument for argument in options.arguments
+        if not argument.startswith("--user-data-dir=")
+    ]
+    arguments += [
+        f"--user-data-dir={user_data_dir}",
+        f"--remote-debugging-host={host}",
+        f"--remote-debugging-port={port}",
+    ]
+    if options.headless:
+        arguments.append("--headless=new")
+
+    logger.info(f"Starting Chrome on {debugger_address}")
+    subprocess.Popen(
+        [options.binary_location, *arguments],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+    deadline = time.monotonic() + timeout
+    while not debugger_available(debugger_address, timeout=0.5):
+        if time.monotonic() > deadline:
+            raise TimeoutError(
+                f"Chrome did not listen on {debugger_address} "
+                f"within {timeout}s"
+            )
+        time.sleep(0.05)
+
+
+def launch_browser(
+    options,
+    cache_driver: bool = False,
+    debugger_address: Optional[str] = None,
+    user_data_dir: Optional[Union[str, Path]] = None
+):
+    """
+    Start or attach to Chrome.
+
+    :param options: Options from `build_chrome_options`.
+    :param cache_driver: Reuse a patched chromedriver across runs.
+    :param debugger_address: host:port of a local Chrome to attach to,
+        started detached with `user_data_dir` if none is listening.
+        Implies `cache_driver`. The browser keeps running after the
+        driver is stopped.
+    :param user_data_dir: Profile of a Chrome started for
+        `debugger_address`.
+    """
+    if debugger_address is None and not cache_driver:
+        import undetected_chromedriver as uc
+        return uc.Chrome(options=options)
+
+    version_main = chrome_major_version(options.binary_location)
+    driver_path = cached_driver_path(version_main)
+
+    if debugger_address is None:
+        import undetected_chromedriver as uc
+        return uc.Chrome(
+            options=options,
+            driver_executable_path=driver_path,
+            version_main=version_main
+        )
+
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    if debugger_available(debugger_address):
+        logger.info(f"Attaching to running Chrome on {debugger_address}")
+    else:
+        if user_data_dir is None:
+            raise ValueError(
+                "user_data_dir is required to start Chrome "
+                f"on {debugger_address}"
+            )
+        start_debuggable_chrome(options, debugger_address, user_data_dir)
+
+    # The patched driver attaches to the existing browser
+    # instead of launching one with automation switches.
+    attach_options = webdriver.ChromeOptions()
+    attach_options.debugger_address = debugger_address
+    return webdriver.Chrome(
+        service=Service(executable_path=driver_path),
+        options=attach_options
+    )
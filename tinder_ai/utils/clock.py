@@ -0,0 +1,101 @@
+from contextlib import contextmanager
+from typing import Optional
+import threading
+import time as _time
+
+
+class Clock:
+    """
+    Real time. All pauses and durations of a session go through the
+    current clock, see `use_clock`, so they can be simulated.
+    """
+
+    def now(self) -> float:
+        """Wall clock time in seconds since the epoch."""
+        return _time.time()
+
+    def monotonic(self) -> float:
+        """A clock for measuring durations."""
+        return _time.perf_counter()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            _time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """
+    Simulated time: `sleep` returns immediately and advances the clock.
+
+    Sessions running against fakes finish in milliseconds, while their
+    durations, metrics and the `run_all_tasks` deadline still reflect
+    the time the pauses would have taken. Sleeps of concurrent threads
+    add up, unlike real ones, so pipelined runs report an upper bound.
+
+    Usage:
+        with use_clock(VirtualClock()) as clock:
+            run_all_tasks(session)
+        print(clock.elapsed)
+    """
+
+    def __init__(self, start: Optional[float] = None) -> None:
+        """
+        :param start: Epoch seconds to start at, defaults to now.
+        """
+        self.start = _time.time() if start is None else start
+        self.elapsed = 0.0
+        self.sleeps = 0
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        return self.start + self.elapsed
+
+    def monotonic(self) -> float:
+        return self.elapsed
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.sleeps += 1
+        self.advance(seconds)
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward without sleeping."""
+        if seconds > 0:
+            with self._lock:
+                self.elapsed += seconds
+
+
+_clock: Clock = Clock()
+
+
+def get_clock() -> Clock:
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Install `clock` for all services and return the previous one."""
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
+
+
+@contextmanager
+def use_clock(clock: Clock):
+    """Install `clock` for the duration of the block."""
+    previous = set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
+
+
+def now() -> float:
+    return _clock.now()
+
+
+def monotonic() -> float:
+    return _clock.monotonic()
+
+
+def sleep(seconds: float) -> None:
+    _clock.sleep(seconds)
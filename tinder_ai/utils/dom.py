@@ -0,0 +1,194 @@
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    InvalidSelectorException
+)
+from selenium.webdriver.common.by import By
+
+from typing import List, Optional
+import re
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None
+    lxml_html = None
+
+try:
+    from cssselect import GenericTranslator, SelectorError
+except ImportError:  # pragma: no cover - optional dependency
+    GenericTranslator = None
+    SelectorError = Exception
+
+
+# Elements that Chrome renders on their own line,
+# used to approximate `WebElement.text` (innerText).
+BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3',
+    'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre',
+    'section', 'table', 'tr', 'ul',
+})
+SKIPPED_TAGS = frozenset({'script', 'style', 'template', 'head'})
+WHITESPACE = re.compile(r'\s+')
+
+
+def parse_html(html: str) -> 'LocalElement':
+    """
+    Parse an HTML document or fragment into a `LocalElement`.
+
+    :param html: The markup, e.g. a WebElement's 'outerHTML'.
+    :raises ImportError: If lxml is not installed.
+    """
+    if lxml_html is None:
+        raise ImportError(
+            "The local parser requires lxml, install it with "
+            "`pip install tinder-ai[local]`."
+        )
+    return LocalElement(lxml_html.fromstring(html))
+
+
+def _collapse(text: str) -> str:
+    return WHITESPACE.sub(' ', text)
+
+
+def inner_text(node) -> str:
+    """
+    Approximate the rendered text of an lxml element. Whitespace in the
+    markup, including newlines, collapses to a space as in normal flow
+    (except in <pre>), only block elements and <br> break lines.
+    """
+    parts = []
+
+    def walk(element, preformatted: bool = False) -> None:
+        tag = element.tag if isinstance(element.tag, str) else None
+        if tag is None or tag in SKIPPED_TAGS:
+            return
+        preformatted = preformatted or tag == 'pre'
+        text = (lambda s: s) if preformatted else _collapse
+        block = tag in BLOCK_TAGS
+        if block:
+            parts.append('\n')
+        if tag == 'br':
+            parts.append('\n')
+        if element.text:
+            parts.append(text(element.text))
+        for child in element:
+            walk(child, preformatted)
+            if child.tail:
+                parts.append(text(child.tail))
+        if block:
+            parts.append('\n')
+
+    walk(node)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+class LocalElement:
+    """
+    A read-only stand-in for a Selenium `WebElement` backed by lxml.
+
+    Supports the subset of the WebElement API the extractors use
+    (`find_element(s)`, `.text`, `get_attribute`), so the same lookup
+    code can run against a live browser or an in-process snapshot.
+    Missing elements raise `NoSuchElementException`, like WebDriver.
+    """
+
+    def __init__(self, node) -> None:
+        self._node = node
+
+    def __repr__(self) -> str:
+        return f"<LocalElement {self.tag_name}>"
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, LocalElement) and self._node is other._node
+        )
+
+    def __hash__(self) -> int:
+        return id(self._node)
+
+    @property
+    def node(self):
+        """The underlying lxml element."""
+        return self._node
+
+    @property
+    def tag_name(self) -> str:
+        return self._node.tag
+
+    @property
+    def text(self) -> str:
+        return inner_text(self._node)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        if name == 'outerHTML':
+            return etree.tostring(
+                self._node, encoding='unicode', with_tail=False
+            )
+        if name == 'innerHTML':
+            return (self._node.text or '') + ''.join(
+                etree.tostring(child, encoding='unicode')
+                for child in self._node
+            )
+        if name in ('textContent', 'innerText'):
+            return (
+                self._node.text_content() if name == 'textContent'
+                else self.text
+            )
+        return self._node.get(name)
+
+    def find_element(self, by=By.ID, value=None) -> 'LocalElement':
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(
+                f"Unable to locate element: {{'method': '{by}', "
+                f"'selector': {value!r}}}"
+            )
+        return elements[0]
+
+    def find_elements(self, by=By.ID, value=None) -> List['LocalElement']:
+        xpath = self._to_xpath(by, value)
+        try:
+            nodes = self._node.xpath(xpath)
+        except etree.XPathError as e:
+            raise InvalidSelectorException(f"{value!r}: {e}")
+        return [
+            self._wrap(node) for node in nodes
+            if isinstance(getattr(node, 'tag', None), str)
+        ]
+
+    def _wrap(self, node) -> 'LocalElement':
+        return type(self)(node)
+
+    def _scope(self) -> str:
+        """XPath axis for descendant searches, as WebDriver does."""
+        return 'descendant::'
+
+    def _to_xpath(self, by, value: str) -> str:
+        scope = self._scope()
+        if by == By.XPATH:
+            return value
+        if by == By.CLASS_NAME:
+            return (
+                f"{scope}*[contains(concat(' ', normalize-space(@class), "
+                f"' '), ' {value} ')]"
+            )
+        if by == By.ID:
+            return f"{scope}*[@id='{value}']"
+        if by == By.NAME:
+            return f"{scope}*[@name='{value}']"
+        if by == By.TAG_NAME:
+            return f"{scope}{value}"
+        if by == By.CSS_SELECTOR:
+            if GenericTranslator is None:
+                raise ImportError(
+                    "CSS selectors require cssselect, install it with "
+                    "`pip install tinder-ai[local]`."
+                )
+            try:
+                return GenericTranslator().css_to_xpath(value, prefix=scope)
+            except SelectorError as e:
+                raise InvalidSelectorException(f"{value!r}: {e}")
+        raise InvalidSelectorException(f"Unsupported locator strategy: {by}")
@@ -0,0 +1,235 @@
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from logging import getLogger
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+from tinder_ai.utils import clock
+import bisect
+import json
+import math
+import threading
+
+
+logger = getLogger(__name__)
+
+# Upper bounds in seconds, from a cached lookup to a slow LLM reply.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, math.inf
+)
+
+PROMETHEUS_PREFIX = "tinder_ai"
+
+
+@dataclass
+class Histogram:
+    """Latency distribution of one phase, in Prometheus style buckets."""
+    buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list = field(default_factory=list)
+    count: int = 0
+    sum: float = 0.0
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * len(self.buckets)
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile by linear interpolation within its bucket,
+        like Prometheus' histogram_quantile.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = min(self.buckets[index], self.max)
+                return lower + (upper - lower) * (
+                    (rank - seen) / bucket_count
+                )
+            seen += bucket_count
+        return self.max
+
+    def as_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.mean,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p90': self.quantile(0.9),
+            'p99': self.quantile(0.99),
+        }
+
+
+class MetricsRegistry:
+    """
+    Latency histograms and event counters of a session.
+
+    Services record into the shared `METRICS` instance:
+
+        with METRICS.time('extraction'):
+            ...
+        METRICS.inc('timeouts')
+
+    `time` also works as a decorator. The registry is thread-safe,
+    pipelined sessions record from worker threads.
+    """
+
+    def __init__(self) -> None:
+        self._histograms: Dict[str, Histogram] = {}
+        self._counters: Counter = Counter()
+        self._lock = threading.Lock()
+        self.started = clock.now()
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._histograms.setdefault(name, Histogram()).observe(seconds)
+
+    def inc(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    @contextmanager
+    def time(self, name: str):
+        """
+        Observe the duration of the block on the current clock,
+        including failed ones.
+        """
+        start = clock.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(name, clock.monotonic() - start)
+
+    def histogram(self, name: str) -> Optional[Histogram]:
+        return self._histograms.get(name)
+
+    def counter(self, name: str) -> int:
+        return self._counters[name]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self.started = clock.now()
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                'timestamp': clock.now(),
+                'uptime': clock.now() - self.started,
+                'latency': {
+                    name: histogram.as_dict()
+                    for name, histogram in sorted(self._histograms.items())
+                },
+                'counters': dict(sorted(self._counters.items())),
+            }
+
+    def summary(self) -> str:
+        """One line per phase, for the session log."""
+        snapshot = self.snapshot()
+        lines = []
+        for name, stats in snapshot['latency'].items():
+            lines.append(
+                f"   {name:<14}: {stats['count']:>5} x "
+                f"mean {stats['mean']:.2f}s  p90 {stats['p90']:.2f}s  "
+                f"max {stats['max']:.2f}s"
+            )
+        for name, value in snapshot['counters'].items():
+            lines.append(f"   {name:<14}: {value:>5}")
+        return "\n".join(lines)
+
+    def write_jsonl(
+        self,
+        path: Union[str, Path],
+        extra: Optional[Dict] = None
+    ) -> None:
+        """Append the current snapshot as one JSON line."""
+        snapshot = self.snapshot()
+        if extra:
+            snapshot.update(extra)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open('a', encoding='utf-8') as f:
+            f.write(json.dumps(snapshot) + "\n")
+
+    def write_prometheus(
+        self,
+        path: Union[str, Path],
+        gauges: Optional[Dict[str, float]] = None
+    ) -> None:
+        """
+        Overwrite `path` with the Prometheus text exposition format,
+        e.g. for the node exporter's textfile collector.
+
+        :param gauges: Additional values exported as
+            `tinder_ai_session{field="<name>"}`.
+        """
+        prefix = PROMETHEUS_PREFIX
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+
+        lines = [
+            f"# HELP {prefix}_phase_seconds Latency of session phases.",
+            f"# TYPE {prefix}_phase_seconds histogram",
+        ]
+        for name, histogram in histograms:
+            cumulative = 0
+            for bound, bucket_count in zip(
+                histogram.buckets, histogram.counts
+            ):
+                cumulative += bucket_count
+                le = "+Inf" if math.isinf(bound) else repr(bound)
+                lines.append(
+                    f'{prefix}_phase_seconds_bucket'
+                    f'{{phase="{name}",le="{le}"}} {cumulative}'
+                )
+            lines.append(
+                f'{prefix}_phase_seconds_sum{{phase="{name}"}} '
+                f'{histogram.sum}'
+            )
+            lines.append(
+                f'{prefix}_phase_seconds_count{{phase="{name}"}} '
+                f'{histogram.count}'
+            )
+
+        lines += [
+            f"# HELP {prefix}_events_total Timeouts, refreshes, retries.",
+            f"# TYPE {prefix}_events_total counter",
+        ]
+        for name, value in counters:
+            lines.append(f'{prefix}_events_total{{event="{name}"}} {value}')
+
+        if gauges:
+            lines += [
+                f"# HELP {prefix}_session Session counters.",
+                f"# TYPE {prefix}_session gauge",
+            ]
+            for name, value in gauges.items():
+                lines.append(f'{prefix}_session{{field="{name}"}} {value}')
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed, scrapers never read a partial file.
+        partial = path.with_suffix(".partial")
+        partial.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        partial.replace(path)
+
+
+METRICS = MetricsRegistry()
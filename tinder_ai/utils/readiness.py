@@ -0,0 +1,285 @@
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from tinder_ai.utils import clock
+from tinder_ai.utils.metrics import METRICS
+
+from contextlib import contextmanager
+from logging import getLogger
+from typing import Iterable, Iterator, List, Optional, Tuple
+import weakref
+
+
+logger = getLogger(__name__)
+
+# Chromedriver's default script timeout, the in-page timer
+# has to resolve before it to report a clean miss.
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+# Last read script timeout per browser, so a short wait does not pay a
+# round trip to read it. Only decides whether a wait needs a longer
+# timeout, the value restored afterwards is always read fresh.
+_script_timeouts: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+# Resolves with the first node matching the XPath as soon as it exists,
+# driven by a MutationObserver instead of WebDriver polling.
+#
+# arguments[0]: XPath
+# arguments[1]: timeout in milliseconds
+# arguments[2]: require the node to be rendered (visible)
+# arguments[3]: substring the page URL must contain, or null
+WAIT_FOR_ELEMENT_SCRIPT = """
+const [xpath, timeoutMs, visible, urlContains] = arguments;
+const done = arguments[arguments.length - 1];
+
+const find = () => {
+    if (urlContains && !window.location.href.includes(urlContains)) {
+        return null;
+    }
+    const node = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    if (!node) {
+        return null;
+    }
+    if (visible && !(
+        node.offsetWidth || node.offsetHeight || node.getClientRects().length
+    )) {
+        return null;
+    }
+    return node;
+};
+
+const found = find();
+if (found) {
+    done(found);
+} else {
+    let observer = null;
+    let interval = null;
+    let timer = null;
+    const finish = (node) => {
+        observer.disconnect();
+        clearInterval(interval);
+        clearTimeout(timer);
+        done(node);
+    };
+    const check = () => {
+        const node = find();
+        if (node) {
+            finish(node);
+        }
+    };
+    observer = new MutationObserver(check);
+    observer.observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true
+    });
+    // Client side route changes do not always mutate the DOM.
+    interval = setInterval(check, 50);
+    timer = setTimeout(() => finish(null), timeoutMs);
+}
+"""
+
+# Resolves with [index, node] for the first XPath in the list that has
+# a node, as soon as one does, e.g. to tell which of several pages
+# or dialogs rendered. Earlier XPaths win when several match.
+#
+# arguments[0]: list of XPaths
+# arguments[1]: timeout in milliseconds
+WAIT_FOR_ANY_SCRIPT = """
+const [xpaths, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+
+const find = () => {
+    for (let i = 0; i < xpaths.length; i++) {
+        const node = document.evaluate(
+            xpaths[i], document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+        if (node) {
+            return [i, node];
+        }
+    }
+    return null;
+};
+
+const found = find();
+if (found) {
+    done(found);
+} else {
+    let observer = null;
+    let timer = null;
+    const finish = (hit) => {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(hit);
+    };
+    observer = new MutationObserver(() => {
+        const hit = find();
+        if (hit) {
+            finish(hit);
+        }
+    });
+    observer.observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true
+    });
+    timer = setTimeout(() => finish(null), timeoutMs);
+}
+"""
+
+
+def wait_for_element(
+    browser,
+    xpath: str,
+    timeout: float,
+    visible: bool = False,
+    url_contains: Optional[str] = None
+):
+    """
+    Wait until an element matching `xpath` exists and return it.
+
+    The wait runs in-page through `execute_async_script`, so it resolves
+    the moment the element is inserted instead of on the next poll.
+    If the script cannot run (e.g. the page navigates while waiting),
+    it falls back to a regular `WebDriverWait` for the remaining time.
+
+    :param browser: Chrome instance.
+    :param xpath: Absolute XPath of the awaited element.
+    :param timeout: Maximum wait time in seconds.
+    :param visible: Also require the element to be rendered.
+    :param url_contains: Also require the URL to contain this string.
+    :raises TimeoutException: If the element did not appear in time.
+    """
+    deadline = clock.monotonic() + timeout
+    try:
+        with _script_timeout(browser, timeout):
+            element = browser.execute_async_script(
+                WAIT_FOR_ELEMENT_SCRIPT,
+                xpath, int(timeout * 1000), visible, url_contains
+            )
+    except WebDriverException as e:
+        logger.debug(f"In-page wait failed, polling instead: {e}")
+        return _poll_for_element(
+            browser, xpath, _remaining(deadline), visible, url_contains
+        )
+
+    if element is None:
+        METRICS.inc('timeouts')
+        raise TimeoutException(
+            f"Element {xpath!r} did not appear within {timeout}s"
+        )
+    return element
+
+
+def wait_for_any(
+    browser,
+    xpaths: List[str],
+    timeout: float
+) -> Tuple[int, object]:
+    """
+    Wait until any of `xpaths` matches and return its index and element.
+
+    Like `wait_for_element`, the wait runs in-page and answers in a
+    single round trip, falling back to polling if the script cannot run.
+
+    :raises TimeoutException: If none matched in time.
+    """
+    deadline = clock.monotonic() + timeout
+    try:
+        with _script_timeout(browser, timeout):
+            hit = browser.execute_async_script(
+                WAIT_FOR_ANY_SCRIPT, list(xpaths), int(timeout * 1000)
+            )
+    except WebDriverException as e:
+        logger.debug(f"In-page wait failed, polling instead: {e}")
+        hit = _poll_for_any(browser, xpaths, _remaining(deadline))
+
+    if not hit:
+        METRICS.inc('timeouts')
+        raise TimeoutException(
+            f"None of {len(xpaths)} elements appeared within {timeout}s"
+        )
+    index, element = hit
+    return index, element
+
+
+def wait_for_new_window(
+    browser,
+    known_handles: Iterable[str],
+    timeout: float
+) -> str:
+    """
+    Wait until a window not in `known_handles` opens and return its handle.
+
+    WebDriver does not push window events, so this polls the handle list
+    at a short interval and returns on the first new handle.
+
+    :raises TimeoutException: If no new window opened in time.
+    """
+    known = set(known_handles)
+    return WebDriverWait(browser, timeout, poll_frequency=0.05).until(
+        lambda driver: next(
+            (h for h in driver.window_handles if h not in known), False
+        )
+    )
+
+
+@contextmanager
+def _script_timeout(browser, timeout: float) -> Iterator[None]:
+    """
+    Let an in-page wait of `timeout` seconds outlast the browser's
+    script timeout, which may be shorter than `DEFAULT_SCRIPT_TIMEOUT`
+    (e.g. an attached Chrome), restoring it afterwards.
+    """
+    previous = _script_timeouts.get(browser)
+    if previous is None or timeout >= previous:
+        previous = _script_timeouts[browser] = browser.timeouts.script
+    if timeout < previous:
+        yield
+        return
+    browser.set_script_timeout(timeout + 1)
+    try:
+        yield
+    finally:
+        browser.set_script_timeout(previous)
+
+
+def _remaining(deadline: float) -> float:
+    """Seconds left until `deadline`, for the poll after a failed wait."""
+    return max(0.0, deadline - clock.monotonic())
+
+
+def _poll_for_element(
+    browser,
+    xpath: str,
+    timeout: float,
+    visible: bool,
+    url_contains: Optional[str]
+):
+    wait = WebDriverWait(browser, timeout)
+    condition = (
+        EC.visibility_of_element_located
+        if visible else EC.presence_of_element_located
+    )
+    try:
+        if url_contains:
+            wait.until(EC.url_contains(url_contains))
+        return wait.until(condition((By.XPATH, xpath)))
+    except TimeoutException:
+        METRICS.inc('timeouts')
+        raise
+
+
+def _poll_for_any(browser, xpaths: List[str], timeout: float):
+    def find(driver):
+        for index, xpath in enumerate(xpaths):
+            elements = driver.find_elements(By.XPATH, xpath)
+            if elements:
+                return index, elements[0]
+        return False
+
+    try:
+        return WebDriverWait(browser, timeout).until(find)
+    except TimeoutException:
+        return None
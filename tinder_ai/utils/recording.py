@@ -0,0 +1,122 @@
+from logging import getLogger
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+import gzip
+import json
+import threading
+
+
+logger = getLogger(__name__)
+
+RECORDING_FORMAT = "tinder-ai-recording"
+RECORDING_VERSION = 1
+
+
+def _strip_session(params: Optional[Dict]) -> Dict:
+    """Command parameters without the session id, which differs per run."""
+    return {
+        key: value for key, value in (params or {}).items()
+        if key != 'sessionId'
+    }
+
+
+class Recorder:
+    """
+    Records every WebDriver command a browser sends, with the raw
+    response chromedriver returned, for `testing.ReplayDriver`.
+
+    Recordings are gzipped JSON lines: a header with the browser's
+    capabilities, then one entry per command. Error responses are
+    recorded like any other, so replays raise the same exceptions.
+
+    Usage:
+        with Recorder(browser) as recorder:
+            ...
+        recorder.save("session.jsonl.gz")
+    """
+
+    def __init__(self, browser) -> None:
+        self.browser = browser
+        self._entries: List[str] = []
+        self._lock = threading.Lock()
+        self._original_execute = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def install(self) -> 'Recorder':
+        """Wrap the browser's command executor and start recording."""
+        if self._original_execute is not None:
+            return self
+        executor = self.browser.command_executor
+        original = executor.execute
+        recorder = self
+
+        def execute(command, params):
+            entry = {'command': command, 'params': _strip_session(params)}
+            try:
+                response = original(command, params)
+                entry['response'] = response
+                return response
+            except Exception as e:
+                entry['error'] = {'type': type(e).__name__, 'message': str(e)}
+                raise
+            finally:
+                # Serialized before returning, the driver unwraps
+                # elements in the response in place.
+                recorder._append(entry)
+
+        executor.execute = execute
+        self._original_execute = original
+        return self
+
+    def uninstall(self) -> None:
+        """Restore the original executor and stop recording."""
+        if self._original_execute is None:
+            return
+        self.browser.command_executor.execute = self._original_execute
+        self._original_execute = None
+
+    def __enter__(self) -> 'Recorder':
+        return self.install()
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self.uninstall()
+
+    def _append(self, entry: Dict) -> None:
+        line = json.dumps(entry, separators=(',', ':'), default=str)
+        with self._lock:
+            self._entries.append(line)
+
+    def save(self, path: Union[str, Path]) -> None:
+        header = {
+            'format': RECORDING_FORMAT,
+            'version': RECORDING_VERSION,
+            'capabilities': getattr(self.browser, 'caps', None) or {},
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            entries = list(self._entries)
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(json.dumps(header, separators=(',', ':')) + "\n")
+            for line in entries:
+                f.write(line + "\n")
+        logger.info(f"Recorded {len(entries)} WebDriver commands to {path}")
+
+
+def load_recording(path: Union[str, Path]) -> Tuple[Dict, Iterator[Dict]]:
+    """The header and entries of a recording written by `Recorder`."""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    if not lines:
+        raise ValueError(f"{path} is empty")
+    header = json.loads(lines[0])
+    if header.get('format') != RECORDING_FORMAT:
+        raise ValueError(f"{path} is not a WebDriver recording")
+    if header.get('version') != RECORDING_VERSION:
+        raise ValueError(
+            f"{path} has recording version {header.get('version')}, "
+            f"expected {RECORDING_VERSION}"
+        )
+    return header, (json.loads(line) for line in lines[1:] if line)
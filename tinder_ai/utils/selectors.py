@@ -0,0 +1,263 @@
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException
+)
+
+from tinder_ai.utils.metrics import METRICS
+
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Dict, List, Literal, Optional, Tuple
+import threading
+import time
+
+
+logger = getLogger(__name__)
+
+Candidate = Tuple[str, str]
+Condition = Literal['presence', 'visible', 'clickable', 'all']
+
+CONDITIONS = {
+    'presence': EC.presence_of_element_located,
+    'visible': EC.visibility_of_element_located,
+    'clickable': EC.element_to_be_clickable,
+    'all': EC.presence_of_all_elements_located,
+}
+
+
+@dataclass(frozen=True)
+class Locator:
+    """
+    A logical locator with an ordered fallback chain.
+
+    Candidate values may contain `str.format` placeholders,
+    e.g. "a[href*='{item_id}']", filled in at lookup time.
+    """
+    name: str
+    candidates: Tuple[Candidate, ...]
+
+    @property
+    def primary(self) -> Candidate:
+        return self.candidates[0]
+
+    def resolve(self, **params) -> List[Candidate]:
+        if not params:
+            return list(self.candidates)
+        return [(by, value.format(**params)) for by, value in self.candidates]
+
+
+@dataclass
+class LocatorStats:
+    """Lookup statistics of a single locator."""
+    lookups: int = 0
+    misses: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    matched: Counter = field(default_factory=Counter)
+
+    @property
+    def miss_rate(self) -> float:
+        return self.misses / self.lookups if self.lookups else 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.lookups if self.lookups else 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            'lookups': self.lookups,
+            'misses': self.misses,
+            'miss_rate': self.miss_rate,
+            'mean_seconds': self.mean_seconds,
+            'max_seconds': self.max_seconds,
+            # candidate index -> times it was the one that matched
+            'matched': dict(self.matched),
+        }
+
+
+class SelectorRegistry:
+    """
+    Central registry every service resolves its locators through.
+
+    Each lookup records its latency, whether it missed and which
+    candidate of the fallback chain matched. All candidates are tried
+    within a single wait, so a dead fallback costs one extra lookup per
+    poll instead of a full timeout.
+    """
+
+    def __init__(self) -> None:
+        self._locators: Dict[str, Locator] = {}
+        self._stats: Dict[str, LocatorStats] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, *candidates: Candidate) -> Locator:
+        """
+        Register a locator.
+
+        :param name: Unique dotted name, e.g. 'session.like_button'.
+        :param candidates: (By, value) pairs, in fallback order.
+        """
+        if not candidates:
+            raise ValueError(f"Locator '{name}' needs at least one candidate")
+        if name in self._locators:
+            raise ValueError(f"Locator '{name}' already registered")
+        locator = Locator(name=name, candidates=tuple(candidates))
+        self._locators[name] = locator
+        return locator
+
+    def get(self, name: str) -> Locator:
+        try:
+            return self._locators[name]
+        except KeyError:
+            raise KeyError(f"Unknown locator: '{name}'") from None
+
+    def xpath(self, name: str, **params) -> str:
+        """The primary candidate of an XPath locator, for in-page scripts."""
+        by, value = self.get(name).resolve(**params)[0]
+        if by != By.XPATH:
+            raise ValueError(f"Locator '{name}' is not an XPath locator")
+        return value
+
+    def names(self) -> List[str]:
+        return list(self._locators)
+
+    def find(
+        self,
+        driver,
+        name: str,
+        timeout: float = 0,
+        condition: Condition = 'presence',
+        **params
+    ):
+        """
+        Resolve a locator to an element (or a list for condition='all').
+
+        :param driver: A WebDriver, or a WebElement to search within.
+        :param name: Registered locator name.
+        :param timeout: Seconds to wait, 0 looks up once without waiting.
+        :param condition: What the element has to satisfy.
+        :param params: Values for placeholders in the candidates.
+        :raises NoSuchElementException: If nothing matched (timeout=0).
+        :raises TimeoutException: If nothing matched in time.
+        """
+        candidates = self.get(name).resolve(**params)
+        factory = CONDITIONS[condition]
+        matched = {}
+
+        def any_candidate(target):
+            for index, candidate in enumerate(candidates):
+                try:
+                    result = factory(candidate)(target)
+                except (
+                    NoSuchElementException,
+                    StaleElementReferenceException
+                ):
+                    continue
+                if result:
+                    matched['index'] = index
+                    return result
+            return False
+
+        start = time.perf_counter()
+        try:
+            if timeout:
+                result = WebDriverWait(driver, timeout).until(
+                    any_candidate,
+                    f"Locator '{name}' did not match within {timeout}s"
+                )
+            else:
+                result = any_candidate(driver)
+                if not result:
+                    raise NoSuchElementException(
+                        f"Unable to locate '{name}': {candidates}"
+                    )
+        except TimeoutException:
+            METRICS.inc('timeouts')
+            self._record(name, time.perf_counter() - start, None)
+            raise
+        except NoSuchElementException:
+            self._record(name, time.perf_counter() - start, None)
+            raise
+
+        self._record(name, time.perf_counter() - start, matched['index'])
+        return result
+
+    def find_all(self, driver, name: str, **params) -> list:
+        """
+        Resolve a locator to all matching elements without waiting.
+        The first candidate with any match wins, an empty result
+        counts as a miss.
+        """
+        start = time.perf_counter()
+        for index, (by, value) in enumerate(
+            self.get(name).resolve(**params)
+        ):
+            elements = driver.find_elements(by, value)
+            if elements:
+                self._record(name, time.perf_counter() - start, index)
+                return elements
+        self._record(name, time.perf_counter() - start, None)
+        return []
+
+    @contextmanager
+    def timed(self, name: str):
+        """
+        Record a lookup of `name` done outside the registry,
+        e.g. by an in-page wait. Raising counts as a miss.
+        """
+        self.get(name)
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self._record(name, time.perf_counter() - start, None)
+            raise
+        self._record(name, time.perf_counter() - start, 0)
+
+    def stats(self) -> Dict[str, LocatorStats]:
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def report(self) -> str:
+        """A table of all used locators, slowest mean latency first."""
+        rows = sorted(
+            self.stats().items(),
+            key=lambda item: item[1].mean_seconds,
+            reverse=True
+        )
+        lines = [
+            f"{'locator':<36} {'lookups':>7} {'miss %':>7} "
+            f"{'mean ms':>9} {'max ms':>9}  matched"
+        ]
+        for name, stats in rows:
+            lines.append(
+                f"{name:<36} {stats.lookups:>7} "
+                f"{stats.miss_rate * 100:>7.1f} "
+                f"{stats.mean_seconds * 1000:>9.1f} "
+                f"{stats.max_seconds * 1000:>9.1f}  "
+                f"{dict(stats.matched)}"
+            )
+        return "\n".join(lines)
+
+    def _record(
+        self, name: str, seconds: float, index: Optional[int]
+    ) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(name, LocatorStats())
+            stats.lookups += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            if index is None:
+                stats.misses += 1
+            else:
+                stats.matched[index] += 1
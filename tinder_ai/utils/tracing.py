@@ -0,0 +1,292 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from logging import getLogger
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+import json
+import os
+import threading
+import time
+
+
+logger = getLogger(__name__)
+
+# Installed tracers, operations are only recorded while there is one.
+_TRACERS: List['Tracer'] = []
+_local = threading.local()
+
+SCRIPT_PREVIEW_LENGTH = 80
+
+
+@dataclass
+class Span:
+    """
+    A traced operation or a single WebDriver command.
+
+    Attributes:
+        name: Operation name, or the WebDriver command, e.g. 'findElement'.
+        category: 'operation' or 'command'.
+        start: perf_counter() at the start.
+        end: perf_counter() at the end, None while running.
+        thread: Name of the thread that ran it.
+        args: Locator, script preview and outcome of a command.
+        children: Nested operations and commands.
+    """
+    name: str
+    category: str
+    start: float
+    end: Optional[float] = None
+    thread: str = ""
+    args: Dict = field(default_factory=dict)
+    children: List['Span'] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return (self.end or time.perf_counter()) - self.start
+
+    @property
+    def round_trips(self) -> int:
+        """WebDriver commands sent within this span."""
+        if self.category == 'command':
+            return 1
+        return sum(child.round_trips for child in self.children)
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+def _stack() -> List[Span]:
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+@contextmanager
+def operation(name: str):
+    """
+    Attribute all WebDriver commands sent within the block to `name`.
+    Does nothing unless a `Tracer` is installed.
+    """
+    if not _TRACERS:
+        yield
+        return
+
+    span = Span(
+        name=name,
+        category='operation',
+        start=time.perf_counter(),
+        thread=threading.current_thread().name
+    )
+    stack = _stack()
+    parent = stack[-1] if stack else None
+    stack.append(span)
+    try:
+        yield span
+    finally:
+        span.end = time.perf_counter()
+        stack.pop()
+        if parent is not None:
+            parent.children.append(span)
+        else:
+            for tracer in list(_TRACERS):
+                tracer.add_root(span)
+
+
+def traced(name: Optional[str] = None):
+    """
+    Decorator form of `operation`, named after the function
+    (e.g. 'Session._swipe_once') unless `name` is given.
+    """
+    def decorator(function):
+        span_name = name or function.__qualname__
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with operation(span_name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _describe(command: str, params: Optional[Dict]) -> Dict:
+    """The interesting parameters of a WebDriver command."""
+    params = params or {}
+    if 'using' in params:
+        return {'using': params['using'], 'value': params.get('value')}
+    if 'script' in params:
+        preview = " ".join(params['script'].split())
+        return {'script': preview[:SCRIPT_PREVIEW_LENGTH]}
+    if 'url' in params:
+        return {'url': params['url']}
+    if 'cmd' in params:
+        # execute_cdp_cmd
+        return {'cdp': params['cmd']}
+    return {}
+
+
+class Tracer:
+    """
+    Records every WebDriver command a browser sends as a span.
+
+    Commands are attributed to the innermost enclosing `operation`
+    (or `traced` function) of the calling thread, so the span tree shows
+    how many chromedriver round trips and how much time each high level
+    operation costs. Commands outside any operation become root spans.
+
+    Usage:
+        tracer = Tracer(browser).install()
+        ...
+        tracer.export_chrome_trace("trace.json")
+        tracer.uninstall()
+    """
+
+    def __init__(self, browser) -> None:
+        self.browser = browser
+        self.roots: List[Span] = []
+        self._lock = threading.Lock()
+        self._original_execute = None
+        self._epoch = time.perf_counter()
+
+    def install(self) -> 'Tracer':
+        """Wrap the browser's command executor and start recording."""
+        if self._original_execute is not None:
+            return self
+        executor = self.browser.command_executor
+        original = executor.execute
+        tracer = self
+
+        def execute(command, params):
+            span = Span(
+                name=command,
+                category='command',
+                start=time.perf_counter(),
+                thread=threading.current_thread().name,
+                args=_describe(command, params)
+            )
+            try:
+                response = original(command, params)
+                span.args['outcome'] = 'ok'
+                return response
+            except Exception as e:
+                span.args['outcome'] = type(e).__name__
+                raise
+            finally:
+                span.end = time.perf_counter()
+                tracer._attach(span)
+
+        executor.execute = execute
+        self._original_execute = original
+        _TRACERS.append(self)
+        return self
+
+    def uninstall(self) -> None:
+        """Restore the original executor and stop recording."""
+        if self._original_execute is None:
+            return
+        self.browser.command_executor.execute = self._original_execute
+        self._original_execute = None
+        if self in _TRACERS:
+            _TRACERS.remove(self)
+
+    def __enter__(self) -> 'Tracer':
+        return self.install()
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self.uninstall()
+
+    def add_root(self, span: Span) -> None:
+        with self._lock:
+            self.roots.append(span)
+
+    def _attach(self, span: Span) -> None:
+        stack = _stack()
+        if stack:
+            stack[-1].children.append(span)
+        else:
+            self.add_root(span)
+
+    def spans(self):
+        with self._lock:
+            roots = list(self.roots)
+        for root in roots:
+            yield from root.walk()
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        Per operation name: calls, round trips and seconds, including
+        nested operations.
+        """
+        totals = defaultdict(
+            lambda: {'calls': 0, 'round_trips': 0, 'seconds': 0.0}
+        )
+        for span in self.spans():
+            if span.category != 'operation':
+                continue
+            entry = totals[span.name]
+            entry['calls'] += 1
+            entry['round_trips'] += span.round_trips
+            entry['seconds'] += span.duration
+        return dict(totals)
+
+    def report(self) -> str:
+        """A table of all operations, most round trips first."""
+        rows = sorted(
+            self.summary().items(),
+            key=lambda item: item[1]['round_trips'],
+            reverse=True
+        )
+        lines = [
+            f"{'operation':<40} {'calls':>6} {'trips':>7} "
+            f"{'trips/call':>10} {'seconds':>9}"
+        ]
+        for name, entry in rows:
+            lines.append(
+                f"{name:<40} {entry['calls']:>6} "
+                f"{entry['round_trips']:>7} "
+                f"{entry['round_trips'] / entry['calls']:>10.1f} "
+                f"{entry['seconds']:>9.2f}"
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict:
+        """
+        The span tree in the Chrome trace event format, viewable in
+        chrome://tracing or https://ui.perfetto.dev.
+        """
+        pid = os.getpid()
+        events = []
+        threads: Dict[str, int] = {}
+        for span in self.spans():
+            if span.thread not in threads:
+                threads[span.thread] = len(threads) + 1
+                events.append({
+                    'name': 'thread_name',
+                    'ph': 'M',
+                    'pid': pid,
+                    'tid': threads[span.thread],
+                    'args': {'name': span.thread},
+                })
+            args = dict(span.args)
+            if span.category == 'operation':
+                args['round_trips'] = span.round_trips
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': (span.start - self._epoch) * 1e6,
+                'dur': span.duration * 1e6,
+                'pid': pid,
+                'tid': threads[span.thread],
+                'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()), encoding='utf-8')
+        logger.info(f"Wrote WebDriver trace to {path}")
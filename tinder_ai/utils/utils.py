@@ -1,5 +1,5 @@
+from tinder_ai.utils import clock
 import random
-import time
 
 
 MIN_SLEEP = 1.1
@@ -20,8 +20,8 @@ def random_sleep(
 ) -> float:
     """
     Sleep for a random duration between MIN_SLEEP and MAX_SLEEP
-    and return the sleep time
+    on the current clock and return the sleep time
     """
     sleep_time = random.uniform(min_sleep, max_sleep)
-    time.sleep(sleep_time)
+    clock.sleep(sleep_time)
     return sleep_time